@@ -0,0 +1,49 @@
+'''
+설정 / 공유 리소스 초기화
+
+- .env는 이 모듈을 처음 import할 때 한 번 읽음
+  (각 모듈의 튜닝 값은 import 시점에 환경 변수를 읽는 상수이므로 가장 먼저 import해야 함)
+- 필수 설정(SECRET_KEY 등)은 처음 사용할 때 읽고, 앱 시작시 validate로 확인
+- DB 엔진, 메일 템플릿, 업로드 디렉토리 등 비용이 드는 리소스는 import 시점에 만들지 않고
+  lifespan(startup)에서 준비
+'''
+import os
+from functools import cached_property
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class Settings:
+    '''
+    필수 설정 (처음 접근할 때 환경 변수에서 읽고 이후에는 같은 값 사용)
+    '''
+    @cached_property
+    def secret_key(self) -> str:
+        secret_key = os.getenv("SECRET_KEY")
+        if not secret_key:
+            raise ValueError("SECRET_KEY is not set in environment variables.")
+        return secret_key
+
+    def validate(self):
+        '''
+        앱 시작시 필수 설정 확인 (첫 요청이 아닌 startup에서 실패하도록)
+        '''
+        self.secret_key
+
+
+settings = Settings()
+
+
+async def startup():
+    '''
+    앱 시작시 리소스 준비 (lifespan에서 호출)
+    '''
+    from .database import open_engine
+    from .utils.email import load_templates
+    from .utils.files import ensure_upload_dirs
+
+    settings.validate()
+    ensure_upload_dirs()
+    load_templates()
+    await open_engine()
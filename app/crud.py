@@ -1,15 +1,76 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, case, and_, or_, text, func
+from sqlalchemy.dialects.mysql import match, insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from typing import Awaitable, Callable, Optional
 from . import models, schema
-from .utils.security import hash_password
+from .utils.security import hash_password_async, hash_passwords_async
+from .utils.pagination import encode_cursor
+from .utils.bulk import BULK_CHUNK_SIZE
+from .utils import cache, search
+
+def _keyset_page(rows, limit: int):
+    '''
+    limit+1건 조회 결과를 (현재 페이지, 다음 커서)로 변환
+    '''
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(id=rows[-1].id)
+    return rows, None
+
+# 목록 조회는 응답에 필요한 컬럼만 조회 (ORM 객체 생성 없이 Row로 반환)
+USER_COLUMNS = (models.User.id, models.User.name, models.User.email, models.User.is_active)
+POST_COLUMNS = (models.Post.id, models.Post.title, models.Post.description, models.Post.owner_id)
+
+async def _update_returning(db: AsyncSession, model, condition, values: dict, *columns):
+    '''
+    UPDATE ... WHERE 한 문장으로 수정 후 수정된 행의 columns 반환 (대상이 없으면 None)
+    UPDATE ... RETURNING을 지원하지 않는 MySQL은 같은 트랜잭션에서 다시 조회
+    (MySQL 드라이버는 CLIENT_FOUND_ROWS로 연결되므로 값이 그대로여도 rowcount는 일치한 행 수)
+    '''
+    stmt = update(model).where(condition).values(**values).execution_options(synchronize_session=False)
+    if db.get_bind().dialect.update_returning:
+        result = await db.execute(stmt.returning(*columns))
+        return result.first()
+    result = await db.execute(stmt)
+    if not result.rowcount:
+        return None
+    result = await db.execute(select(*columns).where(condition))
+    return result.first()
+
+async def _delete_returning(db: AsyncSession, model, condition, column) -> list:
+    '''
+    DELETE ... WHERE 실행 후 삭제된 행의 column 값 목록 반환
+    DELETE ... RETURNING을 지원하지 않는 MySQL은 잠금 조회 후 삭제
+    '''
+    stmt = delete(model).where(condition).execution_options(synchronize_session=False)
+    if db.get_bind().dialect.delete_returning:
+        result = await db.execute(stmt.returning(column))
+        return list(result.scalars().all())
+    result = await db.execute(select(column).where(condition).with_for_update())
+    values = list(result.scalars().all())
+    if values:
+        await db.execute(stmt)
+    return values
 
 ############################ USER ############################
 async def get_users(db: AsyncSession, skip:int=0, limit:int=50):
     '''
     모든 사용자 정보 조회(페이징 처리)
     '''
-    result = await db.execute(select(models.User).offset(skip).limit(limit))
-    return result.scalars().all()
+    result = await db.execute(select(*USER_COLUMNS).order_by(models.User.id).offset(skip).limit(limit))
+    return result.all()
+
+async def get_users_after(db: AsyncSession, after_id:int=0, limit:int=50):
+    '''
+    커서 기반 사용자 조회(id > after_id)
+    다음 페이지 존재 여부 확인을 위해 limit+1건 조회
+    '''
+    result = await db.execute(
+        select(*USER_COLUMNS).where(models.User.id > after_id).order_by(models.User.id).limit(limit + 1)
+    )
+    users = result.all()
+    return _keyset_page(users, limit)
 
 async def get_user(db: AsyncSession, user_id: int):
     '''
@@ -25,46 +86,136 @@ async def get_user_by_email(db: AsyncSession, email: str):
     result = await db.execute(select(models.User).where(models.User.email == email))
     return result.scalars().first()
 
+async def get_user_cached(db: AsyncSession, user_id: int):
+    '''
+    특정 사용자 조회(캐시 우선)
+    '''
+    return await cache.read_through(cache.user_key(user_id), schema.User, lambda: get_user(db, user_id))
+
+async def get_user_by_email_cached(db: AsyncSession, email: str):
+    '''
+    이메일로 사용자 조회(캐시 우선)
+    비밀번호 해시는 캐시하지 않으므로 로그인/비밀번호 변경에는 get_user_by_email 사용
+    '''
+    return await cache.read_through(cache.user_email_key(email), schema.User, lambda: get_user_by_email(db, email))
+
 
 async def create_user(db: AsyncSession, user:schema.UserCreate):
     '''
     신규 사용자 추가
+    INSERT 한 번으로 처리하고 생성된 기본키만 받아 응답 구성 (commit 후 재조회 없음)
     '''
-    hashed_pw = hash_password(user.password)
-    db_user = models.User(
-        name=user.name,
-        email=user.email,
-        hashed_pw=hashed_pw,
+    hashed_pw = await hash_password_async(user.password)
+    result = await db.execute(
+        insert(models.User).values(name=user.name, email=user.email, hashed_pw=hashed_pw, is_active=False)
     )
-    db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
-    return db_user
+    await cache.bump(cache.USERS)
+    return schema.User(id=result.inserted_primary_key[0], name=user.name, email=user.email, is_active=False)
 
-async def update_user(db: AsyncSession, user: models.User, updated_user: schema.UserCreate):
+async def update_user(db: AsyncSession, user_id: int, updated_user: schema.UserCreate):
     '''
-    사용자 정보 수정
+    사용자 정보 수정 (이름, 이메일), 사용자가 없으면 None
+    이메일 캐시 무효화를 위해 기존 이메일만 잠금 조회한 뒤 UPDATE 한 번으로 반영
     '''
-    for key, value in updated_user.model_dump().items():
-        setattr(user, key, value)
+    result = await db.execute(
+        select(models.User.email, models.User.is_active).where(models.User.id == user_id).with_for_update()
+    )
+    row = result.first()
+    if row is None:
+        return None
+
+    await db.execute(
+        update(models.User)
+        .where(models.User.id == user_id)
+        .values(name=updated_user.name, email=updated_user.email)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
-    await db.refresh(user)
-    return user
+    await cache.invalidate(
+        cache.user_key(user_id), cache.user_email_key(row.email), cache.user_email_key(updated_user.email)
+    )
+    await cache.bump(cache.USERS, cache.user_resource(user_id))
+    return schema.User(id=user_id, name=updated_user.name, email=updated_user.email, is_active=row.is_active)
 
-async def delete_user(db: AsyncSession, user: models.User):
+async def delete_user(db: AsyncSession, user_id: int) -> bool:
     '''
-    사용자 제거
+    사용자 제거, 사용자가 없으면 False
+    작성한 게시물은 DB의 ON DELETE CASCADE로 함께 삭제됨 (캐시 무효화를 위해 id만 조회)
     '''
-    db.delete(user)
+    result = await db.execute(select(models.Post.id).where(models.Post.owner_id == user_id))
+    post_ids = result.scalars().all()
+    emails = await _delete_returning(db, models.User, models.User.id == user_id, models.User.email)
+    if not emails:
+        await db.rollback()
+        return False
     await db.commit()
+    search.unindex_posts(*post_ids)
+    # 함께 삭제되는 게시물 캐시까지 무효화
+    await cache.invalidate(
+        cache.user_key(user_id),
+        cache.user_email_key(emails[0]),
+        *(cache.post_key(post_id) for post_id in post_ids),
+    )
+    await cache.bump(cache.USERS, cache.user_resource(user_id), cache.POSTS)
+    return True
 
 ############################ POST ############################
 async def get_posts(db: AsyncSession, skip:int=0, limit: int=50):
     '''
     모든 게시물 조회(페이징 처리)
     '''
-    result = await db.execute(select(models.Post).offset(skip).limit(limit))
-    return result.scalars().all()
+    result = await db.execute(select(*POST_COLUMNS).order_by(models.Post.id).offset(skip).limit(limit))
+    return result.all()
+
+async def get_posts_after(db: AsyncSession, after_id:int=0, limit:int=50):
+    '''
+    커서 기반 게시물 조회(id > after_id)
+    다음 페이지 존재 여부 확인을 위해 limit+1건 조회
+    '''
+    result = await db.execute(
+        select(*POST_COLUMNS).where(models.Post.id > after_id).order_by(models.Post.id).limit(limit + 1)
+    )
+    posts = result.all()
+    return _keyset_page(posts, limit)
+
+async def get_posts_by_owners(db: AsyncSession, owner_ids: list[int], per_owner: int) -> dict[int, list]:
+    '''
+    여러 사용자의 게시물을 IN 쿼리 한 번으로 조회 (사용자 id → 게시물 목록)
+    사용자마다 id 순으로 최대 per_owner개 (게시물이 많은 사용자 때문에 응답이 커지지 않도록 ROW_NUMBER로 제한)
+    '''
+    grouped = {owner_id: [] for owner_id in owner_ids}
+    if not owner_ids:
+        return grouped
+    ranked = (
+        select(
+            *POST_COLUMNS,
+            func.row_number().over(partition_by=models.Post.owner_id, order_by=models.Post.id).label("rank"),
+        )
+        .where(models.Post.owner_id.in_(owner_ids))
+        .subquery()
+    )
+    result = await db.execute(
+        select(*(ranked.c[column.key] for column in POST_COLUMNS))
+        .where(ranked.c.rank <= per_owner)
+        .order_by(ranked.c.owner_id, ranked.c.id)
+    )
+    for post in result.all():
+        grouped[post.owner_id].append(post)
+    return grouped
+
+async def get_user_posts_after(db: AsyncSession, user_id: int, after_id: int = 0, limit: int = 50):
+    '''
+    특정 사용자의 게시물 커서 기반 조회 (ix_posts_owner_id 사용)
+    '''
+    result = await db.execute(
+        select(*POST_COLUMNS)
+        .where(models.Post.owner_id == user_id, models.Post.id > after_id)
+        .order_by(models.Post.id)
+        .limit(limit + 1)
+    )
+    posts = result.all()
+    return _keyset_page(posts, limit)
 
 async def get_post(db: AsyncSession, post_id: int):
     '''
@@ -73,42 +224,569 @@ async def get_post(db: AsyncSession, post_id: int):
     result = await db.execute(select(models.Post).where(models.Post.id == post_id))
     return result.scalars().first()
 
+async def get_post_cached(db: AsyncSession, post_id: int):
+    '''
+    특정 게시물 조회(캐시 우선)
+    '''
+    return await cache.read_through(cache.post_key(post_id), schema.Post, lambda: get_post(db, post_id))
 
 async def create_user_post(db:AsyncSession, post:schema.PostCreate, user_id : int):
     '''
     특정 사용자의 게시물 생성
+    사용자가 없으면 외래키 위반으로 IntegrityError
     '''
-    db_post = models.Post(**post.model_dump(), owner_id=user_id )
-    db.add(db_post)
+    result = await db.execute(insert(models.Post).values(**post.model_dump(), owner_id=user_id))
+    await db.commit()
+    post_id = result.inserted_primary_key[0]
+    search.index_post(post_id, post.title, post.description)
+    await cache.bump(cache.POSTS)
+    return schema.Post(id=post_id, owner_id=user_id, **post.model_dump())
 
+async def update_post(db: AsyncSession, post_id: int, updated_post: schema.PostCreate):
+    '''
+    게시물 수정, 게시물이 없으면 None
+    '''
+    row = await _update_returning(
+        db, models.Post, models.Post.id == post_id, updated_post.model_dump(), models.Post.owner_id
+    )
+    if row is None:
+        return None
     await db.commit()
-    await db.refresh(db_post)
-    return db_post
+    search.index_post(post_id, updated_post.title, updated_post.description)
+    await cache.invalidate(cache.post_key(post_id))
+    await cache.bump(cache.POSTS)
+    return schema.Post(id=post_id, owner_id=row.owner_id, **updated_post.model_dump())
 
-async def update_post(db: AsyncSession, post: models.Post, updated_post: schema.PostCreate):
+async def delete_post(db: AsyncSession, post_id: int) -> bool:
     '''
-    게시물 수정
+    게시물 삭제, 게시물이 없으면 False
     '''
-    for key, value in updated_post.model_dump().items():
-        setattr(post, key, value)
-    
+    result = await db.execute(
+        delete(models.Post).where(models.Post.id == post_id).execution_options(synchronize_session=False)
+    )
     await db.commit()
-    await db.refresh(post)
-    return post
+    if not result.rowcount:
+        return False
+    search.unindex_posts(post_id)
+    await cache.invalidate(cache.post_key(post_id))
+    await cache.bump(cache.POSTS)
+    return True
+
+async def search_posts(db: AsyncSession, q: str, limit: int = 20, after: Optional[tuple[float, int]] = None):
+    '''
+    게시물 검색 → ([(게시물, 점수)], 다음 커서)
+    점수 내림차순, 같은 점수는 id 내림차순 (커서는 마지막 항목의 점수와 id)
+    '''
+    if search.SEARCH_BACKEND == "memory":
+        hits = await search.post_index.search_async(q, limit + 1, after)
+        result = await db.execute(select(models.Post).where(models.Post.id.in_([post_id for _, post_id in hits])))
+        posts = {post.id: post for post in result.scalars().all()}
+        # 색인이 아직 반영하지 못한 삭제 게시물은 제외
+        rows = [(posts[post_id], score) for score, post_id in hits if post_id in posts]
+    else:
+        score = match(models.Post.title, models.Post.description, against=q).in_natural_language_mode()
+        stmt = select(models.Post, score.label("score")).where(score > 0)
+        if after is not None:
+            last_score, last_id = after
+            stmt = stmt.where(or_(score < last_score, and_(score == last_score, models.Post.id < last_id)))
+        result = await db.execute(stmt.order_by(score.desc(), models.Post.id.desc()).limit(limit + 1))
+        rows = [(post, float(post_score)) for post, post_score in result.all()]
+
+    if len(rows) > limit:
+        rows = rows[:limit]
+        post, post_score = rows[-1]
+        return rows, encode_cursor(score=post_score, id=post.id)
+    return rows, None
+
+SEARCH_LOAD_CHUNK = 5000
+
+async def get_post_search_documents(db: AsyncSession, after_id: int = 0, limit: int = SEARCH_LOAD_CHUNK):
+    '''
+    검색 색인 구성용 (id, 제목, 내용) 조회 (id > after_id, id 순으로 limit건)
+    '''
+    result = await db.execute(
+        select(models.Post.id, models.Post.title, models.Post.description)
+        .where(models.Post.id > after_id)
+        .order_by(models.Post.id)
+        .limit(limit)
+    )
+    return result.all()
 
-async def delete_post(db: AsyncSession, post: models.Post):
+async def _reindex_posts(db: AsyncSession, post_ids):
     '''
-    게시물 삭제
+    일부 필드만 수정된 게시물을 검색 색인에 다시 반영 (memory 방식에서만 조회)
+    '''
+    if search.SEARCH_BACKEND != "memory" or not post_ids:
+        return
+    result = await db.execute(
+        select(models.Post.id, models.Post.title, models.Post.description).where(models.Post.id.in_(post_ids))
+    )
+    for post_id, title, description in result.all():
+        search.index_post(post_id, title, description)
+
+############################ BULK ############################
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+def _bulk_summary(results: list[schema.BulkItemResult]) -> schema.BulkResult:
+    results.sort(key=lambda r: r.index)
+    succeeded = sum(1 for r in results if r.status < 400)
+    return schema.BulkResult(succeeded=succeeded, failed=len(results) - succeeded, results=results)
+
+async def _autoinc_step(db: AsyncSession) -> Optional[int]:
+    '''
+    multi-row INSERT 한 문장의 auto-increment 값이 LAST_INSERT_ID()부터 일정한 간격으로 할당되는 경우 그 간격
+    innodb_autoinc_lock_mode=2 (MySQL 8 기본값)는 동시에 실행되는 INSERT와 값이 섞일 수 있으므로 None
+    (연결마다 한 번 조회)
+    '''
+    conn = await db.connection()
+    if "autoinc_step" not in conn.info:
+        result = await conn.execute(text("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode"))
+        increment, lock_mode = result.one()
+        conn.info["autoinc_step"] = int(increment) if int(lock_mode) != 2 else None
+    return conn.info["autoinc_step"]
+
+async def _insert_rows(db: AsyncSession, model, rows: list[dict], key=None) -> list[int]:
+    '''
+    여러 행을 INSERT 하고 생성된 id를 입력 순서대로 반환
+    RETURNING을 지원하면 key(unique 컬럼)와 id를 함께 받아 대응 (입력 순서를 보장하는 RETURNING은
+    SQLite 등에서 한 행씩 INSERT 하므로 key가 없을 때만 사용)
+    RETURNING을 지원하지 않는 MySQL은
+    - key(unique 컬럼)가 있으면 multi-row INSERT 후 key로 id 재조회
+    - auto-increment 값이 연속으로 할당되는 설정이면 multi-row INSERT 후 LAST_INSERT_ID()부터 계산
+    - 그 외에는 같은 트랜잭션에서 한 행씩 INSERT
+    '''
+    if db.get_bind().dialect.insert_returning:
+        if key is not None:
+            result = await db.execute(insert(model).returning(key, model.id), rows)
+            ids = dict(result.all())
+            return [ids[row[key.key]] for row in rows]
+        result = await db.execute(insert(model).returning(model.id, sort_by_parameter_order=True), rows)
+        return list(result.scalars().all())
+
+    if key is not None:
+        await db.execute(insert(model).values(rows))
+        values = [row[key.key] for row in rows]
+        result = await db.execute(select(key, model.id).where(key.in_(values)))
+        ids = dict(result.all())
+        return [ids[value] for value in values]
+
+    step = await _autoinc_step(db)
+    if step is not None:
+        result = await db.execute(insert(model).values(rows))
+        return list(range(result.lastrowid, result.lastrowid + len(rows) * step, step))
+
+    ids = []
+    for row in rows:
+        result = await db.execute(insert(model).values(row))
+        ids.append(result.lastrowid)
+    return ids
+
+def _case_values(model, items: list, fields: tuple[str, ...]) -> dict:
+    '''
+    항목별로 다른 값을 한 번의 UPDATE로 반영하기 위한 CASE id WHEN ... 식 생성
+    요청에 포함되지 않은 필드는 기존 값 유지
+    '''
+    values = {}
+    for field in fields:
+        whens = {item.id: getattr(item, field) for item in items if field in item.model_fields_set}
+        if whens:
+            values[field] = case(whens, value=model.id, else_=getattr(model, field))
+    return values
+
+async def bulk_create_posts(db: AsyncSession, posts: list[schema.PostBulkCreate], chunk_size: int = BULK_CHUNK_SIZE):
     '''
-    db.delete(post)
+    게시물 일괄 생성 (청크마다 작성자 확인 1회 + INSERT 1회, 전체를 하나의 트랜잭션으로 처리)
+    작성자가 없는 항목만 404로 실패 처리
+    '''
+    results = []
+    created = []
+    for start, chunk in _chunks(posts, chunk_size):
+        owner_ids = {post.owner_id for post in chunk}
+        result = await db.execute(select(models.User.id).where(models.User.id.in_(owner_ids)))
+        existing = set(result.scalars().all())
+
+        valid = []
+        for i, post in enumerate(chunk, start):
+            if post.owner_id in existing:
+                valid.append((i, post))
+            else:
+                results.append(schema.BulkItemResult(index=i, status=404, error="User not found"))
+        if not valid:
+            continue
+
+        ids = await _insert_rows(db, models.Post, [post.model_dump() for _, post in valid])
+        results += [schema.BulkItemResult(index=i, id=post_id, status=201) for (i, _), post_id in zip(valid, ids)]
+        created += [(post_id, post) for (_, post), post_id in zip(valid, ids)]
+
     await db.commit()
+    for post_id, post in created:
+        search.index_post(post_id, post.title, post.description)
+    if created:
+        await cache.bump(cache.POSTS)
+    return _bulk_summary(results)
+
+async def bulk_update_posts(db: AsyncSession, posts: list[schema.PostBulkUpdate], chunk_size: int = BULK_CHUNK_SIZE):
+    '''
+    게시물 일괄 수정 (청크마다 존재 확인 1회 + CASE UPDATE 1회)
+    수정할 필드가 없는 항목은 400, 요청 안에서 중복된 id는 처음 항목만 처리하고 나머지는 409
+    '''
+    results = []
+    updated_ids = set()
+    seen = set()
+    for start, chunk in _chunks(posts, chunk_size):
+        result = await db.execute(select(models.Post.id).where(models.Post.id.in_({post.id for post in chunk})))
+        existing = set(result.scalars().all())
+
+        valid = []
+        for i, post in enumerate(chunk, start):
+            if post.model_fields_set <= {"id"}:
+                results.append(schema.BulkItemResult(index=i, id=post.id, status=400, error="No fields to update"))
+            elif post.id in seen:
+                results.append(schema.BulkItemResult(index=i, id=post.id, status=409, error="Duplicate id in request"))
+            elif post.id in existing:
+                valid.append(post)
+                results.append(schema.BulkItemResult(index=i, id=post.id, status=200))
+            else:
+                results.append(schema.BulkItemResult(index=i, id=post.id, status=404, error="Post not found"))
+            seen.add(post.id)
+
+        values = _case_values(models.Post, valid, ("title", "description"))
+        if values:
+            await db.execute(
+                update(models.Post)
+                .where(models.Post.id.in_({post.id for post in valid}))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+        updated_ids.update(post.id for post in valid)
+
+    await db.commit()
+    await _reindex_posts(db, updated_ids)
+    await cache.invalidate(*(cache.post_key(post_id) for post_id in updated_ids))
+    if updated_ids:
+        await cache.bump(cache.POSTS)
+    return _bulk_summary(results)
+
+async def bulk_delete_posts(db: AsyncSession, post_ids: list[int], chunk_size: int = BULK_CHUNK_SIZE):
+    '''
+    게시물 일괄 삭제 (청크마다 DELETE ... WHERE id IN 1회)
+    요청 안에서 중복된 id는 처음 항목만 처리하고 나머지는 409
+    '''
+    results = []
+    deleted_ids = set()
+    seen = set()
+    for start, chunk in _chunks(post_ids, chunk_size):
+        result = await db.execute(select(models.Post.id).where(models.Post.id.in_(set(chunk) - seen)))
+        existing = set(result.scalars().all())
+        if existing:
+            await db.execute(
+                delete(models.Post).where(models.Post.id.in_(existing)).execution_options(synchronize_session=False)
+            )
+        deleted_ids |= existing
+        for i, post_id in enumerate(chunk, start):
+            if post_id in seen:
+                results.append(schema.BulkItemResult(index=i, id=post_id, status=409, error="Duplicate id in request"))
+            elif post_id in deleted_ids:
+                results.append(schema.BulkItemResult(index=i, id=post_id, status=200))
+            else:
+                results.append(schema.BulkItemResult(index=i, id=post_id, status=404, error="Post not found"))
+            seen.add(post_id)
+
+    await db.commit()
+    search.unindex_posts(*deleted_ids)
+    await cache.invalidate(*(cache.post_key(post_id) for post_id in deleted_ids))
+    if deleted_ids:
+        await cache.bump(cache.POSTS)
+    return _bulk_summary(results)
+
+async def bulk_create_users(db: AsyncSession, users: list[schema.UserCreate], chunk_size: int = BULK_CHUNK_SIZE):
+    '''
+    사용자 일괄 생성
+    이미 가입된 이메일이나 요청 안에서 중복된 이메일은 409로 실패 처리
+    비밀번호 해싱은 해시 풀에서 병렬로 처리
+    '''
+    results = []
+    seen = set()
+    for start, chunk in _chunks(users, chunk_size):
+        result = await db.execute(select(models.User.email).where(models.User.email.in_({user.email for user in chunk})))
+        registered = set(result.scalars().all())
+
+        valid = []
+        for i, user in enumerate(chunk, start):
+            if user.email in registered or user.email in seen:
+                results.append(schema.BulkItemResult(index=i, status=409, error="Email already registered"))
+            else:
+                seen.add(user.email)
+                valid.append((i, user))
+        if not valid:
+            continue
+
+        hashed = await hash_passwords_async([user.password for _, user in valid])
+        rows = [
+            {"name": user.name, "email": user.email, "hashed_pw": hashed_pw}
+            for (_, user), hashed_pw in zip(valid, hashed)
+        ]
+        ids = await _insert_rows(db, models.User, rows, key=models.User.email)
+        results += [schema.BulkItemResult(index=i, id=user_id, status=201) for (i, _), user_id in zip(valid, ids)]
+
+    await db.commit()
+    if seen:
+        await cache.bump(cache.USERS)
+    return _bulk_summary(results)
+
+async def bulk_update_users(db: AsyncSession, users: list[schema.UserBulkUpdate], chunk_size: int = BULK_CHUNK_SIZE):
+    '''
+    사용자 일괄 수정 (이름, 이메일)
+    다른 사용자가 사용 중인 이메일로 바꾸려는 항목은 409로 실패 처리
+    수정할 필드가 없는 항목은 400, 요청 안에서 중복된 id는 처음 항목만 처리하고 나머지는 409
+    '''
+    results = []
+    stale_keys = []
+    updated_ids = []
+    claimed = set()
+    seen = set()
+    for start, chunk in _chunks(users, chunk_size):
+        result = await db.execute(
+            select(models.User.id, models.User.email).where(models.User.id.in_({user.id for user in chunk}))
+        )
+        old_emails = dict(result.all())
+        new_emails = {user.email for user in chunk if user.email is not None}
+        result = await db.execute(
+            select(models.User.id, models.User.email).where(models.User.email.in_(new_emails))
+        )
+        email_owner = {email: user_id for user_id, email in result.all()}
+
+        valid = []
+        for i, user in enumerate(chunk, start):
+            if user.model_fields_set <= {"id"}:
+                results.append(schema.BulkItemResult(index=i, id=user.id, status=400, error="No fields to update"))
+            elif user.id in seen:
+                results.append(schema.BulkItemResult(index=i, id=user.id, status=409, error="Duplicate id in request"))
+            elif user.id not in old_emails:
+                results.append(schema.BulkItemResult(index=i, id=user.id, status=404, error="User not found"))
+            elif user.email is not None and (
+                email_owner.get(user.email, user.id) != user.id or user.email in claimed
+            ):
+                results.append(schema.BulkItemResult(index=i, id=user.id, status=409, error="Email already registered"))
+            else:
+                if user.email is not None:
+                    claimed.add(user.email)
+                    stale_keys.append(cache.user_email_key(user.email))
+                stale_keys += [cache.user_key(user.id), cache.user_email_key(old_emails[user.id])]
+                valid.append(user)
+                updated_ids.append(user.id)
+                results.append(schema.BulkItemResult(index=i, id=user.id, status=200))
+            seen.add(user.id)
+
+        values = _case_values(models.User, valid, ("name", "email"))
+        if values:
+            await db.execute(
+                update(models.User)
+                .where(models.User.id.in_({user.id for user in valid}))
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+    await db.commit()
+    await cache.invalidate(*stale_keys)
+    if updated_ids:
+        await cache.bump(cache.USERS, *(cache.user_resource(user_id) for user_id in updated_ids))
+    return _bulk_summary(results)
+
+async def bulk_delete_users(db: AsyncSession, user_ids: list[int], chunk_size: int = BULK_CHUNK_SIZE):
+    '''
+    사용자 일괄 삭제 (작성한 게시물은 ON DELETE CASCADE로 함께 삭제)
+    요청 안에서 중복된 id는 처음 항목만 처리하고 나머지는 409
+    '''
+    results = []
+    stale_keys = []
+    deleted_ids = set()
+    deleted_post_ids = []
+    seen = set()
+    for start, chunk in _chunks(user_ids, chunk_size):
+        result = await db.execute(
+            select(models.User.id, models.User.email).where(models.User.id.in_(set(chunk) - seen))
+        )
+        emails = dict(result.all())
+        if emails:
+            result = await db.execute(select(models.Post.id).where(models.Post.owner_id.in_(emails)))
+            post_ids = result.scalars().all()
+            deleted_post_ids += post_ids
+            stale_keys += [cache.post_key(post_id) for post_id in post_ids]
+            await db.execute(
+                delete(models.User).where(models.User.id.in_(emails)).execution_options(synchronize_session=False)
+            )
+            for user_id, email in emails.items():
+                stale_keys += [cache.user_key(user_id), cache.user_email_key(email)]
+        deleted_ids.update(emails)
+        for i, user_id in enumerate(chunk, start):
+            if user_id in seen:
+                results.append(schema.BulkItemResult(index=i, id=user_id, status=409, error="Duplicate id in request"))
+            elif user_id in deleted_ids:
+                results.append(schema.BulkItemResult(index=i, id=user_id, status=200))
+            else:
+                results.append(schema.BulkItemResult(index=i, id=user_id, status=404, error="User not found"))
+            seen.add(user_id)
+
+    await db.commit()
+    search.unindex_posts(*deleted_post_ids)
+    await cache.invalidate(*stale_keys)
+    if deleted_ids:
+        await cache.bump(cache.USERS, cache.POSTS, *(cache.user_resource(user_id) for user_id in deleted_ids))
+    return _bulk_summary(results)
 
 ############################ AUTH ############################
 
-async def reset_password(db: AsyncSession, user: models.User, new_password: str):
+async def reset_password(db: AsyncSession, email: str, new_password: str) -> bool:
     '''
-    비밀번호 변경
+    비밀번호 변경 (UPDATE 한 번), 사용자가 없으면 False
+    비밀번호 해시는 캐시하지 않으므로 캐시 무효화 불필요
     '''
-    hashed_pw = hash_password(new_password)
-    user.hashed_pw = hashed_pw
-    await db.commit()
\ No newline at end of file
+    hashed_pw = await hash_password_async(new_password)
+    result = await db.execute(
+        update(models.User)
+        .where(models.User.email == email)
+        .values(hashed_pw=hashed_pw)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+############################ FILE ############################
+
+FILE_SORT_COLUMNS = {
+    "name": models.File.name,
+    "size": models.File.size,
+    "uploaded_at": models.File.uploaded_at,
+}
+
+async def get_file(db: AsyncSession, name: str):
+    '''
+    파일 메타데이터 조회
+    '''
+    result = await db.execute(select(models.File).where(models.File.name == name))
+    return result.scalars().first()
+
+async def get_files_by_names(db: AsyncSession, names: list[str]):
+    '''
+    여러 파일 메타데이터를 한 번에 조회 (이름 → 메타데이터)
+    '''
+    result = await db.execute(select(models.File).where(models.File.name.in_(names)))
+    return {f.name: f for f in result.scalars().all()}
+
+async def get_files(
+    db: AsyncSession,
+    skip: int = 0,
+    limit: int = 100,
+    prefix: Optional[str] = None,
+    content_type: Optional[str] = None,
+    owner_id: Optional[int] = None,
+    sort: str = "name",
+    order: str = "asc",
+):
+    '''
+    파일 목록 조회(필터, 정렬, 페이징 처리)
+    '''
+    stmt = select(models.File)
+    if prefix:
+        stmt = stmt.where(models.File.name.startswith(prefix, autoescape=True))
+    if content_type:
+        stmt = stmt.where(models.File.content_type == content_type)
+    if owner_id is not None:
+        stmt = stmt.where(models.File.owner_id == owner_id)
+
+    column = FILE_SORT_COLUMNS[sort]
+    if order == "desc":
+        stmt = stmt.order_by(column.desc(), models.File.id.desc())
+    else:
+        stmt = stmt.order_by(column.asc(), models.File.id.asc())
+
+    result = await db.execute(stmt.offset(skip).limit(limit))
+    return result.scalars().all()
+
+async def _add_blob_ref(db: AsyncSession, sha256: str, size: int) -> bool:
+    '''
+    blob 참조 수 증가, 없으면 ref_count=1로 생성 (한 문장의 upsert)
+    새로 만든 blob이면 True (실제 파일을 저장해야 함)
+    같은 내용을 동시에 처음 업로드해도 한쪽은 INSERT, 다른 쪽은 commit까지 기다렸다가 UPDATE가 됨
+    '''
+    if db.get_bind().dialect.name == "sqlite":
+        stmt = sqlite_insert(models.Blob).values(sha256=sha256, size=size, ref_count=1)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[models.Blob.sha256], set_={"ref_count": models.Blob.ref_count + 1}
+        ).returning(models.Blob.ref_count)
+        # 참조 수가 0으로 남아 있던 blob도 파일을 다시 저장 (같은 내용이므로 덮어써도 무방)
+        return (await db.execute(stmt)).scalar_one() == 1
+
+    stmt = mysql_insert(models.Blob).values(sha256=sha256, size=size, ref_count=1)
+    stmt = stmt.on_duplicate_key_update(ref_count=models.Blob.ref_count + 1)
+    # affected rows: INSERT 1, 기존 행 UPDATE 2
+    return (await db.execute(stmt)).rowcount == 1
+
+async def create_file(
+    db: AsyncSession,
+    name: str,
+    size: int,
+    content_type: str,
+    sha256: str,
+    store_blob: Callable[[], Awaitable[None]],
+    owner_id: Optional[int] = None,
+):
+    '''
+    파일 메타데이터 등록 및 blob 참조 수 증가
+    같은 내용의 blob이 없을 때만 store_blob으로 실제 파일을 저장함 (중복 내용은 디스크를 추가로 쓰지 않음)
+    '''
+    # 참조 수 증가 (blob 행 잠금은 commit까지 유지되어 동시 삭제와 겹치지 않음)
+    is_new_blob = await _add_blob_ref(db, sha256, size)
+
+    db_file = models.File(name=name, size=size, content_type=content_type, sha256=sha256, owner_id=owner_id)
+    db.add(db_file)
+    await db.flush()    # 이름이 중복된 경우 IntegrityError
+
+    if is_new_blob:
+        await store_blob()
+    await db.commit()
+    return db_file
+
+async def _lock_unreferenced_blob(db: AsyncSession, sha256: str) -> bool:
+    '''
+    blob 행이 없으면 True, commit까지 잠금 유지 (그동안 같은 내용의 새 업로드는 blob INSERT에서 대기)
+    DELETE로 잠금을 잡음 (MySQL: 없는 키에도 gap lock, SQLite: DB 쓰기 잠금)
+    '''
+    await db.execute(delete(models.Blob).where(models.Blob.sha256 == sha256, models.Blob.ref_count <= 0))
+    result = await db.execute(select(models.Blob.sha256).where(models.Blob.sha256 == sha256).with_for_update())
+    return result.first() is None
+
+async def delete_file(db: AsyncSession, name: str, remove_blob: Callable[[str], Awaitable[None]]) -> bool:
+    '''
+    파일 메타데이터 삭제 및 blob 참조 수 감소
+    더 이상 참조하는 이름이 없는 blob은 commit 후 remove_blob으로 실제 파일까지 삭제
+    '''
+    result = await db.execute(select(models.File).where(models.File.name == name).with_for_update())
+    db_file = result.scalars().first()
+    if db_file is None:
+        return False
+
+    await db.execute(delete(models.File).where(models.File.id == db_file.id))
+    await db.execute(
+        update(models.Blob)
+        .where(models.Blob.sha256 == db_file.sha256)
+        .values(ref_count=models.Blob.ref_count - 1)
+    )
+    result = await db.execute(
+        delete(models.Blob).where(models.Blob.sha256 == db_file.sha256, models.Blob.ref_count <= 0)
+    )
+    blob_deleted = bool(result.rowcount)
+    await db.commit()
+
+    # 파일은 commit이 성공한 뒤에 삭제 (commit이 실패하면 메타데이터와 파일이 그대로 남음)
+    # 그 사이 같은 내용이 다시 업로드되어 blob 행이 생겼으면 새 업로드가 저장한 파일이므로 남겨 둠
+    # 파일 삭제가 실패해 남은 파일은 python -m app.reconcile_files 로 정리
+    if blob_deleted:
+        if await _lock_unreferenced_blob(db, db_file.sha256):
+            await remove_blob(db_file.sha256)
+        await db.commit()
+    return True
@@ -1,10 +1,17 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession, AsyncEngine
 from sqlalchemy.orm import declarative_base
-from typing import AsyncGenerator
-from dotenv import load_dotenv
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError, SQLAlchemyError
+from sqlalchemy import text, make_url, event
+from starlette.datastructures import MutableHeaders
+from fastapi import Request
+from typing import AsyncGenerator, Optional
+from . import config  # noqa: F401  (.env 로드)
+import asyncio
+import itertools
 import os
+import time
 
-load_dotenv()
 user = os.getenv("DB_USER")    
 passwd = os.getenv("DB_PASSWD")
 host = os.getenv("DB_HOST")    
@@ -12,14 +19,81 @@ port = os.getenv("DB_PORT")
 db = os.getenv("DB_NAME")      
 
 # asyncmy, aiomysql 둘 중 asyncmy가 빠르다고 하여 선택
-DB_URL = f'mysql+asyncmy://{user}:{passwd}@{host}:{port}/{db}?charset=utf8'
+# DB_URL을 지정하면 그대로 사용 (벤치마크 등에서 sqlite+aiosqlite로 대체)
+DB_URL = os.getenv("DB_URL") or f'mysql+asyncmy://{user}:{passwd}@{host}:{port}/{db}?charset=utf8'
 
-# Async Engine 생성
-engine = create_async_engine(DB_URL, echo=True, future=True)
+# 읽기 전용 복제본 설정 (host[:port]를 쉼표로 구분, 비어 있으면 모든 조회를 primary에서 처리)
+DB_REPLICA_HOSTS = [h.strip() for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h.strip()]
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", 5))             # 허용 복제 지연(초)
+DB_REPLICA_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_CHECK_INTERVAL", 2))
+DB_REPLICA_STANDIN = os.getenv("DB_REPLICA_STANDIN", "false").lower() == "true"   # 복제 설정이 없는 DB도 지연 0초로 사용 (로컬 대체 DB)
+DB_STICKY_SECONDS = int(os.getenv("DB_STICKY_SECONDS", 5))                 # 쓰기 후 primary에서 조회하는 시간(초)
+DB_STICKY_COOKIE = "db_read_primary"
 
-# Async 세센팩토리
+# 커넥션 풀 설정 (워커 프로세스마다 별도의 풀이 생성되므로 워커 수 × (POOL_SIZE + MAX_OVERFLOW) ≤ DB max_connections)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))      # 커넥션 대기 시간(초)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))      # MySQL wait_timeout보다 짧게 (초)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", 10))
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"      # SQL 로그 (개발용)
+
+# 프로세스 단위 커넥션 풀 통계
+pool_stats = {"checkouts": 0, "wait_seconds_total": 0.0, "wait_seconds_max": 0.0, "timeouts": 0}
+
+
+class _TimedQueuePool(AsyncAdaptedQueuePool):
+    '''
+    커넥션 체크아웃 대기 시간을 기록하는 풀 (새 연결 생성 시간 포함)
+    '''
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_stats["timeouts"] += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            pool_stats["checkouts"] += 1
+            pool_stats["wait_seconds_total"] += waited
+            pool_stats["wait_seconds_max"] = max(pool_stats["wait_seconds_max"], waited)
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> AsyncEngine:
+    '''
+    sqlite는 연결마다 외래키 검사를 켜야 함 (끄면 없는 사용자의 게시글 생성, ON DELETE CASCADE 미동작)
+    '''
+    if engine.dialect.name == "sqlite":
+        @event.listens_for(engine.sync_engine, "connect")
+        def _foreign_keys_on(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+    return engine
+
+
+def _create_engine(url: str, **kwargs) -> AsyncEngine:
+    # connect_timeout은 MySQL 드라이버 전용 옵션
+    connect_args = {"connect_timeout": DB_CONNECT_TIMEOUT} if make_url(url).get_backend_name() == "mysql" else {}
+    return enable_sqlite_foreign_keys(create_async_engine(
+        url,
+        echo=DB_ECHO,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args=connect_args,
+        **kwargs,
+    ))
+
+# Async Engine (init_engine에서 생성, 드라이버 import와 풀 생성을 import 시점에 하지 않음)
+engine: Optional[AsyncEngine] = None
+
+# Async 세센팩토리 (DB 연결 엔진은 init_engine에서 지정)
 SessionLocal = async_sessionmaker(
-    bind=engine,              # DB 연결 엔진
     class_=AsyncSession,      # 비동기 세션 클래스 사용
     autoflush=False,          # 자동 flush 비활성화 (직접 commit/flush)
     autocommit=False,         # 자동 commit 비활성화 (명시적 commit 필요)
@@ -29,7 +103,193 @@ SessionLocal = async_sessionmaker(
 # Base 모델
 Base = declarative_base()
 
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.healthy = False        # 첫 지연 확인 전까지는 사용하지 않음
+        self.lag: Optional[float] = None
+
+
+class ReplicaSet:
+    '''
+    읽기 전용 복제본 목록과 복제 지연 모니터
+    지연이 DB_REPLICA_MAX_LAG 이하인 복제본을 돌아가며 사용하고, 없으면 primary 사용
+    '''
+    def __init__(self, replicas: list[Replica]):
+        self.replicas = replicas
+        self._next = itertools.count()
+        self._task: Optional[asyncio.Task] = None
+
+    def pick(self) -> Optional[Replica]:
+        healthy = [r for r in self.replicas if r.healthy]
+        if not healthy:
+            return None
+        return healthy[next(self._next) % len(healthy)]
+
+    async def _lag(self, conn) -> Optional[float]:
+        '''
+        복제 지연(초), 복제가 멈췄거나 지연을 알 수 없으면 None
+        '''
+        if conn.dialect.name == "mysql":
+            # MySQL 8.0.22 미만은 SHOW SLAVE STATUS / Seconds_Behind_Master
+            version = conn.dialect.server_version_info or ()
+            if version >= (8, 0, 22):
+                row = (await conn.execute(text("SHOW REPLICA STATUS"))).mappings().first()
+                lag_column = "Seconds_Behind_Source"
+            else:
+                row = (await conn.execute(text("SHOW SLAVE STATUS"))).mappings().first()
+                lag_column = "Seconds_Behind_Master"
+            if row is not None:
+                return row.get(lag_column)
+        else:
+            await conn.execute(text("SELECT 1"))
+        # 복제 설정이 없는 DB는 primary를 따라오는지 알 수 없으므로
+        # 로컬 대체 DB로 명시한 경우(DB_REPLICA_STANDIN)에만 지연 없음으로 간주
+        return 0.0 if DB_REPLICA_STANDIN else None
+
+    async def _check(self, replica: Replica):
+        try:
+            async with replica.engine.connect() as conn:
+                lag = await self._lag(conn)
+        except (SQLAlchemyError, OSError):
+            lag = None
+        # 복제가 멈춘 경우 Seconds_Behind_Source가 NULL
+        replica.lag = None if lag is None else float(lag)
+        replica.healthy = replica.lag is not None and replica.lag <= DB_REPLICA_MAX_LAG
+
+    async def check_all(self):
+        await asyncio.gather(*(self._check(r) for r in self.replicas))
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(DB_REPLICA_CHECK_INTERVAL)
+            await self.check_all()
+
+    async def start(self):
+        if self.replicas and self._task is None:
+            await self.check_all()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def status(self) -> list[dict]:
+        return [
+            {"name": r.name, "healthy": r.healthy, "lag_seconds": r.lag, "checked_out": r.engine.pool.checkedout()}
+            for r in self.replicas
+        ]
+
+
+def _replica_url(replica_host: str) -> str:
+    replica_host, _, replica_port = replica_host.partition(":")
+    return f'mysql+asyncmy://{user}:{passwd}@{replica_host}:{replica_port or port}/{db}?charset=utf8'
+
+replicas = ReplicaSet([])
+
+def init_engine() -> AsyncEngine:
+    '''
+    primary / 복제본 엔진 생성 (처음 호출할 때 한 번)
+    체크아웃 대기 통계는 primary 풀만 기록
+    '''
+    global engine
+    if engine is None:
+        engine = _create_engine(DB_URL, poolclass=_TimedQueuePool)
+        SessionLocal.configure(bind=engine)
+        replicas.replicas = [Replica(h, _create_engine(_replica_url(h))) for h in DB_REPLICA_HOSTS]
+    return engine
+
 # Dependency Injection 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    '''
+    조회 전용 세션 (복제본 우선)
+    최근에 쓰기 요청을 보낸 클라이언트(DB_STICKY_COOKIE)는 자신의 변경 내용을 볼 수 있도록 primary 사용
+    '''
+    replica = None if request.cookies.get(DB_STICKY_COOKIE) else replicas.pick()
+    if replica is None:
+        async with SessionLocal() as session:
+            yield session
+    else:
+        async with SessionLocal(bind=replica.engine, info={"replica": replica}) as session:
+            yield session
+
+def is_current(session: AsyncSession) -> bool:
+    '''
+    세션이 primary 또는 지연이 없는(0초) 복제본에서 조회하는지 여부
+    지연 중인 복제본의 조회 결과는 최신 버전의 응답 캐시 / ETag로 사용하지 않음
+    '''
+    replica = session.info.get("replica")
+    return replica is None or replica.lag == 0
+
+
+class ReadYourWritesMiddleware:
+    '''
+    쓰기 요청이 성공하면 DB_STICKY_SECONDS 동안 조회를 primary로 보내도록 쿠키 설정
+    '''
+    READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in self.READ_METHODS or not replicas.replicas:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "set-cookie",
+                    f"{DB_STICKY_COOKIE}=1; Max-Age={DB_STICKY_SECONDS}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+async def open_engine():
+    '''
+    앱 시작시 엔진 생성 및 DB 연결 확인 (첫 요청이 연결 생성 비용을 떠안지 않도록 미리 연결)
+    '''
+    async with init_engine().connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    await replicas.start()
+
+async def close_engine():
+    '''
+    앱 종료시 커넥션 풀 정리
+    '''
+    await replicas.stop()
+    if engine is not None:
+        await engine.dispose()
+
+def get_pool_status() -> dict:
+    '''
+    현재 커넥션 풀 상태 및 누적 체크아웃 대기 통계
+    '''
+    pool = engine.pool if engine is not None else None
+    capacity = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+    checkouts = pool_stats["checkouts"]
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_out": checked_out,
+        "saturation": round(checked_out / capacity, 4) if capacity else 0.0,
+        **pool_stats,
+        "wait_seconds_avg": round(pool_stats["wait_seconds_total"] / checkouts, 6) if checkouts else 0.0,
+        "replicas": replicas.status(),
+    }
\ No newline at end of file
@@ -0,0 +1,57 @@
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from app import crud, schema
+from app.database import get_db
+from app.utils.jwt import decode_token_cached
+
+def get_token(request: Request) -> Optional[str]:
+    '''
+    Authorization: Bearer 헤더 → access_token 쿠키 순으로 토큰 조회
+    '''
+    authorization = request.headers.get("authorization")
+    if authorization:
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            return token.strip()
+    return request.cookies.get("access_token")
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+async def get_current_user_optional(request: Request, db: AsyncSession = Depends(get_db)) -> Optional[schema.User]:
+    '''
+    로그인한 사용자 (토큰이 없으면 None)
+    토큰 검증 결과와 사용자 정보는 캐시를 사용하므로 보통 서명 검증/DB 조회 없이 처리됨
+    '''
+    token = get_token(request)
+    if token is None:
+        return None
+
+    try:
+        payload = decode_token_cached(token)
+    except HTTPException:
+        raise _unauthorized("유효하지 않은 토큰입니다.")
+
+    # 비밀번호 재설정용 토큰(purpose)은 로그인 토큰으로 사용할 수 없음
+    sub = payload.get("sub")
+    if payload.get("purpose") is not None or not isinstance(sub, str) or not sub.isdigit():
+        raise _unauthorized("유효하지 않은 토큰입니다.")
+
+    # 사용자 캐시는 사용자 수정/삭제시 무효화됨
+    user = await crud.get_user_cached(db, int(sub))
+    if user is None:
+        raise _unauthorized("존재하지 않는 사용자입니다.")
+    return user
+
+async def get_current_user(user: Optional[schema.User] = Depends(get_current_user_optional)) -> schema.User:
+    '''
+    로그인한 사용자 (토큰이 없으면 401)
+    '''
+    if user is None:
+        raise _unauthorized("로그인이 필요합니다.")
+    return user
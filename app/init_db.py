@@ -1,9 +1,12 @@
-from .database import engine
-from . import models
+from alembic import command
+from alembic.config import Config
 
-def create_tables():
-    print("Creating tables...")
-    models.Base.metadata.create_all(bind=engine)
+def upgrade_database(revision: str = "head"):
+    '''
+    alembic 마이그레이션 적용 (create_all로 만든 기존 DB도 그대로 적용 가능)
+    '''
+    print("Upgrading database...")
+    command.upgrade(Config("alembic.ini"), revision)
 
 if __name__ == "__main__":
-    create_tables()
+    upgrade_database()
@@ -1,10 +1,52 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
-from .routers import user, post, auth, files
+from . import config  # .env를 다른 모듈보다 먼저 로드
+from .routers import user, post, auth, files, metrics
+from .utils.security import shutdown_pool
+from .utils.redis_client import init_redis, close_redis
+from .utils.email import mail_worker, MAIL_WORKER_ENABLED
+from .database import SessionLocal, close_engine, ReadYourWritesMiddleware
+from .utils.search import SEARCH_BACKEND, post_index
+from .utils.instrumentation import METRICS_ENABLED, MetricsMiddleware, mark_worker_stopped
+from . import crud
 
-app = FastAPI()
+async def load_post_documents():
+    # id 순으로 나누어 조회 (한 번에 전체 행을 변환하느라 이벤트 루프가 막히지 않도록)
+    rows = []
+    async with SessionLocal() as db:
+        while True:
+            chunk = await crud.get_post_search_documents(db, after_id=rows[-1].id if rows else 0)
+            rows += chunk
+            if len(chunk) < crud.SEARCH_LOAD_CHUNK:
+                return rows
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 필수 설정 확인, 업로드 디렉토리 / 메일 템플릿 / DB 엔진 준비
+    await config.startup()
+    await init_redis()
+    if MAIL_WORKER_ENABLED:
+        mail_worker.start()
+    if SEARCH_BACKEND == "memory":
+        post_index.start(load_post_documents)
+    yield
+    # 종료시 리소스 정리
+    await post_index.stop()
+    await mail_worker.stop()
+    await close_redis()
+    await close_engine()
+    shutdown_pool()
+    mark_worker_stopped()
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(ReadYourWritesMiddleware)
+if METRICS_ENABLED:
+    # 가장 바깥에서 전체 처리 시간 측정
+    app.add_middleware(MetricsMiddleware)
 
 # 라우터 등록
 app.include_router(user.router)
 app.include_router(post.router)
 app.include_router(auth.router)
-app.include_router(files.router)
\ No newline at end of file
+app.include_router(files.router)
+app.include_router(metrics.router)
\ No newline at end of file
@@ -0,0 +1,93 @@
+'''
+기존 평면 구조(UPLOAD_DIR/<파일 이름>)로 저장된 업로드 파일을 내용 해시 저장소(blobs)로 이전
+- 같은 내용의 파일은 하나의 blob으로 합치고 이름별 참조 수 기록
+- DB 반영 후에 원본 파일을 삭제하므로 중간에 실패해도 다시 실행하면 됨
+
+python -m app.migrate_files
+'''
+import asyncio
+import os
+from collections import Counter
+from sqlalchemy import select
+from .database import SessionLocal, init_engine
+from . import models
+from .utils.files import UPLOAD_DIR, allowed_file, blob_path, ensure_upload_dirs, guess_content_type, hash_file
+
+def scan_flat_files() -> list[tuple[str, str, int, str]]:
+    '''
+    (파일 이름, 경로, 크기, sha256) 목록
+    '''
+    found = []
+    for entry in os.scandir(UPLOAD_DIR):
+        if entry.name.startswith('.') or not entry.is_file() or not allowed_file(entry.name):
+            continue
+        found.append((entry.name, entry.path, entry.stat().st_size, hash_file(entry.path)))
+    return found
+
+def link_blob(src_path: str, sha256: str) -> bool:
+    '''
+    원본을 유지한 채 blob 경로에 하드링크 생성, 이미 같은 내용의 blob이 있으면 False
+    '''
+    dest = blob_path(sha256)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    try:
+        os.link(src_path, dest)
+    except FileExistsError:
+        return False
+    return True
+
+async def migrate():
+    ensure_upload_dirs()
+    init_engine()
+    flat = await asyncio.to_thread(scan_flat_files)
+    if not flat:
+        print("No flat files to migrate.")
+        return
+
+    total_bytes = sum(size for _, _, size, _ in flat)
+    stored_bytes = 0
+
+    async with SessionLocal() as db:
+        result = await db.execute(select(models.File))
+        files = {f.name: f for f in result.scalars().all()}
+        result = await db.execute(select(models.Blob))
+        blobs = {b.sha256: b for b in result.scalars().all()}
+
+        # blob 저장 및 blob 행 준비 (files.sha256 외래키 때문에 먼저 반영)
+        for name, path, size, sha256 in flat:
+            if await asyncio.to_thread(link_blob, path, sha256):
+                stored_bytes += size
+            if sha256 not in blobs:
+                blobs[sha256] = models.Blob(sha256=sha256, size=size, ref_count=0)
+                db.add(blobs[sha256])
+        await db.flush()
+
+        # 이름 → blob 참조
+        for name, path, size, sha256 in flat:
+            db_file = files.get(name)
+            if db_file is None:
+                db_file = models.File(name=name, size=size, content_type=guess_content_type(name), sha256=sha256)
+                db.add(db_file)
+                files[name] = db_file
+            else:
+                db_file.size = size
+                db_file.sha256 = sha256
+
+        # 참조 수 재계산
+        counts = Counter(f.sha256 for f in files.values())
+        for sha256, blob in blobs.items():
+            blob.ref_count = counts.get(sha256, 0)
+
+        await db.commit()
+
+    # DB 반영이 끝난 뒤 원본 삭제
+    for _, path, _, _ in flat:
+        await asyncio.to_thread(os.unlink, path)
+
+    print(
+        f"Migrated {len(flat)} files into {len(set(sha for *_, sha in flat))} blobs: "
+        f"{total_bytes} bytes -> {stored_bytes} bytes (saved {total_bytes - stored_bytes} bytes)"
+    )
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,73 @@
+"""baseline schema
+
+기존에 create_all로 만든 DB에서도 실행할 수 있도록 없는 테이블만 생성
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # --sql(offline) 모드는 DB를 조회할 수 없으므로 빈 DB 기준으로 출력
+    existing = set() if context.is_offline_mode() else set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'users' not in existing:
+        op.create_table(
+            'users',
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('name', sa.String(255), nullable=False),
+            sa.Column('email', sa.String(255), nullable=False, unique=True),
+            sa.Column('hashed_pw', sa.String(255), nullable=False),
+            sa.Column('is_active', sa.Boolean()),
+        )
+
+    if 'posts' not in existing:
+        op.create_table(
+            'posts',
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('title', sa.String(255), nullable=False),
+            sa.Column('description', sa.String(255)),
+            sa.Column('owner_id', sa.Integer(), sa.ForeignKey('users.id')),
+        )
+
+    if 'blobs' not in existing:
+        op.create_table(
+            'blobs',
+            sa.Column('sha256', sa.String(64), primary_key=True),
+            sa.Column('size', sa.BigInteger(), nullable=False),
+            sa.Column('ref_count', sa.Integer(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        )
+
+    if 'files' not in existing:
+        op.create_table(
+            'files',
+            sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column('name', sa.String(255), nullable=False, unique=True),
+            sa.Column('size', sa.BigInteger(), nullable=False),
+            sa.Column('content_type', sa.String(100), nullable=False),
+            sa.Column('sha256', sa.String(64), sa.ForeignKey('blobs.sha256'), nullable=False),
+            sa.Column('uploaded_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
+            sa.Column('owner_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='SET NULL'), nullable=True),
+        )
+        op.create_index('ix_files_size', 'files', ['size'])
+        op.create_index('ix_files_content_type', 'files', ['content_type'])
+        op.create_index('ix_files_sha256', 'files', ['sha256'])
+        op.create_index('ix_files_uploaded_at', 'files', ['uploaded_at'])
+        op.create_index('ix_files_owner_id', 'files', ['owner_id'])
+
+
+def downgrade():
+    op.drop_table('files')
+    op.drop_table('blobs')
+    op.drop_table('posts')
+    op.drop_table('users')
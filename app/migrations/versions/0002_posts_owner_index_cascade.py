@@ -0,0 +1,62 @@
+"""posts.owner_id index and ON DELETE CASCADE
+
+- 사용자별 게시글 조회(WHERE owner_id = ? ORDER BY id)용 인덱스
+  InnoDB 보조 인덱스는 기본키를 포함하므로 (owner_id) 인덱스로 id 정렬까지 처리
+- 사용자 삭제시 게시글을 DB에서 함께 삭제 (ORM이 한 건씩 조회/삭제하지 않음)
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ix_posts_owner_id'
+FK_NAME = 'fk_posts_owner_id_users'
+
+# --sql(offline) 모드에서 가정하는 기존 이름 (0001 / create_all로 만든 MySQL 테이블의 기본 이름)
+DEFAULT_OLD_FK = 'posts_ibfk_1'
+DEFAULT_OLD_FK_INDEX = 'owner_id'
+
+# SQLite는 이름 없는 외래키를 만들므로 테이블 재생성(batch)시 이 규칙으로 이름을 붙여서 제거 (FK_NAME과 같음)
+NAMING_CONVENTION = {'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'}
+
+
+def upgrade():
+    op.create_index(INDEX_NAME, 'posts', ['owner_id'])
+
+    # create_all로 만든 DB는 외래키 이름이 정해져 있지 않으므로 조회해서 제거
+    if context.is_offline_mode():
+        old_fks = [DEFAULT_OLD_FK]
+    else:
+        old_fks = [
+            fk['name'] or FK_NAME for fk in sa.inspect(op.get_bind()).get_foreign_keys('posts')
+            if fk['referred_table'] == 'users'
+        ]
+    with op.batch_alter_table('posts', naming_convention=NAMING_CONVENTION) as batch:
+        for name in old_fks:
+            batch.drop_constraint(name, type_='foreignkey')
+        batch.create_foreign_key(FK_NAME, 'users', ['owner_id'], ['id'], ondelete='CASCADE')
+
+    # 기존 외래키 생성시 MySQL이 자동으로 만든 owner_id 인덱스는 INDEX_NAME과 중복되므로 제거
+    if context.is_offline_mode():
+        op.drop_index(DEFAULT_OLD_FK_INDEX, table_name='posts')
+        return
+    for index in sa.inspect(op.get_bind()).get_indexes('posts'):
+        if index['column_names'] == ['owner_id'] and index['name'] not in (INDEX_NAME, FK_NAME):
+            op.drop_index(index['name'], table_name='posts')
+
+
+def downgrade():
+    # 외래키가 사용 중인 인덱스는 삭제할 수 없으므로 외래키 제거 → 인덱스 제거 → 외래키 재생성
+    with op.batch_alter_table('posts') as batch:
+        batch.drop_constraint(FK_NAME, type_='foreignkey')
+    op.drop_index(INDEX_NAME, table_name='posts')
+    with op.batch_alter_table('posts') as batch:
+        batch.create_foreign_key(FK_NAME, 'users', ['owner_id'], ['id'])
@@ -0,0 +1,34 @@
+"""posts FULLTEXT index for search
+
+MySQL 전용 (ngram parser, ngram_token_size 기본값 2)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = 'ft_posts_title_description'
+
+
+def _is_mysql() -> bool:
+    return context.get_context().dialect.name == 'mysql'
+
+
+def upgrade():
+    if _is_mysql():
+        op.create_index(
+            INDEX_NAME, 'posts', ['title', 'description'],
+            mysql_prefix='FULLTEXT', mysql_with_parser='ngram',
+        )
+
+
+def downgrade():
+    if _is_mysql():
+        op.drop_index(INDEX_NAME, table_name='posts')
@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Boolean, ForeignKey
+from sqlalchemy import Integer, BigInteger, String, Boolean, DateTime, ForeignKey, Index, func
 from sqlalchemy.orm import mapped_column, relationship
 from .database import Base
 
@@ -7,7 +7,9 @@ class User(Base):
     id = mapped_column(Integer, primary_key=True, autoincrement=True)
     name = mapped_column(String(255), nullable=False)
     email = mapped_column(String(255), unique=True, nullable=False)
-    posts = relationship("Post",back_populates="owner", cascade='delete')
+    # 게시글은 DB의 ON DELETE CASCADE로 삭제 (ORM이 게시글을 조회해서 한 건씩 삭제하지 않음)
+    # 암묵적 lazy loading(사용자마다 추가 쿼리)은 금지, 필요하면 crud에서 IN 쿼리로 한 번에 조회
+    posts = relationship("Post",back_populates="owner", cascade='delete', passive_deletes=True, lazy="raise")
     hashed_pw = mapped_column(String(255), nullable=False)
     is_active = mapped_column(Boolean,default=False)
 
@@ -16,5 +18,30 @@ class Post(Base):
     id = mapped_column(Integer, primary_key=True, autoincrement=True)
     title = mapped_column(String(255), nullable=False)
     description = mapped_column(String(255))
-    owner_id = mapped_column(Integer, ForeignKey("users.id"))
-    owner = relationship("User",back_populates="posts")
\ No newline at end of file
+    owner_id = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    owner = relationship("User",back_populates="posts", lazy="raise")
+
+    __table_args__ = (
+        # 게시글 검색용 (MySQL 전용, 한글 검색을 위해 ngram parser 사용)
+        Index(
+            "ft_posts_title_description", "title", "description",
+            mysql_prefix="FULLTEXT", mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
+
+class File(Base):
+    __tablename__ = "files"
+    id = mapped_column(Integer, primary_key=True, autoincrement=True)
+    name = mapped_column(String(255), unique=True, nullable=False)
+    size = mapped_column(BigInteger, nullable=False, index=True)
+    content_type = mapped_column(String(100), nullable=False, index=True)
+    sha256 = mapped_column(String(64), ForeignKey("blobs.sha256"), nullable=False, index=True)
+    uploaded_at = mapped_column(DateTime, nullable=False, server_default=func.now(), index=True)
+    owner_id = mapped_column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+
+class Blob(Base):
+    __tablename__ = "blobs"
+    sha256 = mapped_column(String(64), primary_key=True)
+    size = mapped_column(BigInteger, nullable=False)
+    ref_count = mapped_column(Integer, nullable=False, default=0)
+    created_at = mapped_column(DateTime, nullable=False, server_default=func.now())
\ No newline at end of file
@@ -0,0 +1,101 @@
+'''
+내용 해시 저장소(blobs)를 기준으로 파일 메타데이터 인덱스 재구성
+- 저장소에 없는 blob을 참조하는 이름 제거
+- blob별 참조 수 재계산
+- 참조하는 이름이 없는 blob 삭제
+- 중단된 업로드의 임시 파일 정리
+
+평면 구조로 저장된 기존 파일은 먼저 python -m app.migrate_files 로 이전
+
+python -m app.reconcile_files
+'''
+import asyncio
+import os
+import time
+from collections import Counter
+from sqlalchemy import select, delete
+from .database import SessionLocal, init_engine
+from . import models
+from .utils.files import UPLOAD_DIR, UPLOAD_TMP_DIR, BLOB_DIR, allowed_file, ensure_upload_dirs, remove_blob
+
+STALE_UPLOAD_SECONDS = 60 * 60   # 이보다 오래된 임시 업로드 파일은 중단된 업로드로 보고 제거
+
+def scan_blobs() -> dict[str, tuple[int, float]]:
+    '''
+    sha256 → (크기, 수정 시각)
+    '''
+    found = {}
+    for root, _, names in os.walk(BLOB_DIR):
+        for name in names:
+            st = os.stat(os.path.join(root, name))
+            found[name] = (st.st_size, st.st_mtime)
+    return found
+
+def count_flat_files() -> int:
+    return sum(
+        1 for entry in os.scandir(UPLOAD_DIR)
+        if not entry.name.startswith('.') and entry.is_file() and allowed_file(entry.name)
+    )
+
+def remove_stale_uploads() -> int:
+    removed = 0
+    for entry in os.scandir(UPLOAD_TMP_DIR):
+        if entry.is_file() and time.time() - entry.stat().st_mtime > STALE_UPLOAD_SECONDS:
+            os.unlink(entry.path)
+            removed += 1
+    return removed
+
+async def reconcile():
+    ensure_upload_dirs()
+    init_engine()
+    stale = await asyncio.to_thread(remove_stale_uploads)
+    on_disk = await asyncio.to_thread(scan_blobs)
+    orphans = []
+
+    async with SessionLocal() as db:
+        result = await db.execute(select(models.File))
+        files = result.scalars().all()
+        result = await db.execute(select(models.Blob))
+        blobs = {b.sha256: b for b in result.scalars().all()}
+
+        # 저장소에 없는 blob을 참조하는 이름 제거
+        missing = [f.id for f in files if f.sha256 not in on_disk]
+        if missing:
+            await db.execute(delete(models.File).where(models.File.id.in_(missing)))
+        counts = Counter(f.sha256 for f in files if f.sha256 in on_disk)
+
+        for sha256, (size, mtime) in on_disk.items():
+            blob = blobs.pop(sha256, None)
+            if counts.get(sha256):
+                if blob is None:
+                    db.add(models.Blob(sha256=sha256, size=size, ref_count=counts[sha256]))
+                else:
+                    blob.size = size
+                    blob.ref_count = counts[sha256]
+            elif time.time() - mtime > STALE_UPLOAD_SECONDS:
+                # 참조가 없는 blob (방금 저장되어 아직 커밋 전일 수 있는 blob은 제외)
+                orphans.append(sha256)
+                if blob is not None:
+                    await db.delete(blob)
+            elif blob is not None:
+                blob.ref_count = 0
+
+        # 파일이 없는 blob 행 제거
+        for blob in blobs.values():
+            await db.delete(blob)
+
+        await db.commit()
+
+    for sha256 in orphans:
+        await asyncio.to_thread(remove_blob, sha256)
+
+    print(
+        f"Reconciled file index: files_removed={len(missing)}, blobs={len(counts)}, "
+        f"orphan_blobs_removed={len(orphans)}, stale_uploads={stale}"
+    )
+    flat = await asyncio.to_thread(count_flat_files)
+    if flat:
+        print(f"{flat} files are still stored flat in {UPLOAD_DIR}; run python -m app.migrate_files")
+
+if __name__ == "__main__":
+    asyncio.run(reconcile())
@@ -1,24 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Cookie
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app import crud
-from app.utils.security import verify_password, create_code
+from app import crud, schema
+from app.dependencies import get_current_user
+from app.utils.security import verify_password_async, create_code
 from app.utils.jwt import create_access_token, decode_token
 from app.schema import LoginRequest, TokenResponse, EmailRequest, CodeVerifyRequest, PasswordResetRequest
-from app.utils.redis_client import r
-from app.utils.email import send_email_code
+from app.utils.redis_client import get_redis
+from app.utils.email import enqueue_email_code
+from app.utils.rate_limit import RateLimit, by_ip, by_email
 import json
 from datetime import timedelta
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# 요청 제한 (RATE_LIMIT_<이름> 환경 변수로 변경 가능, 예: RATE_LIMIT_LOGIN_EMAIL=5/60)
+# bcrypt 검증과 메일 발송이 가장 비싼 작업이므로 IP와 이메일 기준으로 각각 제한
+login_ip_limit = RateLimit("login_ip", "30/60", key=by_ip, algorithm="token_bucket")
+login_email_limit = RateLimit("login_email", "5/60", key=by_email)
+reset_code_ip_limit = RateLimit("reset_code_ip", "10/300", key=by_ip)
+reset_code_email_limit = RateLimit("reset_code_email", "3/300", key=by_email)
+verify_code_limit = RateLimit("verify_code_ip", "10/300", key=by_ip)
+
 # ---------------------------
 # 로그인 관련
 # ---------------------------
-@router.post("/login", response_model=TokenResponse, summary="로그인 및 JWT 토큰 발급")
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    summary="로그인 및 JWT 토큰 발급",
+    dependencies=[Depends(login_ip_limit), Depends(login_email_limit)],
+)
 async def login(request: LoginRequest, response: Response, db: AsyncSession = Depends(get_db)):
     user = await crud.get_user_by_email(db, request.email)
-    if not user or not verify_password(request.password, user.hashed_pw):
+    if not user or not await verify_password_async(request.password, user.hashed_pw):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다."
@@ -38,6 +53,10 @@ async def login(request: LoginRequest, response: Response, db: AsyncSession = De
 
     return {"access_token": token, "token_type": "bearer"}
 
+@router.get("/me", response_model=schema.User, summary="로그인한 사용자 정보 조회")
+async def me(user: schema.User = Depends(get_current_user)):
+    return user
+
 @router.post("/logout", summary="로그아웃")
 async def logout(response: Response):
     response.delete_cookie(
@@ -49,23 +68,24 @@ async def logout(response: Response):
 # ---------------------------
 # 패스워드 수정
 # ---------------------------
-@router.post('/passowrd/reset-code', summary='패스워드 변경 인증번호 요청')
+@router.post(
+    '/passowrd/reset-code',
+    summary='패스워드 변경 인증번호 요청',
+    dependencies=[Depends(reset_code_ip_limit), Depends(reset_code_email_limit)],
+)
 async def send_reset_code(request: EmailRequest, response: Response):
     
     key = f"reset_code:{request.email}"
 
-    # 기존 인증번호 존재시 삭제
-    if r.exists(key):
-        r.delete(key)
-
     code = create_code()    # 인증번호 생성
 
     data = {
         "code": code,
         "verified": False
     }
-    r.setex(key, 300, json.dumps(data)) # redis에 등록 300초(5분) 동안 유지함
-    send_email_code(request.email, code)    # 인증번호 메일 전송
+    # redis에 등록 300초(5분) 동안 유지함 (기존 인증번호는 덮어씀)
+    await get_redis().set(key, json.dumps(data), ex=300)
+    await enqueue_email_code(request.email, code)    # 인증번호 메일 발송 큐에 등록
 
     # reset_token 발급
     reset_token = create_access_token(
@@ -85,7 +105,7 @@ async def send_reset_code(request: EmailRequest, response: Response):
 
     return {"message": "인증번호가 이메일로 전송되었습니다."}
 
-@router.post("/password/verify-code", summary='인증번호 검증')
+@router.post("/password/verify-code", summary='인증번호 검증', dependencies=[Depends(verify_code_limit)])
 async def verify_code(request: CodeVerifyRequest, response:Response, reset_token: str = Cookie(...)):
 
     # reset_token 디코딩 → 이메일 추출
@@ -95,7 +115,7 @@ async def verify_code(request: CodeVerifyRequest, response:Response, reset_token
     
     email = payload.get("sub")
     key = f"reset_code:{email}"
-    value = r.get(key)
+    value = await get_redis().get(key)
 
     if not value:
         raise HTTPException(status_code=400, detail="인증번호가 만료되었거나 존재하지 않습니다.")
@@ -108,8 +128,10 @@ async def verify_code(request: CodeVerifyRequest, response:Response, reset_token
     if data.get("code") != request.code:
         raise HTTPException(status_code=400, detail="인증번호가 올바르지 않습니다.")
 
-    # 인증 완료 → Redis 상태 갱신
-    r.setex(key, 300, json.dumps({"code": request.code, "verified": True}))
+    # 인증 완료 → Redis 상태 갱신 (그 사이 만료된 경우 다시 생성하지 않음)
+    updated = await get_redis().set(key, json.dumps({"code": request.code, "verified": True}), ex=300, xx=True)
+    if not updated:
+        raise HTTPException(status_code=400, detail="인증번호가 만료되었거나 존재하지 않습니다.")
 
     # change_token 발급 (비밀번호 재설정 전용)
     change_token = create_access_token(
@@ -143,7 +165,7 @@ async def reset_password(request: PasswordResetRequest, response: Response, chan
     email = payload.get('sub')
 
     key = f"reset_code:{email}"
-    value = r.get(key)
+    value = await get_redis().get(key)
 
     if not value:
         raise HTTPException(status_code=400, detail="인증이 완료되지 않았습니다.")
@@ -153,14 +175,12 @@ async def reset_password(request: PasswordResetRequest, response: Response, chan
     if not data.get("verified"):
         raise HTTPException(status_code=403, detail="이메일 인증을 완료해주세요.")
 
-    # 사용자 조회
-    user = await crud.get_user_by_email(db, email)
-    
     # 비밀번호 변경
-    await crud.reset_password(db=db, user=user, new_password=request.new_password)
+    if not await crud.reset_password(db=db, email=email, new_password=request.new_password):
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
     
     # 인증번호 및 토큰 제거
-    r.delete(key)
+    await get_redis().delete(key)
     response.delete_cookie("change_token")
 
     return {"message": "비밀번호가 변경되었습니다."}
@@ -1,16 +1,44 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Query
-from fastapi.responses import FileResponse
-from typing import Optional
-from app.utils.files import allowed_file, UPLOAD_DIR, MAX_FILE_SIZE
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from email.utils import formatdate
+from typing import Literal, Optional
+from app.utils.files import (
+    allowed_file, receive_upload, iter_zip, file_etag, is_not_modified, blob_path, remove_blob,
+    RangeFileResponse, MAX_FILE_SIZE,
+)
 import os
-import zipfile
-from app import schema
+from app import crud, schema
+from app.database import get_db
+from app.dependencies import get_current_user_optional
 
 router = APIRouter(prefix='/api/files', tags=['files'])
 
-@router.post('/upload', summary='파일 업로드')
-async def upload_file(file:Optional[UploadFile] = File(None)):
+# 본문을 직접 스트리밍으로 처리하므로 문서용 요청 스키마를 별도로 지정
+UPLOAD_OPENAPI = {
+    'requestBody': {
+        'content': {
+            'multipart/form-data': {
+                'schema': {
+                    'type': 'object',
+                    'properties': {'file': {'type': 'string', 'format': 'binary'}},
+                }
+            }
+        }
+    }
+}
+
+@router.post('/upload', summary='파일 업로드', openapi_extra=UPLOAD_OPENAPI)
+async def upload_file(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    user: Optional[schema.User] = Depends(get_current_user_optional),
+):
     '''
+    로그인 상태(access_token 쿠키 또는 Bearer 토큰)면 업로드한 사용자를 파일 소유자로 기록
+
     1. 파일 첨부하지 않은 경우  
     status 400, {'error' : 'No file part'}
 
@@ -24,32 +52,47 @@ async def upload_file(file:Optional[UploadFile] = File(None)):
     status 409, {'error' : 'File too large'}
     '''
 
+    async def validate(filename: str):
+        # 파일 본문을 받기 전에 검사
+        # 허용하지 않는 확장자의 파일이 업로드 된 경우
+        if not allowed_file(filename):
+            raise HTTPException(status_code=400, detail={'error': 'Invalid file type'})
+
+        # 파일 이름이 중복된 경우 (메타데이터 인덱스 기준)
+        if await crud.get_file(db, filename) is not None:
+            raise HTTPException(status_code=409, detail={'error': 'File already exists'})
+
+    # 청크 단위로 임시 파일에 저장, 16MB를 초과하는 순간 중단
+    staged = await receive_upload(request, field='file', max_size=MAX_FILE_SIZE, validate=validate)
+
     # 파일을 첨부하지 않은 경우
-    if file is None or not file.filename:
+    if staged is None or not staged.filename:
         raise HTTPException(status_code=400, detail={'error':  'No file part'})
-    
-    # 허용하지 않는 확장자의 파일이 업로드 된 경우
-    if not allowed_file(file.filename):
-        raise HTTPException(status_code=400, detail={'error': 'Invalid file type'})
-    
-    # 파일 이름이 중복된 경우
-    file_path = os.path.join(UPLOAD_DIR, file.filename)
-    if os.path.exists(file_path):
-        raise HTTPException(status_code=409, detail={'error': 'File already exists'})
-    
-    # 파일 크기가 16MB를 초과 하는 경우
-    file_content = await file.read()
-    if len(file_content) > MAX_FILE_SIZE:
-        raise HTTPException(status_code=433, detail={'error': 'File too large'})
-    
-    # 파일 저장
-    with open(file_path, 'wb') as f:
-        f.write(file_content)
-    
+
+    # 메타데이터 등록 및 저장 (같은 내용이 이미 있으면 임시 파일은 버리고 기존 blob 참조)
+    try:
+        await crud.create_file(
+            db,
+            name=staged.filename,
+            size=staged.size,
+            content_type=staged.content_type,
+            sha256=staged.sha256,
+            store_blob=lambda: run_in_threadpool(staged.store),
+            owner_id=user.id if user is not None else None,
+        )
+    except IntegrityError:
+        # 그 사이 같은 이름이 등록된 경우만 409 (다른 제약 위반은 그대로 오류 처리)
+        await db.rollback()
+        if await crud.get_file(db, staged.filename) is not None:
+            raise HTTPException(status_code=409, detail={'error': 'File already exists'})
+        raise
+    finally:
+        await run_in_threadpool(staged.discard)
+
     return {'message': 'File Upload Successfuly'}
 
 @router.get('/download', summary='파일 다운로드')
-async def download_file(background: BackgroundTasks, filenames: Optional[str] = Query(None)):
+async def download_file(request: Request, filenames: Optional[str] = Query(None), db: AsyncSession = Depends(get_db)):
     '''
     ### 두개 이상 요청시 ,로 구분  
     ex) file1.txt,file2.txt  
@@ -61,42 +104,96 @@ async def download_file(background: BackgroundTasks, filenames: Optional[str] =
     status 404, {'message' : 'File not found'}
 
     3. 두 개 이상의 파일 다운로드시 
-    files.zip으로 압축  
+    files.zip으로 압축하면서 바로 전송 (png 등 이미 압축된 파일은 무압축 저장)  
+
+    4. 하나의 파일 다운로드시  
+    ETag(내용 해시) / Last-Modified 제공  
+    If-None-Match, If-Modified-Since 일치시 status 304  
+    Range 요청시 status 206 (여러 구간은 multipart/byteranges)
     '''
     # file name이 누락된 경우
     if not filenames:
         raise HTTPException(status_code=400, detail={'error': 'No filenames'})
     
     file_list = filenames.split(',')
-    paths = [os.path.join(UPLOAD_DIR, name) for name in file_list]
+    indexed = await crud.get_files_by_names(db, file_list)
+
+    # 다운로드 하려는 파일이 없는 경우 (메타데이터 인덱스 기준)
+    for name in file_list:
+        if name not in indexed:
+            raise HTTPException(status_code=404, detail={'error': f'{name} File not found'})
+
+    paths = [blob_path(indexed[name].sha256) for name in file_list]
 
-    # 다운로드 하려는 파일이 없는 경우
-    for p in paths:
-        if not os.path.exists(p):
-            raise HTTPException(status_code=404, detail={'error': f'{os.path.basename(p)} File not found'})
-    
     # 하나의 파일 다운로드
     if len(paths) == 1:
-        return FileResponse(paths[0], filename=file_list[0])
+        try:
+            stat_result = await run_in_threadpool(os.stat, paths[0])
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail={'error': f'{file_list[0]} File not found'})
+        etag = file_etag(indexed[file_list[0]].sha256)
+
+        # 변경되지 않은 경우 본문 없이 304
+        if is_not_modified(request.headers, etag, stat_result.st_mtime):
+            return Response(status_code=304, headers={
+                'etag': etag,
+                'last-modified': formatdate(stat_result.st_mtime, usegmt=True),
+            })
+
+        # Range / If-Range 처리는 FileResponse가 담당
+        return RangeFileResponse(paths[0], filename=file_list[0], stat_result=stat_result, headers={'etag': etag})
     
-    # 두개 이상의 파일 다운로드
+    # 두개 이상의 파일 다운로드 (임시 zip 파일 없이 스트리밍)
     zip_name = 'files.zip'
-    zip_path = os.path.join(UPLOAD_DIR, f'__tmp__{os.getpid()}_{id(paths)}.zip')
+    entries = list(zip(paths, file_list))
 
-    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for p in paths:
-            zipf.write(p, arcname=os.path.basename(p))
-    
-    # 응답 후 임시zip 파일 제거
-    background.add_task(os.remove, zip_path)
+    return StreamingResponse(
+        iter_zip(entries),
+        media_type='application/zip',
+        headers={'Content-Disposition': f'attachment; filename="{zip_name}"'},
+    )
 
-    return FileResponse(path = zip_path, filename=zip_name)
+@router.get('/list', response_model=schema.FileListRes, summary='파일 리스트 확인')
+async def file_list(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    prefix: Optional[str] = Query(None, description='파일 이름 접두어'),
+    content_type: Optional[str] = Query(None, description='ex) text/plain, image/png'),
+    owner_id: Optional[int] = None,
+    sort: Literal['name', 'size', 'uploaded_at'] = 'name',
+    order: Literal['asc', 'desc'] = 'asc',
+    db: AsyncSession = Depends(get_db),
+):
+    '''
+    파일 리스트 확인 (메타데이터 인덱스에서 조회)
+
+    - files: 파일 이름 목록
+    - items: 크기, content type, sha256, 업로드 시각 등 메타데이터
+    '''
+    items = await crud.get_files(
+        db,
+        skip=skip,
+        limit=limit,
+        prefix=prefix,
+        content_type=content_type,
+        owner_id=owner_id,
+        sort=sort,
+        order=order,
+    )
 
-@router.get('/list', summary='파일 리스트 확인')
-async def file_list():
+    return schema.FileListRes(files=[f.name for f in items], items=items)
+
+@router.delete('/{filename}', summary='파일 삭제')
+async def delete_file(filename: str, db: AsyncSession = Depends(get_db)):
     '''
-    파일 리스트 확인
+    파일 삭제 (다른 이름이 같은 내용을 참조하지 않으면 저장된 파일도 제거)
     '''
-    files = sorted(os.listdir(UPLOAD_DIR))
-    
-    return schema.FileListRes(files=files)
+    deleted = await crud.delete_file(
+        db,
+        filename,
+        remove_blob=lambda sha256: run_in_threadpool(remove_blob, sha256),
+    )
+    if not deleted:
+        raise HTTPException(status_code=404, detail={'error': f'{filename} File not found'})
+
+    return {'message': 'File deleted successfully'}
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Response
+from app.utils import cache, rate_limit
+from app.utils.instrumentation import render_metrics
+from app.database import get_pool_status
+
+router = APIRouter(prefix='/metrics', tags=['metrics'])
+
+@router.get('', summary='Prometheus 지표', response_class=Response)
+async def prometheus_metrics():
+    '''
+    요청 처리 시간, 요청당 DB 쿼리 수/시간, Redis/SMTP/bcrypt 처리 시간 (Prometheus text 형식)
+    '''
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+@router.get('/cache', summary='캐시 hit/miss 통계')
+async def cache_stats():
+    '''
+    현재 프로세스의 사용자/게시물 캐시 통계와 목록/상세 응답 캐시 통계
+    '''
+    total = cache.stats["hits"] + cache.stats["misses"]
+    hit_ratio = cache.stats["hits"] / total if total else 0.0
+    return {**cache.stats, "hit_ratio": round(hit_ratio, 4), "responses": cache.response_stats}
+
+@router.get('/db', summary='DB 커넥션 풀 상태')
+async def db_pool_stats():
+    '''
+    현재 프로세스의 커넥션 풀 사용량(saturation = checked_out / (pool_size + max_overflow))과
+    체크아웃 대기 시간 통계
+    '''
+    return get_pool_status()
+
+@router.get('/rate-limit', summary='요청 제한 통계')
+async def rate_limit_stats():
+    return rate_limit.stats
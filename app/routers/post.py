@@ -1,31 +1,127 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Union
 
 from .. import crud, schema
-from ..database import get_db
+from ..database import get_db, get_read_db
+from ..utils.pagination import decode_id_cursor, decode_score_cursor, PAGE_MAX_LIMIT
+from ..utils.search import highlight
+from ..utils.fast_json import rows_to_dicts, rows_response, page_response
+from ..utils.bulk import BULK_CHUNK_SIZE, check_bulk_size
+from ..utils import cache
+from ..utils.http_cache import cached_response, CACHE_CONTROL_PUBLIC
 
 router = APIRouter(prefix="/post", tags=["post"])
 
-@router.get("", response_model=list[schema.Post], summary="모든 게시글 목록 조회")
-async def get_posts(skip: int = 0, limit: int = 50, db: AsyncSession = Depends(get_db)):
-    return await crud.get_posts(db, skip=skip, limit=limit)
+# 복제본에서 조회, 지연 중인 복제본의 결과는 응답 캐시에 저장하지 않음 (http_cache.cached_response)
+@router.get("", response_model=Union[list[schema.Post], schema.PostPage], summary="모든 게시글 목록 조회")
+async def get_posts(request: Request, skip: int = 0, limit: int = Query(50, ge=1, le=PAGE_MAX_LIMIT), cursor: Optional[str] = None, db: AsyncSession = Depends(get_read_db)):
+    '''
+    ### 페이징 방식
+    1. offset 방식 (기존): `skip`, `limit` → 게시글 배열 반환
 
+    2. cursor 방식: `cursor` 전달시 사용 (첫 페이지는 `cursor=` 빈 값)  
+    {'items': [...], 'next_cursor': '...'} 반환, 마지막 페이지는 next_cursor가 null
+
+    ### 캐시
+    게시글 버전 기반 ETag 제공, If-None-Match 일치시 status 304
+    '''
+    async def build():
+        if cursor is None:
+            return rows_response(await crud.get_posts(db, skip=skip, limit=limit))
+
+        posts, next_cursor = await crud.get_posts_after(db, after_id=decode_id_cursor(cursor), limit=limit)
+        return page_response(rows_to_dicts(posts), next_cursor)
+
+    return await cached_response(request, (cache.POSTS,), build, CACHE_CONTROL_PUBLIC, db=db)
+
+@router.get("/search", response_model=schema.PostSearchPage, summary="게시글 검색")
+async def search_posts(
+    q: str = Query(..., min_length=2, max_length=100),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str = "",
+    db: AsyncSession = Depends(get_read_db),
+):
+    '''
+    제목/내용 검색 (관련도 순)  
+    `title_highlight`, `description_highlight`는 검색어를 `<mark>`로 감싼 HTML  
+    다음 페이지는 `next_cursor`를 `cursor`로 전달
+    '''
+    rows, next_cursor = await crud.search_posts(db, q, limit=limit, after=decode_score_cursor(cursor))
+    items = [
+        schema.PostSearchHit(
+            id=post.id,
+            owner_id=post.owner_id,
+            title=post.title,
+            description=post.description,
+            score=score,
+            title_highlight=highlight(post.title, q),
+            description_highlight=highlight(post.description, q),
+        )
+        for post, score in rows
+    ]
+    return schema.PostSearchPage(items=items, next_cursor=next_cursor)
+
+# 캐시를 채우는 조회는 primary에서 처리 (지연된 복제본 값이 CACHE_TTL 동안 캐시에 남지 않도록)
+@router.get("/{post_id}", response_model=schema.Post, summary="특정 게시글 조회")
+async def get_post(post_id: int, db: AsyncSession = Depends(get_db)):
+    db_post = await crud.get_post_cached(db, post_id)
+    if db_post is None:
+        raise HTTPException(status_code=404, detail="Post not found")
+    return db_post
+
+# /bulk 경로는 /{post_id}, /{user_id} 경로보다 먼저 선언
+@router.post("/bulk", response_model=schema.BulkResult, summary="게시글 일괄 생성")
+async def bulk_create_posts(
+    posts: list[schema.PostBulkCreate] = Body(...),
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    '''
+    항목별 결과(`results`)는 요청 순서(`index`)대로 반환  
+    작성자가 없는 항목은 status 404, 나머지는 201과 생성된 id
+    '''
+    check_bulk_size(posts)
+    return await crud.bulk_create_posts(db, posts, chunk_size=chunk_size)
+
+@router.patch("/bulk", response_model=schema.BulkResult, summary="게시글 일괄 수정")
+async def bulk_update_posts(
+    posts: list[schema.PostBulkUpdate] = Body(...),
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    '''
+    전달한 필드만 수정, 없는 게시글은 status 404
+    '''
+    check_bulk_size(posts)
+    return await crud.bulk_update_posts(db, posts, chunk_size=chunk_size)
+
+@router.delete("/bulk", response_model=schema.BulkResult, summary="게시글 일괄 삭제")
+async def bulk_delete_posts(
+    request: schema.BulkDeleteRequest,
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    check_bulk_size(request.ids)
+    return await crud.bulk_delete_posts(db, request.ids, chunk_size=chunk_size)
 
 @router.post("/{user_id}", response_model=schema.Post, summary="특정 사용자의 게시글 생성")
 async def post_post_for_user(user_id: int, post: schema.PostCreate, db: AsyncSession = Depends(get_db)):
-    return await crud.create_user_post(db=db, user_id=user_id, post=post)
+    try:
+        return await crud.create_user_post(db=db, user_id=user_id, post=post)
+    except IntegrityError:
+        raise HTTPException(status_code=404, detail="User not found")
 
 @router.put("/{post_id}", response_model=schema.Post, summary="기존 게시글 수정")
 async def update_post(post_id: int, updated_post: schema.PostCreate, db: AsyncSession = Depends(get_db)):
-    db_post = await crud.get_post(db, post_id)
+    db_post = await crud.update_post(db, post_id, updated_post)
     if db_post is None:
         raise HTTPException(status_code=404, detail="Post not found")
-    return await crud.update_post(db, db_post, updated_post)
+    return db_post
 
 @router.delete("/{post_id}", summary="게시글 삭제")
 async def delete_post(post_id: int, db: AsyncSession = Depends(get_db)):
-    db_post = await crud.get_post(db, post_id)
-    if db_post is None:
+    if not await crud.delete_post(db, post_id):
         raise HTTPException(status_code=404, detail="Post not found")
-    await crud.delete_post(db, db_post)
     return {"message": "Post deleted successfully"}
\ No newline at end of file
@@ -1,40 +1,158 @@
-from fastapi import Depends, HTTPException, APIRouter
+from fastapi import Body, Depends, HTTPException, APIRouter, Query, Request
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Literal, Optional, Union
 
 from .. import crud, schema
-from ..database import get_db
+from ..database import get_db, get_read_db
+from ..utils.pagination import decode_id_cursor, PAGE_MAX_LIMIT, INCLUDE_POSTS_LIMIT
+from ..utils.bulk import BULK_CHUNK_SIZE, check_bulk_size
+from ..utils.fast_json import RawJSONResponse, rows_to_dicts, json_response, rows_response, page_response
+from ..utils import cache
+from ..utils.http_cache import cached_response, CACHE_CONTROL_PRIVATE
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-@router.get("", response_model=list[schema.User],summary="모든 사용자 정보 조회")
-async def get_users(skip: int = 0, limit: int = 10, db: AsyncSession = Depends(get_db)):
-    return await crud.get_users(db, skip=skip, limit=limit)
+async def with_posts(db: AsyncSession, users: list) -> list[dict]:
+    '''
+    사용자 목록에 게시글 포함 (사용자 수와 관계없이 추가 쿼리 1회, 사용자마다 최대 INCLUDE_POSTS_LIMIT개)
+    '''
+    posts = await crud.get_posts_by_owners(db, [user.id for user in users], per_owner=INCLUDE_POSTS_LIMIT)
+    return [{**user._asdict(), "posts": rows_to_dicts(posts[user.id])} for user in users]
 
-@router.get("/{user_id}", response_model=schema.User, summary="특정 사용자 정보 조회")
-async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
-    db_user =  await crud.get_user(db, user_id=user_id)
-    if db_user is None:
+# 복제본에서 조회, 지연 중인 복제본의 결과는 응답 캐시에 저장하지 않음 (http_cache.cached_response)
+@router.get(
+    "",
+    response_model=Union[list[schema.User], schema.UserPage, list[schema.UserWithPosts], schema.UserWithPostsPage],
+    summary="모든 사용자 정보 조회",
+)
+async def get_users(
+    request: Request,
+    skip: int = 0,
+    limit: int = Query(10, ge=1, le=PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    include: Optional[Literal["posts"]] = None,
+    db: AsyncSession = Depends(get_read_db),
+):
+    '''
+    ### 페이징 방식
+    1. offset 방식 (기존): `skip`, `limit` → 사용자 배열 반환
+
+    2. cursor 방식: `cursor` 전달시 사용 (첫 페이지는 `cursor=` 빈 값)  
+    {'items': [...], 'next_cursor': '...'} 반환, 마지막 페이지는 next_cursor가 null
+
+    ### include=posts
+    각 사용자에 `posts`(작성한 게시글 목록, id 순으로 최대 INCLUDE_POSTS_LIMIT개) 포함  
+    나머지는 `GET /users/{user_id}/posts`로 조회
+
+    ### 캐시
+    사용자(include=posts면 게시글 포함) 버전 기반 ETag 제공, If-None-Match 일치시 status 304
+    '''
+    async def build():
+        if cursor is None:
+            users = await crud.get_users(db, skip=skip, limit=limit)
+            return json_response(await with_posts(db, users)) if include == "posts" else rows_response(users)
+
+        users, next_cursor = await crud.get_users_after(db, after_id=decode_id_cursor(cursor), limit=limit)
+        items = await with_posts(db, users) if include == "posts" else rows_to_dicts(users)
+        return page_response(items, next_cursor)
+
+    resources = (cache.USERS, cache.POSTS) if include == "posts" else (cache.USERS,)
+    return await cached_response(request, resources, build, CACHE_CONTROL_PRIVATE, db=db)
+
+@router.get("/{user_id}/posts", response_model=schema.PostPage, summary="특정 사용자의 게시글 목록 조회")
+async def get_user_posts(
+    user_id: int,
+    limit: int = Query(50, ge=1, le=PAGE_MAX_LIMIT),
+    cursor: str = "",
+    db: AsyncSession = Depends(get_read_db),
+):
+    '''
+    cursor 방식 페이징 (첫 페이지는 `cursor` 생략)
+    '''
+    after_id = decode_id_cursor(cursor)
+    posts, next_cursor = await crud.get_user_posts_after(db, user_id, after_id=after_id, limit=limit)
+    # 게시글이 없는 첫 페이지만 사용자 존재 여부 확인
+    if not posts and not after_id and await crud.get_user(db, user_id) is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return db_user
+    return page_response(rows_to_dicts(posts), next_cursor)
+
+# 캐시를 채우는 조회는 primary에서 처리 (지연된 복제본 값이 CACHE_TTL 동안 캐시에 남지 않도록)
+@router.get("/{user_id}", response_model=schema.User, summary="특정 사용자 정보 조회")
+async def get_user(request: Request, user_id: int, db: AsyncSession = Depends(get_db)):
+    '''
+    사용자 버전 기반 ETag 제공, If-None-Match 일치시 status 304
+    '''
+    async def build():
+        db_user =  await crud.get_user_cached(db, user_id=user_id)
+        if db_user is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        return RawJSONResponse(db_user.model_dump_json())
+
+    return await cached_response(request, (cache.user_resource(user_id),), build, CACHE_CONTROL_PRIVATE)
 
 @router.post("", response_model=schema.User, summary="회원가입")
 async def post_user(user: schema.UserCreate, db: AsyncSession = Depends(get_db)):
-    db_user =  await crud.get_user_by_email(db, email=user.email)
+    db_user =  await crud.get_user_by_email_cached(db, email=user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
-    return await crud.create_user(db, user=user)
+    try:
+        return await crud.create_user(db, user=user)
+    except IntegrityError:
+        # 동시에 같은 이메일로 가입한 경우
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+# /bulk 경로는 /{user_id} 경로보다 먼저 선언
+@router.post("/bulk", response_model=schema.BulkResult, summary="일괄 회원가입")
+async def bulk_create_users(
+    users: list[schema.UserCreate] = Body(...),
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    '''
+    항목별 결과(`results`)는 요청 순서(`index`)대로 반환  
+    이미 가입되었거나 요청 안에서 중복된 이메일은 status 409, 나머지는 201과 생성된 id
+    '''
+    check_bulk_size(users)
+    return await crud.bulk_create_users(db, users, chunk_size=chunk_size)
+
+@router.patch("/bulk", response_model=schema.BulkResult, summary="사용자 정보 일괄 수정")
+async def bulk_update_users(
+    users: list[schema.UserBulkUpdate] = Body(...),
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    '''
+    전달한 필드(name, email)만 수정  
+    없는 사용자는 status 404, 다른 사용자가 사용 중인 이메일은 status 409
+    '''
+    check_bulk_size(users)
+    return await crud.bulk_update_users(db, users, chunk_size=chunk_size)
+
+@router.delete("/bulk", response_model=schema.BulkResult, summary="사용자 일괄 삭제")
+async def bulk_delete_users(
+    request: schema.BulkDeleteRequest,
+    chunk_size: int = Query(BULK_CHUNK_SIZE, ge=1, le=5000),
+    db: AsyncSession = Depends(get_db),
+):
+    '''
+    사용자가 작성한 게시글도 함께 삭제
+    '''
+    check_bulk_size(request.ids)
+    return await crud.bulk_delete_users(db, request.ids, chunk_size=chunk_size)
 
 @router.put("/{user_id}", response_model=schema.User, summary="기존 사용자 정보 수정")
 async def update_user(user_id: int, updated_user: schema.UserCreate, db: AsyncSession = Depends(get_db)):
-    db_user =  await crud.get_user(db, user_id)
+    try:
+        db_user = await crud.update_user(db, user_id, updated_user)
+    except IntegrityError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    return await crud.update_user(db, db_user, updated_user)
+    return db_user
 
 @router.delete("/{user_id}", summary="사용자 삭제")
 async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
-    db_user =  await crud.get_user(db, user_id)
-    if db_user is None:
+    if not await crud.delete_user(db, user_id):
         raise HTTPException(status_code=404, detail="User not found")
-    await crud.delete_user(db, db_user)
     return {"message": "User deleted successfully"}
\ No newline at end of file
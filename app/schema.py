@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field, ConfigDict, validator
 from typing import Optional, List
+from datetime import datetime
 import re
 
 # ---------------------------
@@ -19,6 +20,33 @@ class Post(PostBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+class PostPage(BaseModel):
+    items: List[Post]
+    next_cursor: Optional[str] = None
+
+class PostSearchHit(Post):
+    score: float
+    title_highlight: str                        # 검색어를 <mark>로 감싼 HTML
+    description_highlight: Optional[str] = None
+
+class PostSearchPage(BaseModel):
+    items: List[PostSearchHit]
+    next_cursor: Optional[str] = None
+
+class PostBulkCreate(PostBase):
+    owner_id: int
+
+class PostBulkUpdate(BaseModel):
+    id: int
+    title: Optional[str] = None         # 생략하면 기존 값 유지 (null은 허용하지 않음)
+    description: Optional[str] = None
+
+    @validator("title")
+    def title_not_null(cls, v):
+        if v is None:
+            raise ValueError("null일 수 없습니다.")
+        return v
+
 
 # ---------------------------
 # 사용자 관련 스키마
@@ -49,6 +77,47 @@ class User(UserBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+class UserPage(BaseModel):
+    items: List[User]
+    next_cursor: Optional[str] = None
+
+class UserWithPosts(User):
+    posts: List[Post]
+
+class UserWithPostsPage(BaseModel):
+    items: List[UserWithPosts]
+    next_cursor: Optional[str] = None
+
+class UserBulkUpdate(BaseModel):
+    id: int
+    name: Optional[str] = None          # 생략하면 기존 값 유지 (null은 허용하지 않음)
+    email: Optional[EmailStr] = None
+
+    @validator("name", "email")
+    def not_null(cls, v):
+        if v is None:
+            raise ValueError("null일 수 없습니다.")
+        return v
+
+
+# ---------------------------
+# 일괄 처리 관련 스키마
+# ---------------------------
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[int] = Field(..., min_length=1, json_schema_extra={"example": [1, 2, 3]})
+
+class BulkItemResult(BaseModel):
+    index: int                      # 요청 목록에서의 위치
+    id: Optional[int] = None
+    status: int                     # 항목별 처리 결과 (201, 200, 400, 404, 409)
+    error: Optional[str] = None
+
+class BulkResult(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
 
 # ---------------------------
 # 인증 관련 스키마
@@ -81,5 +150,16 @@ class PasswordResetRequest(BaseModel):
 # 파일 관련 스키마
 # ---------------------------
 
+class FileInfo(BaseModel):
+    name: str
+    size: int
+    content_type: str
+    sha256: str
+    uploaded_at: datetime
+    owner_id: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
 class FileListRes(BaseModel):
-    files: List[str]
\ No newline at end of file
+    files: List[str]
+    items: List[FileInfo] = []
\ No newline at end of file
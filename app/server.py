@@ -0,0 +1,67 @@
+'''
+운영 서버 실행 (uvicorn 멀티 워커)
+
+python -m app.server
+
+- 워커는 spawn 방식으로 새로 시작되고, DB / Redis 커넥션 풀은 각 워커의 lifespan에서 생성됨
+  (supervisor 프로세스는 app을 import하지 않음)
+- SIGTERM을 받으면 새 연결을 받지 않고 처리 중인 요청(업로드 포함)을 WEB_GRACEFUL_TIMEOUT까지 기다린 뒤 종료
+'''
+import os
+import tempfile
+import uvicorn
+
+WEB_APP = os.getenv("WEB_APP", "app.main:app")
+WEB_HOST = os.getenv("WEB_HOST", "0.0.0.0")
+WEB_PORT = int(os.getenv("WEB_PORT", 8000))
+WEB_WORKERS = int(os.getenv("WEB_WORKERS", os.cpu_count() or 1))
+WEB_LOOP = os.getenv("WEB_LOOP", "uvloop")                  # uvloop | asyncio
+WEB_HTTP = os.getenv("WEB_HTTP", "httptools")               # httptools | h11
+WEB_BACKLOG = int(os.getenv("WEB_BACKLOG", 2048))           # 수락 대기 연결 수 (net.core.somaxconn 이하로 적용됨)
+WEB_KEEPALIVE = int(os.getenv("WEB_KEEPALIVE", 75))         # keep-alive 유지 시간(초), 앞단 프록시의 유휴 시간보다 길게
+WEB_GRACEFUL_TIMEOUT = int(os.getenv("WEB_GRACEFUL_TIMEOUT", 30))   # 종료시 처리 중인 요청 대기 시간(초)
+WEB_LIMIT_CONCURRENCY = int(os.getenv("WEB_LIMIT_CONCURRENCY", 0))  # 워커당 동시 연결 상한, 초과시 503 (0이면 제한 없음)
+WEB_FORWARDED_ALLOW_IPS = os.getenv("WEB_FORWARDED_ALLOW_IPS", "127.0.0.1")   # X-Forwarded-For를 신뢰할 프록시
+WEB_ACCESS_LOG = os.getenv("WEB_ACCESS_LOG", "true").lower() == "true"
+
+
+def configure_workers(workers: int):
+    '''
+    워커 프로세스가 시작되기 전에 환경 변수로 전달할 워커별 설정
+    '''
+    # bcrypt 스레드 풀은 워커마다 생성되므로 전체가 CPU 수를 넘지 않도록 나눔
+    os.environ.setdefault("HASH_POOL_SIZE", str(max(1, (os.cpu_count() or 1) // workers)))
+
+    # 여러 워커의 Prometheus 지표 합산 (이전 실행의 지표 파일은 제거)
+    if workers > 1:
+        os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "prometheus-multiproc"))
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        for name in os.listdir(multiproc_dir):
+            if name.endswith(".db"):
+                os.unlink(os.path.join(multiproc_dir, name))
+
+
+def main():
+    configure_workers(WEB_WORKERS)
+    uvicorn.run(
+        WEB_APP,
+        host=WEB_HOST,
+        port=WEB_PORT,
+        workers=WEB_WORKERS,
+        loop=WEB_LOOP,
+        http=WEB_HTTP,
+        lifespan="on",
+        backlog=WEB_BACKLOG,
+        timeout_keep_alive=WEB_KEEPALIVE,
+        timeout_graceful_shutdown=WEB_GRACEFUL_TIMEOUT,
+        limit_concurrency=WEB_LIMIT_CONCURRENCY or None,
+        proxy_headers=True,
+        forwarded_allow_ips=WEB_FORWARDED_ALLOW_IPS,
+        access_log=WEB_ACCESS_LOG,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+import os
+from fastapi import HTTPException
+
+BULK_CHUNK_SIZE = int(os.getenv("BULK_CHUNK_SIZE", 500))   # 한 문장으로 처리하는 최대 행 수
+BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", 10000))   # 한 요청에 허용하는 최대 항목 수
+
+def check_bulk_size(items: list):
+    '''
+    일괄 처리 요청 항목 수 검사
+    '''
+    if not items:
+        raise HTTPException(status_code=400, detail="Empty bulk request")
+    if len(items) > BULK_MAX_ITEMS:
+        raise HTTPException(status_code=413, detail=f"Too many items (max {BULK_MAX_ITEMS})")
@@ -0,0 +1,196 @@
+import asyncio
+import os
+import time
+from typing import Awaitable, Callable, Optional, Type, TypeVar
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from app.utils.redis_client import get_redis
+
+CACHE_TTL = int(os.getenv("CACHE_TTL", 300))    # 캐시 유지 시간(초)
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", CACHE_TTL))   # 직렬화된 응답 본문 유지 시간(초)
+
+M = TypeVar("M", bound=BaseModel)
+
+# 프로세스 단위 캐시 통계 (hit / miss / 동시 miss 병합 / redis 오류)
+stats = {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+
+# 프로세스 단위 응답 캐시 통계 (본문 hit / miss / 304 응답 / 지연 중인 복제본 조회로 저장 안 함 / redis 오류)
+response_stats = {"hits": 0, "misses": 0, "not_modified": 0, "stale_reads": 0, "errors": 0}
+
+# 동일 키에 대해 DB 조회 중인 작업 (single-flight)
+_inflight: dict[str, asyncio.Future] = {}
+
+# KEYS[1] = 캐시 키, KEYS[2] = 세대 키, ARGV = (DB 조회 전에 읽은 세대, 값, 유지 시간(초))
+# 조회하는 동안 무효화되지 않았을 때만(세대가 그대로일 때만) 저장
+SET_IF_GENERATION_LUA = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+_set_script = None
+
+
+def generation_key(key: str) -> str:
+    return f"{key}:gen"
+
+def user_key(user_id: int) -> str:
+    return f"cache:user:{user_id}"
+
+def user_email_key(email: str) -> str:
+    return f"cache:user_email:{email}"
+
+def post_key(post_id: int) -> str:
+    return f"cache:post:{post_id}"
+
+# 응답 캐시 리소스 (쓰기 작업마다 버전 증가)
+USERS = "users"
+POSTS = "posts"
+
+def user_resource(user_id: int) -> str:
+    return f"user:{user_id}"
+
+def version_key(resource: str) -> str:
+    return f"cache:version:{resource}"
+
+def response_key(request_key: str, etag: str) -> str:
+    return f"cache:response:{request_key}:{etag}"
+
+
+def _get_set_script():
+    global _set_script
+    client = get_redis()
+    # redis 클라이언트가 다시 만들어진 경우 스크립트도 다시 등록
+    if _set_script is None or _set_script.registered_client is not client:
+        _set_script = client.register_script(SET_IF_GENERATION_LUA)
+    return _set_script
+
+
+async def read_through(key: str, model: Type[M], loader: Callable[[], Awaitable[object]]) -> Optional[M]:
+    '''
+    캐시 조회 → 없으면 loader로 DB 조회 후 캐시에 저장
+    같은 키에 대한 동시 miss는 하나의 DB 조회 결과를 공유함
+    조회 중에 invalidate된 경우 조회 결과는 호출한 요청에만 반환하고 캐시에는 저장하지 않음
+    '''
+    while True:
+        try:
+            raw, generation = await get_redis().mget(key, generation_key(key))
+        except RedisError:
+            stats["errors"] += 1
+            raw = generation = None
+
+        if raw is not None:
+            stats["hits"] += 1
+            return model.model_validate_json(raw)
+
+        inflight = _inflight.get(key)
+        if inflight is None:
+            break
+
+        # 이미 다른 요청이 조회 중이면 그 결과를 기다림
+        stats["coalesced"] += 1
+        await asyncio.wait({inflight})
+        if not inflight.cancelled():
+            return inflight.result()
+        # 먼저 조회하던 요청이 취소된 경우 다시 시도
+
+    stats["misses"] += 1
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        obj = await loader()
+        value = model.model_validate(obj) if obj is not None else None
+        if value is not None:
+            try:
+                await _get_set_script()(
+                    keys=[key, generation_key(key)], args=[generation or "", value.model_dump_json(), CACHE_TTL]
+                )
+            except RedisError:
+                stats["errors"] += 1
+        future.set_result(value)
+        return value
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # 대기자가 없어도 경고가 남지 않도록 처리
+        raise
+    finally:
+        # invalidate 이후 같은 키를 다시 조회 중인 작업은 남겨 둠
+        if _inflight.get(key) is future:
+            del _inflight[key]
+
+
+async def invalidate(*keys: str):
+    '''
+    캐시 무효화
+    키의 세대를 올려 무효화 이전에 시작한 DB 조회 결과가 저장되지 않게 하고,
+    이후 요청이 그 조회 결과를 기다리지 않도록 진행 중인 조회에서 분리
+    '''
+    if not keys:
+        return
+    for key in keys:
+        _inflight.pop(key, None)
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.delete(*keys)
+            for key in keys:
+                pipe.incr(generation_key(key))
+                pipe.expire(generation_key(key), CACHE_TTL)
+            await pipe.execute()
+    except RedisError:
+        stats["errors"] += 1
+
+
+async def get_versions(*resources: str) -> Optional[list[int]]:
+    '''
+    리소스별 버전 조회, Redis 오류시 None
+    처음 조회하는 리소스는 현재 시각(ms)으로 시작하여 Redis 초기화 이전에 발급한 ETag와 겹치지 않게 함
+    '''
+    keys = [version_key(resource) for resource in resources]
+    try:
+        r = get_redis()
+        values = await r.mget(keys)
+        missing = [key for key, value in zip(keys, values) if value is None]
+        if missing:
+            now = int(time.time() * 1000)
+            async with r.pipeline(transaction=False) as pipe:
+                for key in missing:
+                    pipe.set(key, now, nx=True)
+                await pipe.execute()
+            values = await r.mget(keys)
+    except RedisError:
+        response_stats["errors"] += 1
+        return None
+    return [int(value) for value in values]
+
+async def bump(*resources: str):
+    '''
+    리소스 버전 증가 (이전 버전으로 만든 응답 본문과 ETag가 더 이상 쓰이지 않음)
+    '''
+    if not resources:
+        return
+    now = int(time.time() * 1000)
+    try:
+        async with get_redis().pipeline(transaction=False) as pipe:
+            for resource in dict.fromkeys(resources):
+                pipe.set(version_key(resource), now, nx=True)
+                pipe.incr(version_key(resource))
+            await pipe.execute()
+    except RedisError:
+        response_stats["errors"] += 1
+
+async def get_response(key: str) -> Optional[str]:
+    try:
+        return await get_redis().get(key)
+    except RedisError:
+        response_stats["errors"] += 1
+        return None
+
+async def set_response(key: str, body: str):
+    try:
+        await get_redis().set(key, body, ex=RESPONSE_CACHE_TTL)
+    except RedisError:
+        response_stats["errors"] += 1
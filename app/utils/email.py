@@ -1,20 +1,67 @@
 import os
+import json
+import time
+import uuid
+import asyncio
 import smtplib
+from functools import lru_cache
+from typing import Optional
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from jinja2 import Environment, FileSystemLoader
+from redis.exceptions import RedisError
+from app.utils.redis_client import get_redis
+from app.utils.instrumentation import observe_smtp
 
-EMAIL_HOST = "smtp.gmail.com"
-EMAIL_PORT = 587
+EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", 587))
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "true").lower() == "true"
 EMAIL_ADDRESS = os.getenv("EMAIL_USER")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASS")
 
-# 템플릿 환경 설정 (templates 폴더 기준)
-env = Environment(loader=FileSystemLoader("app/templates"))
+# 발송 큐 설정
+MAIL_WORKER_ENABLED = os.getenv("MAIL_WORKER_ENABLED", "true").lower() == "true"   # 앱 프로세스에서 워커 실행 여부
+MAIL_QUEUE_KEY = "mail:outbox"          # 발송 대기 (list)
+MAIL_RETRY_KEY = "mail:retry"           # 재시도 대기 (zset, score = 재시도 시각)
+MAIL_DEAD_KEY = "mail:dead"             # 발송 포기 (list, 최근 MAIL_DEAD_MAX건)
+MAIL_WORKERS_KEY = "mail:workers"       # 실행 중인 워커 id (set)
+MAIL_DEAD_MAX = 1000
+MAIL_WORKER_TTL = 30                    # 워커 생존 신호 유지 시간(초), 신호가 끊긴 워커의 처리 중 작업은 다른 워커가 회수
+MAIL_BATCH_SIZE = int(os.getenv("MAIL_BATCH_SIZE", 20))
+MAIL_MAX_ATTEMPTS = int(os.getenv("MAIL_MAX_ATTEMPTS", 5))
+MAIL_RETRY_BACKOFF = float(os.getenv("MAIL_RETRY_BACKOFF", 2))        # 재시도 간격(초), 시도마다 2배
+MAIL_SMTP_IDLE_TIMEOUT = float(os.getenv("MAIL_SMTP_IDLE_TIMEOUT", 60))  # 유휴 SMTP 연결 유지 시간(초)
 
-def send_email_code(to_email: str, code: str):
+TEMPLATES = ("email_verification.html",)
+
+_env = None
+
+def _environment():
+    '''
+    템플릿 환경 (templates 폴더 기준, 처음 사용할 때 생성)
+    '''
+    global _env
+    if _env is None:
+        from jinja2 import Environment, FileSystemLoader
+        _env = Environment(loader=FileSystemLoader("app/templates"), auto_reload=False)
+    return _env
+
+@lru_cache(maxsize=None)
+def get_template(name: str):
+    '''
+    컴파일한 템플릿을 프로세스 단위로 재사용 (파일 변경 확인 없이 처음 한 번만 읽음)
+    '''
+    return _environment().get_template(name)
+
+def load_templates():
+    '''
+    앱 시작시 메일 템플릿 미리 컴파일 (첫 메일 발송이 컴파일 비용을 떠안지 않도록)
+    '''
+    for name in TEMPLATES:
+        get_template(name)
+
+def build_email_code(to_email: str, code: str) -> MIMEMultipart:
     # HTML 템플릿 렌더링
-    template = env.get_template("email_verification.html")
+    template = get_template("email_verification.html")
     html_content = template.render(code=code)
 
     subject = "비밀번호 초기화 인증번호"
@@ -25,13 +72,282 @@ def send_email_code(to_email: str, code: str):
     msg["Subject"] = subject
 
     msg.attach(MIMEText(html_content, "html"))
+    return msg
+
+def processing_key(worker_id: str) -> str:
+    return f"mail:processing:{worker_id}"       # 워커가 꺼내서 발송 중인 작업 (list)
+
+def heartbeat_key(worker_id: str) -> str:
+    return f"mail:worker:{worker_id}"
+
+async def enqueue_email_code(to_email: str, code: str):
+    '''
+    인증번호 메일을 발송 큐에 등록 (실제 발송은 MailWorker가 처리)
+    '''
+    job = {"id": uuid.uuid4().hex, "to": to_email, "code": code, "attempts": 0}
+    await get_redis().lpush(MAIL_QUEUE_KEY, json.dumps(job))
+
+
+class SMTPSession:
+    '''
+    인증된 SMTP 연결을 여러 메일 발송에 재사용
+    smtplib은 blocking이므로 워커 스레드에서만 호출
+    '''
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def _connect(self):
+        server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT, timeout=30)
+        if EMAIL_USE_TLS:
+            server.starttls()
+        if EMAIL_ADDRESS and EMAIL_PASSWORD:
+            server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
+        self._server = server
+
+    def _ensure_connected(self):
+        if self._server is not None and time.monotonic() - self._last_used > MAIL_SMTP_IDLE_TIMEOUT:
+            # 오래 쉬었던 연결은 서버가 끊었을 수 있으므로 확인
+            try:
+                self._server.noop()
+            except smtplib.SMTPException:
+                self.close()
+        if self._server is None:
+            self._connect()
+
+    def send(self, msg: MIMEMultipart):
+        self._ensure_connected()
+        try:
+            self._server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # 연결이 끊긴 경우 한 번만 재연결 후 재전송
+            self.close()
+            self._connect()
+            self._server.send_message(msg)
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self):
+        if self._server is not None and time.monotonic() - self._last_used > MAIL_SMTP_IDLE_TIMEOUT:
+            self.close()
+
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._server = None
+
+
+class MailWorker:
+    '''
+    Redis 발송 큐를 소비하는 비동기 워커
+    한 번에 최대 MAIL_BATCH_SIZE건을 하나의 SMTP 세션으로 발송하고 실패시 backoff 후 재시도
+
+    작업은 발송 큐에서 워커별 처리 중 목록으로 옮긴 뒤(BLMOVE) 발송하고, 완료/재시도/폐기가 정해지면 목록에서 제거
+    프로세스가 발송 도중 종료되면 생존 신호가 끊긴 뒤 다른 워커(또는 재시작한 워커)가 처리 중 작업을 발송 큐로 되돌림
+    (이미 발송된 메일이 한 번 더 발송될 수 있음)
+    '''
+    def __init__(self):
+        self._session = SMTPSession()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.worker_id = uuid.uuid4().hex
+        self._processing_key = processing_key(self.worker_id)
+        self._last_heartbeat = 0.0
+
+    def start(self):
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 30):
+        '''
+        진행 중인 배치 발송을 마친 뒤 종료 (timeout 초과시 취소)
+        '''
+        if self._task is not None:
+            self._stopping = True
+            try:
+                await asyncio.wait_for(self._task, timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._task = None
+            try:
+                # 발송을 마치지 못한 작업은 발송 큐로 되돌리고 워커 등록 해제
+                await self._requeue_processing(self.worker_id)
+                await get_redis().srem(MAIL_WORKERS_KEY, self.worker_id)
+                await get_redis().delete(heartbeat_key(self.worker_id))
+            except RedisError as e:
+                print(f"[ERROR] 메일 워커 종료 처리 실패: {e}")
+        await asyncio.to_thread(self._session.close)
+
+    async def _run(self):
+        r = get_redis()
+        last_recovery = 0.0
+        while not self._stopping:
+            try:
+                await self._heartbeat()
+                if time.monotonic() - last_recovery > MAIL_WORKER_TTL:
+                    # 시작시, 이후 MAIL_WORKER_TTL마다 종료된 워커의 처리 중 작업 회수
+                    await self._recover_dead_workers()
+                    last_recovery = time.monotonic()
+                await self._requeue_due()
+
+                raw = await r.blmove(MAIL_QUEUE_KEY, self._processing_key, 1, "RIGHT", "LEFT")
+                if raw is None:
+                    await asyncio.to_thread(self._session.close_if_idle)
+                    continue
+
+                batch = [raw]
+                if MAIL_BATCH_SIZE > 1:
+                    async with r.pipeline(transaction=False) as pipe:
+                        for _ in range(MAIL_BATCH_SIZE - 1):
+                            pipe.lmove(MAIL_QUEUE_KEY, self._processing_key, "RIGHT", "LEFT")
+                        batch += [raw for raw in await pipe.execute() if raw is not None]
+
+                jobs = []
+                for raw in batch:
+                    try:
+                        job = json.loads(raw)
+                        if not isinstance(job, dict):
+                            raise ValueError("job is not an object")
+                    except ValueError as e:
+                        print(f"[ERROR] 잘못된 메일 작업 폐기: {raw[:200]!r}")
+                        await self._dead_letter(raw, f"invalid job: {e}")
+                        continue
+                    jobs.append((raw, job))
+
+                results = await asyncio.to_thread(self._deliver, [job for _, job in jobs])
+                for (raw, job), failure in zip(jobs, results):
+                    if failure is None:
+                        await r.lrem(self._processing_key, 1, raw)
+                    elif failure[0]:
+                        await self._schedule_retry(raw, job, failure[1])
+                    else:
+                        await self._dead_letter(raw, failure[1])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 예상하지 못한 오류도 워커는 계속 실행, 처리 중이던 작업은 발송 큐로 되돌림
+                print(f"[ERROR] 메일 큐 처리 실패: {e!r}")
+                try:
+                    await self._requeue_processing(self.worker_id)
+                except RedisError:
+                    pass
+                await asyncio.sleep(1)
+
+    def _deliver(self, jobs: list[dict]) -> list[Optional[tuple[bool, str]]]:
+        '''
+        배치 발송, 작업별 결과 반환 (None: 완료, (재시도 여부, 오류 내용): 실패)
+        '''
+        results: list[Optional[tuple[bool, str]]] = [None] * len(jobs)
+        for i, job in enumerate(jobs):
+            start = time.perf_counter()
+            try:
+                self._session.send(build_email_code(job["to"], job["code"]))
+                observe_smtp("sent", time.perf_counter() - start)
+                print(f"[SUCCESS] 인증번호 이메일 전송 완료 → {job['to']} (job={job.get('id')})")
+            except smtplib.SMTPRecipientsRefused as e:
+                # 일시적 거부(4xx)는 재시도, 영구 거부(5xx)는 재시도해도 실패하므로 바로 폐기 목록으로
+                observe_smtp("refused", time.perf_counter() - start)
+                print(f"[ERROR] 이메일 전송 실패 (job={job.get('id')}): {e}")
+                transient = any(400 <= code < 500 for code, _ in e.recipients.values())
+                results[i] = (transient, repr(e))
+            except (smtplib.SMTPConnectError, smtplib.SMTPAuthenticationError,
+                    smtplib.SMTPServerDisconnected) as e:
+                # 연결 오류는 남은 메일까지 모두 재시도로 넘김
+                observe_smtp("connection_error", time.perf_counter() - start)
+                print(f"[ERROR] 이메일 전송 실패 (job={job.get('id')}): {e}")
+                self._session.close()
+                results[i:] = [(True, repr(e))] * (len(jobs) - i)
+                break
+            except smtplib.SMTPException as e:
+                observe_smtp("error", time.perf_counter() - start)
+                print(f"[ERROR] 이메일 전송 실패 (job={job.get('id')}): {e}")
+                results[i] = (True, repr(e))
+            except OSError as e:
+                # 소켓 오류 (SMTPException도 OSError이므로 그 뒤에 처리)
+                observe_smtp("connection_error", time.perf_counter() - start)
+                print(f"[ERROR] 이메일 전송 실패 (job={job.get('id')}): {e}")
+                self._session.close()
+                results[i:] = [(True, repr(e))] * (len(jobs) - i)
+                break
+            except Exception as e:
+                # SMTP 오류 외에 템플릿 렌더링, 잘못된 작업 내용 등도 해당 작업만 재시도로 넘김
+                observe_smtp("error", time.perf_counter() - start)
+                print(f"[ERROR] 이메일 전송 실패 (job={job.get('id')}): {e!r}")
+                results[i] = (True, repr(e))
+        return results
+
+    async def _schedule_retry(self, raw: str, job: dict, error: str):
+        '''
+        backoff 후 재시도 대기열로 이동, 재시도 횟수를 넘으면 폐기 목록으로 이동
+        '''
+        job["attempts"] = job.get("attempts", 0) + 1
+        if job["attempts"] >= MAIL_MAX_ATTEMPTS:
+            print(f"[ERROR] 이메일 재시도 횟수 초과 → {job.get('to')} (job={job.get('id')})")
+            await self._dead_letter(raw, error)
+            return
+        retry_at = time.time() + MAIL_RETRY_BACKOFF * (2 ** (job["attempts"] - 1))
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.zadd(MAIL_RETRY_KEY, {json.dumps(job): retry_at})
+            pipe.lrem(self._processing_key, 1, raw)
+            await pipe.execute()
+
+    async def _dead_letter(self, raw: str, error: str):
+        '''
+        발송을 포기한 작업을 오류 내용과 함께 MAIL_DEAD_KEY에 보관
+        '''
+        entry = json.dumps({"job": raw, "error": error, "failed_at": time.time()})
+        async with get_redis().pipeline(transaction=True) as pipe:
+            pipe.lpush(MAIL_DEAD_KEY, entry)
+            pipe.ltrim(MAIL_DEAD_KEY, 0, MAIL_DEAD_MAX - 1)
+            pipe.lrem(self._processing_key, 1, raw)
+            await pipe.execute()
+
+    async def _heartbeat(self):
+        if time.monotonic() - self._last_heartbeat < MAIL_WORKER_TTL / 3:
+            return
+        async with get_redis().pipeline(transaction=False) as pipe:
+            pipe.sadd(MAIL_WORKERS_KEY, self.worker_id)
+            pipe.set(heartbeat_key(self.worker_id), 1, ex=MAIL_WORKER_TTL)
+            await pipe.execute()
+        self._last_heartbeat = time.monotonic()
+
+    async def _requeue_processing(self, worker_id: str) -> int:
+        '''
+        워커의 처리 중 작업을 발송 큐로 되돌림 (LMOVE는 원자적이므로 여러 워커가 동시에 회수해도 중복되지 않음)
+        '''
+        r = get_redis()
+        moved = 0
+        while await r.lmove(processing_key(worker_id), MAIL_QUEUE_KEY, "RIGHT", "RIGHT") is not None:
+            moved += 1
+        return moved
+
+    async def _recover_dead_workers(self):
+        '''
+        생존 신호가 끊긴 워커의 처리 중 작업 회수
+        '''
+        r = get_redis()
+        for worker_id in await r.smembers(MAIL_WORKERS_KEY):
+            if worker_id == self.worker_id or await r.exists(heartbeat_key(worker_id)):
+                continue
+            moved = await self._requeue_processing(worker_id)
+            await r.srem(MAIL_WORKERS_KEY, worker_id)
+            if moved:
+                print(f"[INFO] 종료된 메일 워커({worker_id})의 작업 {moved}건을 발송 큐로 되돌림")
+
+    async def _requeue_due(self):
+        '''
+        재시도 시각이 지난 작업을 발송 큐로 이동
+        여러 워커가 동시에 실행되어도 zrem에 성공한 워커만 이동시킴
+        '''
+        r = get_redis()
+        due = await r.zrangebyscore(MAIL_RETRY_KEY, 0, time.time(), start=0, num=MAIL_BATCH_SIZE)
+        for raw in due:
+            if await r.zrem(MAIL_RETRY_KEY, raw):
+                await r.lpush(MAIL_QUEUE_KEY, raw)
+
 
-    try:
-        server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT)
-        server.starttls()
-        server.login(EMAIL_ADDRESS, EMAIL_PASSWORD)
-        server.send_message(msg)
-        server.quit()
-        print(f"[SUCCESS] 인증번호 이메일 전송 완료 → {to_email}")
-    except Exception as e:
-        print(f"[ERROR] 이메일 전송 실패: {e}")
+mail_worker = MailWorker()
@@ -0,0 +1,31 @@
+from typing import Iterable, Optional
+from fastapi import Response
+from pydantic_core import to_json
+
+
+class RawJSONResponse(Response):
+    '''
+    이미 JSON으로 직렬화된 bytes를 그대로 반환하는 응답
+    route에서 Response를 반환하면 FastAPI는 response_model 검증/직렬화를 건너뜀
+    (response_model은 문서용으로만 사용)
+    '''
+    media_type = "application/json"
+
+
+def rows_to_dicts(rows: Iterable) -> list[dict]:
+    '''
+    컬럼 단위로 조회한 Row 목록 → dict 목록
+    '''
+    return [row._asdict() for row in rows]
+
+def json_response(content) -> RawJSONResponse:
+    '''
+    dict/list를 pydantic-core(Rust)로 한 번에 직렬화
+    '''
+    return RawJSONResponse(to_json(content))
+
+def rows_response(rows: Iterable) -> RawJSONResponse:
+    return json_response(rows_to_dicts(rows))
+
+def page_response(items: list, next_cursor: Optional[str]) -> RawJSONResponse:
+    return json_response({"items": items, "next_cursor": next_cursor})
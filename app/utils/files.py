@@ -1,14 +1,345 @@
 import os
+import hashlib
+import mimetypes
+import tempfile
+import zipfile
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Iterator, Optional
+from fastapi import HTTPException, Request
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+from python_multipart.multipart import MultipartParser, parse_options_header
+from python_multipart.exceptions import MultipartParseError
 
 
 ALLOWED_EXTENSIONS = {'.txt', '.png'}
 UPLOAD_DIR = 'app/uploads'
+UPLOAD_TMP_DIR = os.path.join(UPLOAD_DIR, '.tmp')   # 업로드 중인 임시 파일 (UPLOAD_DIR과 같은 파일시스템)
+BLOB_DIR = os.path.join(UPLOAD_DIR, 'blobs')         # 내용 해시 기반 저장소 (blobs/ab/cd/<sha256>)
 MAX_FILE_SIZE = 16 * 1024 * 1024 # 16MB
+MULTIPART_OVERHEAD = 64 * 1024   # Content-Length 사전 검사시 허용하는 multipart 헤더/경계 크기
+ZIP_CHUNK_SIZE = 256 * 1024      # zip 스트리밍시 원본 파일을 읽는 단위
+STORED_EXTENSIONS = {'.png'}     # 이미 압축된 형식은 재압축하지 않고 그대로 저장
 
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+def ensure_upload_dirs():
+    '''
+    업로드 디렉토리 생성 (앱 시작시, 파일 관리 스크립트 실행시)
+    '''
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    os.makedirs(UPLOAD_TMP_DIR, exist_ok=True)
+    os.makedirs(BLOB_DIR, exist_ok=True)
 
 def allowed_file(filename: str) -> bool:
     '''
     확장자 확인 함수
     '''
     return os.path.splitext(filename)[1].lower() in ALLOWED_EXTENSIONS
+
+def guess_content_type(filename: str) -> str:
+    return mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+def blob_path(sha256: str) -> str:
+    '''
+    내용 해시 → 저장 경로 (디렉토리당 파일 수를 줄이기 위해 앞 4자리로 2단계 분산)
+    '''
+    return os.path.join(BLOB_DIR, sha256[:2], sha256[2:4], sha256)
+
+def store_blob(src_path: str, sha256: str):
+    '''
+    파일을 내용 해시 저장소로 원자적으로 이동
+    '''
+    dest = blob_path(sha256)
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    os.replace(src_path, dest)
+
+def remove_blob(sha256: str):
+    try:
+        os.unlink(blob_path(sha256))
+    except FileNotFoundError:
+        pass
+
+def file_too_large() -> HTTPException:
+    return HTTPException(status_code=433, detail={'error': 'File too large'})
+
+
+class StagedUpload:
+    '''
+    임시 디렉토리에 저장이 끝난 업로드 파일
+    '''
+    def __init__(self, filename: str, path: str, size: int, content_type: str, sha256: str):
+        self.filename = filename
+        self.path = path
+        self.size = size
+        self.content_type = content_type
+        self.sha256 = sha256
+
+    def store(self):
+        '''
+        내용 해시 저장소로 이동 (같은 내용이 이미 저장된 경우에는 호출하지 않음)
+        '''
+        store_blob(self.path, self.sha256)
+
+    def discard(self):
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class _UploadReceiver:
+    '''
+    multipart 요청 본문을 청크 단위로 파싱하여 field 이름의 첫 번째 파일만 임시 파일에 기록
+    기록과 동시에 sha256 계산
+    '''
+    def __init__(self, field: str, max_size: int):
+        self.field = field
+        self.max_size = max_size
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+        self.file = None
+        self.size = 0
+        self.digest = hashlib.sha256()
+        self._in_target = False
+        self._header_name = b""
+        self._header_value = b""
+        self._disposition = b""
+        self._part_content_type = b""
+        self._pending: list[bytes] = []
+
+    def on_part_begin(self):
+        self._in_target = False
+        self._disposition = b""
+        self._part_content_type = b""
+
+    def on_header_field(self, data: bytes, start: int, end: int):
+        self._header_name += data[start:end]
+
+    def on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def on_header_end(self):
+        field = self._header_name.lower()
+        if field == b"content-disposition":
+            self._disposition = self._header_value
+        elif field == b"content-type":
+            self._part_content_type = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def on_headers_finished(self):
+        _, options = parse_options_header(self._disposition)
+        name = options.get(b"name", b"").decode("utf-8", errors="replace")
+        filename = options.get(b"filename")
+        if name != self.field or not filename or self.file is not None:
+            return
+
+        self.filename = os.path.basename(filename.decode("utf-8", errors="replace"))
+        content_type = self._part_content_type.decode("latin-1").strip()
+        if not content_type or content_type == "application/octet-stream":
+            content_type = guess_content_type(self.filename)
+        self.content_type = content_type
+        self.file = tempfile.NamedTemporaryFile(dir=UPLOAD_TMP_DIR, prefix="upload-", delete=False)
+        self._in_target = True
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        if not self._in_target:
+            return
+        self.size += end - start
+        # 제한 크기를 넘는 순간 중단
+        if self.size > self.max_size:
+            raise file_too_large()
+        self._pending.append(data[start:end])
+
+    def on_part_end(self):
+        self._in_target = False
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+            "on_part_end": self.on_part_end,
+            "on_header_field": self.on_header_field,
+            "on_header_value": self.on_header_value,
+            "on_header_end": self.on_header_end,
+            "on_headers_finished": self.on_headers_finished,
+        }
+
+    def _write(self, chunk: bytes):
+        self.file.write(chunk)
+        self.digest.update(chunk)
+
+    async def flush(self):
+        if self._pending:
+            chunk = b"".join(self._pending)
+            self._pending.clear()
+            await run_in_threadpool(self._write, chunk)
+
+    def cleanup(self):
+        if self.file is not None:
+            self.file.close()
+            try:
+                os.unlink(self.file.name)
+            except FileNotFoundError:
+                pass
+
+
+async def receive_upload(
+    request: Request,
+    field: str = "file",
+    max_size: int = MAX_FILE_SIZE,
+    validate: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> Optional[StagedUpload]:
+    '''
+    요청 본문을 메모리에 올리지 않고 스트리밍으로 임시 파일에 저장
+    validate는 파일 이름을 알게 된 직후, 본문을 기록하기 전에 호출됨
+    파일 파트가 없으면 None 반환
+    '''
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    if content_type != b"multipart/form-data" or b"boundary" not in params:
+        return None
+
+    # Content-Length로 명백히 큰 요청은 본문을 읽기 전에 거절
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+        raise file_too_large()
+
+    receiver = _UploadReceiver(field, max_size)
+    parser = MultipartParser(params[b"boundary"], receiver.callbacks())
+    validated = validate is None
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if receiver.file is not None:
+                # 파일 본문을 기록하기 전에 이름/확장자 검사
+                if not validated:
+                    await validate(receiver.filename)
+                    validated = True
+                await receiver.flush()
+        parser.finalize()
+        if receiver.file is None:
+            return None
+        await receiver.flush()
+        await run_in_threadpool(receiver.file.close)
+    except MultipartParseError:
+        receiver.cleanup()
+        raise HTTPException(status_code=400, detail={'error': 'Invalid multipart body'})
+    except BaseException:
+        receiver.cleanup()
+        raise
+
+    return StagedUpload(
+        receiver.filename,
+        receiver.file.name,
+        receiver.size,
+        receiver.content_type,
+        receiver.digest.hexdigest(),
+    )
+
+
+class _ZipStream:
+    '''
+    zipfile이 기록한 바이트를 모아두는 쓰기 전용 스트림
+    seek를 지원하지 않으므로 zipfile은 data descriptor 방식으로 기록함
+    '''
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(entries: list[tuple[str, str]]) -> Iterator[bytes]:
+    '''
+    (파일 경로, zip 내부 이름) 목록을 압축하면서 청크 단위로 반환
+    동기 제너레이터이므로 StreamingResponse가 스레드풀에서 실행함 (압축이 이벤트 루프를 막지 않음)
+    '''
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, 'w') as zipf:
+        for path, arcname in entries:
+            zinfo = zipfile.ZipInfo.from_file(path, arcname=arcname)
+            if os.path.splitext(arcname)[1].lower() in STORED_EXTENSIONS:
+                zinfo.compress_type = zipfile.ZIP_STORED
+            else:
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+
+            with open(path, 'rb') as src, zipf.open(zinfo, 'w') as dest:
+                while chunk := src.read(ZIP_CHUNK_SIZE):
+                    dest.write(chunk)
+                    data = stream.drain()
+                    if data:
+                        yield data
+            data = stream.drain()
+            if data:
+                yield data
+    # central directory
+    yield stream.drain()
+
+
+def hash_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while chunk := f.read(ZIP_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def file_etag(sha256: str) -> str:
+    '''
+    메타데이터 인덱스에 저장된 내용 해시 기반 strong ETag
+    '''
+    return f'"{sha256}"'
+
+def is_not_modified(headers, etag: str, mtime: float) -> bool:
+    '''
+    If-None-Match / If-Modified-Since 조건부 요청 처리 (If-None-Match 우선)
+    '''
+    if_none_match = headers.get('if-none-match')
+    if if_none_match is not None:
+        if if_none_match.strip() == '*':
+            return True
+        # If-None-Match는 weak 비교 (W/ 접두사 무시)
+        tags = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+        return etag.removeprefix('W/') in tags
+
+    if_modified_since = headers.get('if-modified-since')
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(mtime) <= since
+    return False
+
+
+class RangeFileResponse(FileResponse):
+    '''
+    여러 구간 Range 응답의 Content-Type 보정
+    starlette 0.47은 multipart/byteranges 값을 Content-Range 헤더에 기록하므로 Content-Type으로 옮김
+    '''
+    async def _handle_multiple_ranges(self, send, ranges, file_size, send_header_only):
+        async def fixed_send(message):
+            if message["type"] == "http.response.start":
+                headers = []
+                for name, value in message["headers"]:
+                    if name == b"content-type":
+                        continue
+                    if name == b"content-range" and value.startswith(b"multipart/byteranges"):
+                        name = b"content-type"
+                    headers.append((name, value))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await super()._handle_multiple_ranges(fixed_send, ranges, file_size, send_header_only)
@@ -0,0 +1,86 @@
+import hashlib
+from typing import Awaitable, Callable, Optional
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import is_current
+from app.utils import cache
+from app.utils.fast_json import RawJSONResponse
+
+# 라우트별 Cache-Control (매번 ETag로 재검증, 이메일이 포함된 사용자 정보는 공유 캐시에 저장하지 않음)
+CACHE_CONTROL_PUBLIC = "public, no-cache"
+CACHE_CONTROL_PRIVATE = "private, no-cache"
+
+
+def make_etag(resources: tuple[str, ...], versions: list[int]) -> str:
+    '''
+    리소스 버전 기반 weak ETag
+    '''
+    return 'W/"' + ";".join(f"{resource}.{version}" for resource, version in zip(resources, versions)) + '"'
+
+def etag_matches(headers, etag: str) -> bool:
+    '''
+    If-None-Match weak 비교
+    '''
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+def request_key(request: Request) -> str:
+    '''
+    경로 + 정렬한 쿼리 문자열 해시
+    '''
+    query = "&".join(sorted(f"{k}={v}" for k, v in request.query_params.multi_items()))
+    return hashlib.sha1(f"{request.url.path}?{query}".encode()).hexdigest()
+
+
+async def cached_response(
+    request: Request,
+    resources: tuple[str, ...],
+    build: Callable[[], Awaitable[Response]],
+    cache_control: str,
+    db: Optional[AsyncSession] = None,
+) -> Response:
+    '''
+    버전 기반 응답 캐시
+    1. If-None-Match가 현재 ETag와 같으면 DB 조회 없이 304
+    2. 같은 버전으로 직렬화해 둔 본문이 있으면 그대로 반환
+    3. 없으면 build로 응답을 만들고 본문 저장 (200 응답만)
+    Redis를 사용할 수 없으면 캐시 없이 build 결과 반환
+
+    build가 db(복제본일 수 있는 세션)로 조회하는 경우
+    - 지연 중인 복제본에서 만든 응답은 현재 버전의 변경이 빠져 있을 수 있으므로 저장하지 않고 ETag도 붙이지 않음
+    - 조회 중에 버전이 바뀌면 저장하지 않음
+    '''
+    versions = await cache.get_versions(*resources)
+    if versions is None:
+        response = await build()
+        response.headers["cache-control"] = cache_control
+        return response
+
+    etag = make_etag(resources, versions)
+    headers = {"etag": etag, "cache-control": cache_control}
+    if etag_matches(request.headers, etag):
+        cache.response_stats["not_modified"] += 1
+        return Response(status_code=304, headers=headers)
+
+    key = cache.response_key(request_key(request), etag)
+    body = await cache.get_response(key)
+    if body is not None:
+        cache.response_stats["hits"] += 1
+        return RawJSONResponse(body, headers=headers)
+
+    cache.response_stats["misses"] += 1
+    response = await build()
+    if db is not None and not is_current(db):
+        cache.response_stats["stale_reads"] += 1
+        response.headers["cache-control"] = cache_control
+        return response
+    if response.status_code == 200:
+        if db is None or await cache.get_versions(*resources) == versions:
+            await cache.set_response(key, response.body.decode())
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,173 @@
+import os
+import time
+from contextvars import ContextVar
+from typing import Optional
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, REGISTRY,
+)
+from prometheus_client.multiprocess import MultiProcessCollector, mark_process_dead
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+# 여러 워커 프로세스 실행시 지표를 합산하기 위한 디렉토리 (prometheus_client multiprocess 모드)
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+# 빠른 연산(DB 쿼리, Redis 명령)용 버킷
+FAST_BUCKETS = (.0005, .001, .0025, .005, .01, .025, .05, .1, .25, .5, 1)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간", ["method", "route", "status"],
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "처리 중인 요청 수", ["method"], multiprocess_mode="livesum",
+)
+DB_QUERIES = Histogram(
+    "http_request_db_queries", "요청당 DB 쿼리 수", ["route"], buckets=COUNT_BUCKETS,
+)
+DB_TIME = Histogram(
+    "http_request_db_seconds", "요청당 DB 쿼리 시간 합계", ["route"], buckets=FAST_BUCKETS,
+)
+DB_QUERY_LATENCY = Histogram(
+    "db_query_duration_seconds", "DB 쿼리 실행 시간", buckets=FAST_BUCKETS,
+)
+REDIS_LATENCY = Histogram(
+    "redis_command_duration_seconds", "Redis 명령 실행 시간", ["command"], buckets=FAST_BUCKETS,
+)
+REDIS_TIME = Histogram(
+    "http_request_redis_seconds", "요청당 Redis 명령 시간 합계", ["route"], buckets=FAST_BUCKETS,
+)
+BCRYPT_LATENCY = Histogram(
+    "bcrypt_duration_seconds", "bcrypt 작업 시간 (풀 대기 포함)", ["operation"],
+)
+BCRYPT_TIME = Histogram(
+    "http_request_bcrypt_seconds", "요청당 bcrypt 작업 시간 합계", ["route"],
+)
+SMTP_LATENCY = Histogram(
+    "smtp_send_duration_seconds", "메일 한 건 발송 시간", ["result"],
+)
+MAIL_SENT = Counter(
+    "mail_sent_total", "메일 발송 결과", ["result"],
+)
+
+
+class RequestStats:
+    '''
+    요청 하나에서 발생한 DB/Redis/bcrypt 작업 누적값
+    '''
+    __slots__ = ("db_queries", "db_seconds", "redis_seconds", "bcrypt_seconds")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.redis_seconds = 0.0
+        self.bcrypt_seconds = 0.0
+
+
+# 현재 요청의 누적값 (요청 밖에서 실행되는 작업은 None)
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def observe_redis(command: str, elapsed: float):
+    REDIS_LATENCY.labels(command).observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.redis_seconds += elapsed
+
+def observe_bcrypt(operation: str, elapsed: float):
+    BCRYPT_LATENCY.labels(operation).observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.bcrypt_seconds += elapsed
+
+def observe_smtp(result: str, elapsed: float):
+    SMTP_LATENCY.labels(result).observe(elapsed)
+    MAIL_SENT.labels(result).inc()
+
+
+# SQLAlchemy 이벤트 훅 (primary/replica 모든 엔진에 적용)
+# AsyncSession의 동기 코드는 요청과 같은 contextvars 컨텍스트의 greenlet에서 실행됨
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    DB_QUERY_LATENCY.observe(elapsed)
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.db_queries += 1
+        stats.db_seconds += elapsed
+
+def _handle_error(exception_context):
+    # 실패한 쿼리의 시작 시각 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+if METRICS_ENABLED:
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+
+class MetricsMiddleware:
+    '''
+    라우트별 요청 처리 시간, 처리 중인 요청 수, 요청당 DB/Redis/bcrypt 시간 기록
+    라우트는 매칭된 경로 템플릿(/users/{user_id})으로 기록하여 라벨 수를 제한
+    '''
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            _request_stats.reset(token)
+            route = scope.get("route")
+            path = route.path if route is not None else "<unmatched>"
+            REQUEST_LATENCY.labels(method, path, str(status)).observe(elapsed)
+            DB_QUERIES.labels(path).observe(stats.db_queries)
+            DB_TIME.labels(path).observe(stats.db_seconds)
+            REDIS_TIME.labels(path).observe(stats.redis_seconds)
+            if stats.bcrypt_seconds:
+                BCRYPT_TIME.labels(path).observe(stats.bcrypt_seconds)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    '''
+    Prometheus text 형식 출력 (multiprocess 모드면 모든 워커 합산)
+    '''
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_stopped():
+    '''
+    워커 종료시 multiprocess 모드의 livesum gauge(처리 중인 요청 수)에서 제외
+    '''
+    if PROMETHEUS_MULTIPROC_DIR:
+        mark_process_dead(os.getpid())
@@ -1,14 +1,17 @@
 import os
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from jose import jwt, JWTError
 from fastapi import HTTPException
-
-SECRET_KEY = os.getenv("SECRET_KEY")
-if not SECRET_KEY:
-    raise ValueError("SECRET_KEY is not set in environment variables.")
+from app.config import settings
 
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", 10000))   # 검증된 토큰을 기억하는 최대 개수
+
+# 검증이 끝난 토큰 → (payload, 만료 시각) LRU
+_verified: "OrderedDict[str, tuple[dict, float]]" = OrderedDict()
 
 '''
 토큰 생성
@@ -17,14 +20,36 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, settings.secret_key, algorithm=ALGORITHM)
 
 '''
 토큰 복호화
 '''
 def decode_token(token: str) -> dict:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
         return payload
     except JWTError:
-        raise HTTPException(status_code=403, detail="유효하지 않은 토큰입니다.")
\ No newline at end of file
+        raise HTTPException(status_code=403, detail="유효하지 않은 토큰입니다.")
+
+'''
+토큰 복호화 (검증 결과 캐시)
+같은 토큰은 exp까지 서명 검증을 다시 하지 않음
+'''
+def decode_token_cached(token: str) -> dict:
+    now = time.time()
+    cached = _verified.get(token)
+    if cached is not None:
+        payload, expires_at = cached
+        if now < expires_at:
+            _verified.move_to_end(token)
+            return payload
+        del _verified[token]
+
+    payload = decode_token(token)
+    expires_at = payload.get("exp")
+    if isinstance(expires_at, (int, float)):
+        _verified[token] = (payload, float(expires_at))
+        if len(_verified) > TOKEN_CACHE_SIZE:
+            _verified.popitem(last=False)
+    return payload
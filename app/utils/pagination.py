@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+import os
+from typing import Optional
+from fastapi import HTTPException
+
+PAGE_MAX_LIMIT = int(os.getenv("PAGE_MAX_LIMIT", 100))           # 목록 조회 API의 limit 최대값
+INCLUDE_POSTS_LIMIT = int(os.getenv("INCLUDE_POSTS_LIMIT", 20))  # include=posts에서 사용자마다 포함하는 최대 게시글 수
+
+'''
+커서 생성
+'''
+def encode_cursor(**fields) -> str:
+    raw = json.dumps(fields, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+'''
+커서 복호화
+'''
+def decode_cursor(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+    return data
+
+def decode_id_cursor(cursor: str) -> int:
+    '''
+    기본키(id) 기반 커서에서 마지막 id 추출
+    빈 문자열은 첫 페이지를 의미함
+    '''
+    if not cursor:
+        return 0
+    last_id = decode_cursor(cursor).get("id")
+    if not isinstance(last_id, int) or last_id < 0:
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+    return last_id
+
+def decode_score_cursor(cursor: str) -> Optional[tuple[float, int]]:
+    '''
+    (점수, id) 기반 커서 복호화 (검색 결과 페이징)
+    빈 문자열은 첫 페이지를 의미함
+    '''
+    if not cursor:
+        return None
+    data = decode_cursor(cursor)
+    score, last_id = data.get("score"), data.get("id")
+    if not isinstance(score, (int, float)) or not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+    return float(score), last_id
@@ -0,0 +1,138 @@
+import math
+import os
+import uuid
+from typing import Awaitable, Callable, Optional
+from fastapi import HTTPException, Request
+from redis.exceptions import RedisError
+from app.utils.redis_client import get_redis
+
+# 프로세스 단위 통계 (허용 / 제한 / redis 오류로 검사 생략)
+stats = {"allowed": 0, "limited": 0, "errors": 0}
+
+# KEYS[1] = 제한 키, ARGV = (허용 횟수, 구간(ms), 요청 고유값)
+# 구간 안의 요청 시각을 zset으로 유지, 허용이면 0 / 제한이면 다시 시도할 수 있을 때까지 남은 ms 반환
+SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+if redis.call('ZCARD', KEYS[1]) < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return 0
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return math.max(1, tonumber(oldest[2]) + window - now)
+"""
+
+# KEYS[1] = 제한 키, ARGV = (버킷 크기, 구간(ms))
+# 구간마다 버킷 크기만큼 토큰이 고르게 채워짐, 허용이면 0 / 제한이면 토큰 1개가 찰 때까지 남은 ms 반환
+TOKEN_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local capacity = tonumber(ARGV[1])
+local rate = capacity / tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], tonumber(ARGV[2]))
+return wait
+"""
+
+ALGORITHMS = {"sliding_window": SLIDING_WINDOW_LUA, "token_bucket": TOKEN_BUCKET_LUA}
+
+
+def parse_rate(rate: str) -> tuple[int, float]:
+    '''
+    "횟수/초" 형식 (예: "5/60" → 60초에 5회)
+    '''
+    count, _, seconds = rate.partition("/")
+    return int(count), float(seconds or 1)
+
+
+async def by_ip(request: Request) -> Optional[str]:
+    '''
+    클라이언트 IP (프록시 뒤에서는 uvicorn --proxy-headers 사용)
+    '''
+    return request.client.host if request.client else None
+
+async def by_email(request: Request) -> Optional[str]:
+    '''
+    JSON 본문의 email 필드 (본문은 FastAPI가 이미 읽어 둔 것을 재사용)
+    '''
+    try:
+        body = await request.json()
+    except ValueError:
+        return None
+    email = body.get("email") if isinstance(body, dict) else None
+    return email.strip().lower() if isinstance(email, str) else None
+
+
+class RateLimit:
+    '''
+    Redis 기반 요청 제한 의존성
+    router.post(..., dependencies=[Depends(RateLimit("login", "5/60", key=by_email))])
+    제한 키는 rl:<name>:<경로>:<key 함수 결과> 이며, 제한되면 429와 Retry-After 반환
+    Redis 오류시에는 요청을 막지 않음
+    '''
+    def __init__(
+        self,
+        name: str,
+        rate: str,
+        key: Callable[[Request], Awaitable[Optional[str]]] = by_ip,
+        algorithm: str = "sliding_window",
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown rate limit algorithm: {algorithm}")
+        self.name = name
+        self.limit, self.period = parse_rate(os.getenv(f"RATE_LIMIT_{name.upper()}", rate))
+        self.key = key
+        self.algorithm = algorithm
+        self._script = None
+
+    def _get_script(self):
+        client = get_redis()
+        # redis 클라이언트가 다시 만들어진 경우 스크립트도 다시 등록
+        if self._script is None or self._script.registered_client is not client:
+            self._script = client.register_script(ALGORITHMS[self.algorithm])
+        return self._script
+
+    async def __call__(self, request: Request):
+        if self.limit <= 0:
+            return
+        value = await self.key(request)
+        if value is None:
+            return
+
+        route = request.scope.get("route")
+        path = route.path if route is not None else request.url.path
+        key = f"rl:{self.name}:{path}:{value}"
+        period_ms = int(self.period * 1000)
+        if self.algorithm == "sliding_window":
+            args = [self.limit, period_ms, uuid.uuid4().hex]
+        else:
+            args = [self.limit, period_ms]
+
+        try:
+            wait_ms = int(await self._get_script()(keys=[key], args=args))
+        except RedisError:
+            stats["errors"] += 1
+            return
+
+        if wait_ms > 0:
+            stats["limited"] += 1
+            raise HTTPException(
+                status_code=429,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": str(math.ceil(wait_ms / 1000))},
+            )
+        stats["allowed"] += 1
@@ -0,0 +1,219 @@
+import asyncio
+import heapq
+import html
+import math
+import os
+import re
+from collections import defaultdict
+from typing import Optional
+
+SEARCH_BACKEND = os.getenv("SEARCH_BACKEND", "fulltext")    # fulltext (MySQL FULLTEXT) | memory (프로세스 내 역색인)
+SEARCH_REBUILD_INTERVAL = float(os.getenv("SEARCH_REBUILD_INTERVAL", 300))   # memory 방식 전체 재구성 주기(초), 0이면 재구성 안함
+NGRAM_SIZE = 2      # MySQL ngram_token_size 기본값과 동일
+
+_WORD = re.compile(r"\w+")
+_HANGUL = re.compile(r"[가-힣]")
+
+# BM25 파라미터
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: Optional[str]) -> list[str]:
+    '''
+    소문자 단어 단위로 분리, 한글 단어는 ngram parser처럼 2글자 단위로 분리
+    '''
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        if _HANGUL.search(word) and len(word) > NGRAM_SIZE:
+            tokens += [word[i:i + NGRAM_SIZE] for i in range(len(word) - NGRAM_SIZE + 1)]
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def highlight(text: Optional[str], query: str) -> Optional[str]:
+    '''
+    검색어 토큰이 나타나는 부분을 <mark>로 감싼 HTML 반환 (원문은 escape 처리)
+    '''
+    if text is None:
+        return None
+    words = sorted(set(tokenize(query)), key=len, reverse=True)
+    if not words:
+        return html.escape(text)
+    pattern = re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+
+    parts, last = [], 0
+    for m in pattern.finditer(text):
+        parts.append(html.escape(text[last:m.start()]))
+        parts.append(f"<mark>{html.escape(m.group())}</mark>")
+        last = m.end()
+    parts.append(html.escape(text[last:]))
+    return "".join(parts)
+
+
+class InvertedIndex:
+    '''
+    게시글 제목/내용 역색인 (FULLTEXT를 사용할 수 없는 환경용)
+    CRUD 쓰기 경로에서 증분 갱신하며, 점수는 BM25
+    프로세스마다 별도로 유지되므로 여러 워커로 실행하면 다른 워커의 변경은 주기적 재구성 때 반영됨
+    '''
+    def __init__(self):
+        self._postings: dict[str, dict[int, int]] = defaultdict(dict)   # 토큰 → {게시글 id: 출현 수}
+        self._docs: dict[int, dict[str, int]] = {}                       # 게시글 id → {토큰: 출현 수}
+        self._lengths: dict[int, int] = {}
+        self._total_length = 0
+        self._task: Optional[asyncio.Task] = None
+        # 재구성 중에 들어온 증분 갱신 (게시글 id, (제목, 내용) 또는 삭제면 None), 새 색인에 다시 반영
+        self._pending: Optional[list[tuple[int, Optional[tuple]]]] = None
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, post_id: int, title: Optional[str], description: Optional[str]):
+        if self._pending is not None:
+            self._pending.append((post_id, (title, description)))
+        self._remove(post_id)
+        tokens = tokenize(title) + tokenize(description)
+        counts: dict[str, int] = defaultdict(int)
+        for token in tokens:
+            counts[token] += 1
+        for token, count in counts.items():
+            self._postings[token][post_id] = count
+        self._docs[post_id] = dict(counts)
+        self._lengths[post_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, post_id: int):
+        if self._pending is not None:
+            self._pending.append((post_id, None))
+        self._remove(post_id)
+
+    def _remove(self, post_id: int):
+        counts = self._docs.pop(post_id, None)
+        if counts is None:
+            return
+        for token in counts:
+            postings = self._postings[token]
+            postings.pop(post_id, None)
+            if not postings:
+                del self._postings[token]
+        self._total_length -= self._lengths.pop(post_id)
+
+    def clear(self):
+        self._postings.clear()
+        self._docs.clear()
+        self._lengths.clear()
+        self._total_length = 0
+
+    def search(self, query: str, limit: int, after: Optional[tuple[float, int]] = None) -> list[tuple[float, int]]:
+        '''
+        (점수, 게시글 id) 목록을 점수 내림차순, id 내림차순으로 반환
+        after가 있으면 그 다음 항목부터 반환
+        전체를 정렬하지 않고 상위 limit건만 선택 (heapq.nlargest)
+        search_async로 스레드에서 실행될 때 이벤트 루프의 증분 갱신과 겹칠 수 있으므로
+        posting 목록은 복사해서 사용하고, 그 사이 삭제된 게시글은 평균 길이로 계산 (결과 조회시 제외됨)
+        '''
+        n = len(self._docs)
+        if n == 0:
+            return []
+        avg_length = self._total_length / n
+        lengths = self._lengths
+        scores: dict[int, float] = defaultdict(float)
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            postings = list(postings.items())
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for post_id, tf in postings:
+                norm = _K1 * (1 - _B + _B * lengths.get(post_id, avg_length) / avg_length)
+                scores[post_id] += idf * tf * (_K1 + 1) / (tf + norm)
+
+        hits = ((round(score, 6), post_id) for post_id, score in scores.items())
+        if after is not None:
+            hits = (hit for hit in hits if hit < after)
+        return heapq.nlargest(limit, hits)
+
+    async def search_async(self, query: str, limit: int, after: Optional[tuple[float, int]] = None):
+        '''
+        점수 계산을 스레드에서 실행 (자주 나오는 단어는 posting이 많아 이벤트 루프를 오래 막음)
+        '''
+        return await asyncio.to_thread(self.search, query, limit, after)
+
+    def start(self, loader):
+        '''
+        loader()가 반환하는 (id, 제목, 내용) 목록으로 색인을 구성하고, SEARCH_REBUILD_INTERVAL마다 재구성
+        '''
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(loader))
+
+    async def rebuild(self, loader):
+        '''
+        전체 재구성
+        토큰화와 색인 구성은 스레드에서 처리하여 이벤트 루프를 막지 않고,
+        조회 시작 이후 들어온 증분 갱신은 기록해 두었다가 새 색인에 다시 반영한 뒤 교체
+        '''
+        self._pending = []
+        try:
+            rows = await loader()
+            rebuilt = await asyncio.to_thread(build_index, rows)
+            for post_id, doc in self._pending:
+                if doc is None:
+                    rebuilt._remove(post_id)
+                else:
+                    rebuilt.add(post_id, *doc)
+            self._postings, self._docs = rebuilt._postings, rebuilt._docs
+            self._lengths, self._total_length = rebuilt._lengths, rebuilt._total_length
+        finally:
+            self._pending = None
+
+    async def _run(self, loader):
+        while True:
+            try:
+                await self.rebuild(loader)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"[ERROR] 검색 색인 구성 실패: {e}")
+            if SEARCH_REBUILD_INTERVAL <= 0:
+                return
+            await asyncio.sleep(SEARCH_REBUILD_INTERVAL)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+def build_index(rows) -> InvertedIndex:
+    '''
+    (id, 제목, 내용) 목록으로 새 색인 구성 (스레드에서 실행)
+    '''
+    index = InvertedIndex()
+    for post_id, title, description in rows:
+        index.add(post_id, title, description)
+    return index
+
+
+post_index = InvertedIndex()
+
+
+def index_post(post_id: int, title: Optional[str], description: Optional[str]):
+    '''
+    게시글 생성/수정 후 호출 (memory 방식에서만 동작)
+    '''
+    if SEARCH_BACKEND == "memory":
+        post_index.add(post_id, title, description)
+
+def unindex_posts(*post_ids: int):
+    '''
+    게시글 삭제 후 호출 (memory 방식에서만 동작)
+    '''
+    if SEARCH_BACKEND == "memory":
+        for post_id in post_ids:
+            post_index.remove(post_id)
@@ -1,14 +1,103 @@
-from passlib.context import CryptContext
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from fastapi import HTTPException
+from typing import Optional
+import asyncio
+import os
 import random
 import string
+import time
+from app.utils.instrumentation import METRICS_ENABLED, observe_bcrypt
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_pwd_context = None
+
+# bcrypt 작업 풀 설정
+HASH_POOL_KIND = os.getenv("HASH_POOL_KIND", "thread")     # thread | process
+HASH_POOL_SIZE = int(os.getenv("HASH_POOL_SIZE", os.cpu_count() or 1))
+HASH_QUEUE_SIZE = int(os.getenv("HASH_QUEUE_SIZE", 64))    # 실행 중인 작업 외에 대기 가능한 작업 수
+
+_executor: Optional[Executor] = None
+_pending = 0
+
+def _get_pwd_context():
+    '''
+    passlib 설정 (처음 해싱할 때 생성, 프로세스 풀 사용시 워커 프로세스마다 생성)
+    '''
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return _get_pwd_context().hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return _get_pwd_context().verify(plain_password, hashed_password)
 
 def create_code(length: int = 6) -> str:
-    return ''.join(random.choices(string.digits, k=length))
\ No newline at end of file
+    return ''.join(random.choices(string.digits, k=length))
+
+def _get_executor() -> Executor:
+    global _executor
+    if _executor is None:
+        if HASH_POOL_KIND == "process":
+            _executor = ProcessPoolExecutor(max_workers=HASH_POOL_SIZE)
+        else:
+            _executor = ThreadPoolExecutor(max_workers=HASH_POOL_SIZE, thread_name_prefix="bcrypt")
+    return _executor
+
+async def _run_in_pool(func, *args):
+    '''
+    bcrypt 작업을 이벤트 루프 밖의 풀에서 실행
+    대기열이 가득 찬 경우 503 반환
+    '''
+    global _pending
+    if _pending >= HASH_POOL_SIZE + HASH_QUEUE_SIZE:
+        raise HTTPException(
+            status_code=503,
+            detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"},
+        )
+    _pending += 1
+    start = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), func, *args)
+    finally:
+        _pending -= 1
+        if METRICS_ENABLED:
+            observe_bcrypt(func.__name__.lstrip('_'), time.perf_counter() - start)
+
+async def hash_password_async(password: str) -> str:
+    return await _run_in_pool(hash_password, password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_in_pool(verify_password, plain_password, hashed_password)
+
+def _hash_passwords(passwords: list[str]) -> list[str]:
+    return [hash_password(password) for password in passwords]
+
+async def hash_passwords_async(passwords: list[str]) -> list[str]:
+    '''
+    여러 비밀번호를 풀 크기만큼 나누어 병렬로 해싱 (일괄 가입용)
+    '''
+    if not passwords:
+        return []
+    slices = min(HASH_POOL_SIZE, len(passwords))
+    chunks = [passwords[i::slices] for i in range(slices)]
+    results = await asyncio.gather(*(_run_in_pool(_hash_passwords, chunk) for chunk in chunks))
+
+    # passwords[i::slices]로 나눈 순서를 원래 순서로 복원
+    hashed = [None] * len(passwords)
+    for i, chunk in enumerate(results):
+        hashed[i::slices] = chunk
+    return hashed
+
+def shutdown_pool():
+    '''
+    bcrypt 작업 풀 종료 (앱 종료시 호출)
+    '''
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,6 @@
+'''
+로컬 대체 환경(aiosqlite, fakeredis, 더미 SMTP)에서 app.main:app 부하 테스트
+
+python -m bench.run --scenario mixed --duration 30 --concurrency 32
+python -m bench.compare bench/results/<기준>.json bench/results/<비교>.json
+'''
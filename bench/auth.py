@@ -0,0 +1,136 @@
+'''
+요청당 인증 처리 비용 (get_current_user 의존성) 측정
+
+python -m bench.auth --users 1000 --requests 5000
+
+- decode: 서명 검증 (jwt.decode_token)
+- decode_cached: 검증 결과 캐시 적중 (jwt.decode_token_cached)
+- uncached: 캐시 없이 토큰 복호화 + 사용자 DB 조회 (라우트마다 decode_token + crud.get_user를 하던 방식)
+- dependency_cold: 의존성, 토큰 / 사용자 캐시 모두 miss (검증 + DB 조회 + 캐시 저장)
+- dependency: 의존성, 토큰 / 사용자 캐시 모두 적중 (보통의 요청)
+각 요청은 세션을 새로 열고, 사용자는 --users명을 돌아가며 사용 (기본 aiosqlite + 프로세스 내 fakeredis)
+'''
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import datetime, timezone
+from .run import RESULTS_DIR, percentile
+from .stubs import bench_env, configure_env, install_fake_redis
+
+
+def summarize(latencies: list[float]) -> dict:
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "mean_us": round(statistics.fmean(values) * 1e6, 2),
+        "p50_us": round(percentile(values, 50) * 1e6, 2),
+        "p99_us": round(percentile(values, 99) * 1e6, 2),
+    }
+
+
+def bearer_request(token: str):
+    from starlette.requests import Request
+    return Request({"type": "http", "headers": [(b"authorization", f"Bearer {token}".encode())]})
+
+
+async def run(args, db_url: str) -> dict:
+    from app import crud
+    from app.database import SessionLocal, close_engine, init_engine
+    from app.dependencies import get_current_user_optional
+    from app.utils import cache, jwt
+    from app.utils.redis_client import get_redis
+    from .seed import seed
+
+    await seed(db_url, args.users, 0)
+    install_fake_redis()
+    init_engine()
+    tokens = [(user_id, jwt.create_access_token({"sub": str(user_id)})) for user_id in range(1, args.users + 1)]
+
+    async def decode(user_id, token):
+        jwt.decode_token(token)
+
+    async def decode_cached(user_id, token):
+        jwt.decode_token_cached(token)
+
+    async def uncached(user_id, token):
+        async with SessionLocal() as db:
+            payload = jwt.decode_token(token)
+            await crud.get_user(db, int(payload["sub"]))
+
+    async def dependency(user_id, token):
+        async with SessionLocal() as db:
+            await get_current_user_optional(bearer_request(token), db)
+
+    async def clear_caches(user_id, token):
+        jwt._verified.pop(token, None)
+        await get_redis().delete(cache.user_key(user_id))
+
+    # (측정 함수, 매 요청 전에 실행할 준비 작업)
+    paths = {
+        "decode": (decode, None),
+        "decode_cached": (decode_cached, None),
+        "uncached": (uncached, None),
+        "dependency_cold": (dependency, clear_caches),
+        "dependency": (dependency, None),
+    }
+
+    results = {}
+    try:
+        for name, (fn, prepare) in paths.items():
+            # 한 바퀴 먼저 실행 (캐시 채우기 / 커넥션 풀 준비)
+            for user_id, token in tokens:
+                await fn(user_id, token)
+            latencies = []
+            for i in range(args.requests):
+                user_id, token = tokens[i % len(tokens)]
+                if prepare is not None:
+                    await prepare(user_id, token)
+                start = time.perf_counter()
+                await fn(user_id, token)
+                latencies.append(time.perf_counter() - start)
+            results[name] = summarize(latencies)
+    finally:
+        await close_engine()
+
+    return {"users": args.users, "paths": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000, help="토큰을 발급할 사용자 수 (TOKEN_CACHE_SIZE보다 크면 검증 캐시가 밀려남)")
+    parser.add_argument("--requests", type=int, default=5000, help="방식마다 측정할 요청 수")
+    parser.add_argument("--db-url", help="기본은 작업 디렉토리의 sqlite (기존 테이블은 다시 생성됨)")
+    parser.add_argument("--out", help="결과 파일 (기본: bench/results/auth-<시각>.json)")
+    args = parser.parse_args()
+
+    out = os.path.abspath(args.out) if args.out else None
+    workdir = tempfile.mkdtemp(prefix="bench-auth-")
+    env = bench_env(workdir, 0, {"DB_URL": args.db_url} if args.db_url else {})
+    configure_env(workdir, env)
+    started_at = datetime.now(timezone.utc)
+    try:
+        report = asyncio.run(run(args, env["DB_URL"]))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    report["started_at"] = started_at.isoformat(timespec="seconds")
+
+    print(f"{report['users']} users")
+    print(f"{'path':<18}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}")
+    for name, s in report["paths"].items():
+        print(f"{name:<18}{s['mean_us']:>10}{s['p50_us']:>10}{s['p99_us']:>10}")
+
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, f"auth-{started_at:%Y%m%d%H%M%S}.json")
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
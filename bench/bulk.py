@@ -0,0 +1,161 @@
+'''
+일괄 처리 API와 한 건씩 처리하는 API의 처리량(행/초) 비교 (게시글 / 사용자의 생성, 수정, 삭제)
+
+python -m bench.bulk --rows 2000 --batch 500
+python -m bench.bulk --rows 2000 --db-url "mysql+asyncmy://user:pw@localhost:3306/bench"
+
+- single: 한 건짜리 API를 rows번 순서대로 호출 (POST /post/{user_id}, PUT /post/{id}, DELETE /post/{id}, ...)
+- bulk: 같은 rows건을 --batch건씩 일괄 API로 호출 (POST/PATCH/DELETE /post/bulk, /users/bulk)
+- 사용자 생성은 행마다 bcrypt 해싱이 있어 --hashed-rows건만 측정
+- 앱은 같은 프로세스에서 httpx ASGI transport로 실행 (기본 aiosqlite + 프로세스 내 fakeredis)
+'''
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timezone
+import httpx
+from .run import RESULTS_DIR
+from .seed import PASSWORD, sentence
+from .stubs import bench_env, configure_env, install_fake_redis, prepare_workdir
+
+
+def chunks(items: list, size: int) -> list[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+async def run_single(client: httpx.AsyncClient, requests: list[tuple[str, str, dict]]) -> tuple[float, int]:
+    '''
+    요청을 순서대로 실행, (걸린 시간, 실패 건수)
+    '''
+    failed = 0
+    start = time.perf_counter()
+    for method, url, kwargs in requests:
+        response = await client.request(method, url, **kwargs)
+        failed += response.status_code != 200
+    return time.perf_counter() - start, failed
+
+async def run_bulk(client: httpx.AsyncClient, method: str, url: str, bodies: list) -> tuple[float, int]:
+    '''
+    일괄 요청을 순서대로 실행, (걸린 시간, 실패한 항목 수)
+    '''
+    failed = 0
+    start = time.perf_counter()
+    for body in bodies:
+        response = await client.request(method, url, json=body)
+        response.raise_for_status()
+        failed += response.json()["failed"]
+    return time.perf_counter() - start, failed
+
+
+def operations(args, rng) -> list[tuple[str, int, list, tuple]]:
+    '''
+    (이름, 행 수, 한 건씩 보낼 요청 목록, (일괄 method, url, 요청 본문 목록))
+    시드 데이터: 사용자 1..2*rows, 사용자마다 게시글 1개 (게시글 id = 사용자 id)
+    한 건씩 처리하는 쪽은 id 1..rows, 일괄 처리하는 쪽은 rows+1..2*rows 사용
+    '''
+    n = args.rows
+    single_ids = range(1, n + 1)
+    bulk_ids = range(n + 1, 2 * n + 1)
+
+    def post_body():
+        return {"title": sentence(rng, 3), "description": sentence(rng, 12)}
+
+    def new_user(prefix: str, i: int):
+        return {"name": f"{prefix}{i}", "email": f"{prefix}{i}@example.com", "password": PASSWORD}
+
+    hashed = args.hashed_rows
+    return [
+        ("create_posts", n,
+         [("POST", f"/post/{i}", {"json": post_body()}) for i in single_ids],
+         ("POST", "/post/bulk", chunks([{**post_body(), "owner_id": i} for i in bulk_ids], args.batch))),
+        ("update_posts", n,
+         [("PUT", f"/post/{i}", {"json": post_body()}) for i in single_ids],
+         ("PATCH", "/post/bulk", chunks([{"id": i, **post_body()} for i in bulk_ids], args.batch))),
+        ("delete_posts", n,
+         [("DELETE", f"/post/{i}", {}) for i in single_ids],
+         ("DELETE", "/post/bulk", [{"ids": ids} for ids in chunks(list(bulk_ids), args.batch)])),
+        ("update_users", n,
+         [("PUT", f"/users/{i}", {"json": new_user("renamed", i)}) for i in single_ids],
+         ("PATCH", "/users/bulk", chunks([{"id": i, "name": f"renamed{i}"} for i in bulk_ids], args.batch))),
+        ("delete_users", n,
+         [("DELETE", f"/users/{i}", {}) for i in single_ids],
+         ("DELETE", "/users/bulk", [{"ids": ids} for ids in chunks(list(bulk_ids), args.batch)])),
+        ("create_users", hashed,
+         [("POST", "/users", {"json": new_user("single", i)}) for i in range(hashed)],
+         ("POST", "/users/bulk", chunks([new_user("bulk", i) for i in range(hashed)], args.batch))),
+    ]
+
+
+async def run(args, db_url: str) -> dict:
+    from .seed import seed
+
+    await seed(db_url, 2 * args.rows, 1, args.seed)
+    install_fake_redis()
+    from app.main import app
+
+    results = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+            for name, rows, single, (method, url, bodies) in operations(args, random.Random(args.seed)):
+                single_seconds, single_failed = await run_single(client, single)
+                bulk_seconds, bulk_failed = await run_bulk(client, method, url, bodies)
+                results[name] = {
+                    "rows": rows,
+                    "single_seconds": round(single_seconds, 3),
+                    "bulk_seconds": round(bulk_seconds, 3),
+                    "single_rows_per_s": round(rows / single_seconds, 1),
+                    "bulk_rows_per_s": round(rows / bulk_seconds, 1),
+                    "speedup": round(single_seconds / bulk_seconds, 1),
+                    "single_failed": single_failed,
+                    "bulk_failed": bulk_failed,
+                }
+    return {"rows": args.rows, "batch": args.batch, "operations": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000, help="작업마다 처리할 행 수 (한 건씩 / 일괄 각각)")
+    parser.add_argument("--batch", type=int, default=500, help="일괄 요청 하나의 항목 수")
+    parser.add_argument("--hashed-rows", type=int, default=20, help="사용자 생성(bcrypt) 측정 행 수")
+    parser.add_argument("--db-url", help="기본은 작업 디렉토리의 sqlite (기존 테이블은 다시 생성됨)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", help="결과 파일 (기본: bench/results/bulk-<시각>.json)")
+    args = parser.parse_args()
+
+    out = os.path.abspath(args.out) if args.out else None
+    workdir = tempfile.mkdtemp(prefix="bench-bulk-")
+    prepare_workdir(workdir)
+    overrides = {"MAIL_WORKER_ENABLED": "false"}
+    if args.db_url:
+        overrides["DB_URL"] = args.db_url
+    env = bench_env(workdir, 0, overrides)
+    configure_env(workdir, env)
+    started_at = datetime.now(timezone.utc)
+    try:
+        report = asyncio.run(run(args, env["DB_URL"]))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    report["started_at"] = started_at.isoformat(timespec="seconds")
+
+    print(f"rows {report['rows']}, batch {report['batch']}")
+    print(f"{'operation':<14}{'rows':>7}{'single rows/s':>15}{'bulk rows/s':>13}{'speedup':>9}{'failed':>9}")
+    for name, s in report["operations"].items():
+        failed = f"{s['single_failed']}/{s['bulk_failed']}"
+        print(f"{name:<14}{s['rows']:>7}{s['single_rows_per_s']:>15}{s['bulk_rows_per_s']:>13}{s['speedup']:>8}x{failed:>9}")
+
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, f"bulk-{started_at:%Y%m%d%H%M%S}.json")
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
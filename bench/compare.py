@@ -0,0 +1,81 @@
+'''
+두 벤치마크 결과 비교, 기준을 넘는 성능 저하가 있으면 종료 코드 1
+
+python -m bench.compare bench/results/base.json bench/results/new.json --max-throughput-drop 0.1
+'''
+import argparse
+import json
+import sys
+
+
+def change(base: float, new: float) -> float:
+    return (new - base) / base if base else 0.0
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(base: dict, new: dict, args) -> list[str]:
+    '''
+    기준을 넘은 항목 목록 반환 (표는 출력)
+    '''
+    regressions = []
+    rows = [("total", base["summary"], new["summary"])]
+    for name, stats in new["operations"].items():
+        if name in base["operations"]:
+            rows.append((name, base["operations"][name], stats))
+
+    print(f"{'operation':<28}{'rps':>18}{'p50 ms':>20}{'p95 ms':>20}{'p99 ms':>20}")
+    for name, b, n in rows:
+        cells = []
+        for key in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms"):
+            cells.append(f"{b[key]:>8.1f}→{n[key]:<8.1f}{change(b[key], n[key]):>+5.0%}")
+        print(f"{name:<28}" + " ".join(cells))
+
+        # 표본이 적은 요청은 편차가 커서 판정에서 제외
+        if min(b["requests"], n["requests"]) < args.min_samples:
+            continue
+        if change(b["throughput_rps"], n["throughput_rps"]) < -args.max_throughput_drop:
+            regressions.append(f"{name}: throughput {b['throughput_rps']:.1f} -> {n['throughput_rps']:.1f} rps")
+        for key in ("p50_ms", "p99_ms"):
+            if change(b[key], n[key]) > args.max_latency_increase:
+                regressions.append(f"{name}: {key} {b[key]:.2f} -> {n[key]:.2f}")
+        if n.get("error_rate", 0) > b.get("error_rate", 0) + args.max_error_rate_increase:
+            regressions.append(f"{name}: error rate {b.get('error_rate', 0):.2%} -> {n['error_rate']:.2%}")
+
+    base_rss, new_rss = base["rss"]["peak_mb"], new["rss"]["peak_mb"]
+    print(f"{'peak RSS (MB)':<28}{base_rss:>8.1f}→{new_rss:<8.1f}{change(base_rss, new_rss):>+5.0%}")
+    if change(base_rss, new_rss) > args.max_rss_increase:
+        regressions.append(f"peak RSS {base_rss:.1f} -> {new_rss:.1f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--max-throughput-drop", type=float, default=0.10)
+    parser.add_argument("--max-latency-increase", type=float, default=0.20)
+    parser.add_argument("--max-rss-increase", type=float, default=0.20)
+    parser.add_argument("--max-error-rate-increase", type=float, default=0.01)
+    parser.add_argument("--min-samples", type=int, default=100)
+    args = parser.parse_args()
+
+    base, new = load(args.base), load(args.new)
+    print(f"base: {base['meta']['commit']} {base['meta']['started_at']}")
+    print(f"new:  {new['meta']['commit']} {new['meta']['started_at']}")
+    if base["meta"]["params"] != new["meta"]["params"]:
+        print("[WARN] 실행 조건이 다름:", base["meta"]["params"], new["meta"]["params"])
+
+    regressions = compare(base, new, args)
+    if regressions:
+        print("\n[REGRESSION]")
+        for line in regressions:
+            print(" -", line)
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+'''
+app.main import 시간 측정 (python -X importtime)
+설정(.env, SECRET_KEY) 없이 빈 디렉토리에서 import하여 import 시점 부작용이 없는지도 확인
+
+python -m bench.import_time --runs 5 --max-ms 2500
+'''
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from .stubs import REPO_DIR
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# 첫 사용(앱 시작) 전에는 import하지 않아야 하는 모듈 (DB 드라이버, 템플릿 엔진, bcrypt)
+DEFERRED_MODULES = ("asyncmy", "jinja2", "passlib")
+
+CHECK = f'''
+import os, sys, json
+import app.main
+print(json.dumps({{
+    "imported": [m for m in {DEFERRED_MODULES!r} if m in sys.modules],
+    "created": sorted(os.listdir(".")),
+}}))
+'''
+
+
+def measure(workdir: str) -> tuple[dict[str, tuple[int, int]], dict]:
+    '''
+    모듈 → (self, cumulative) 마이크로초, 부작용 확인 결과
+    '''
+    env = {key: value for key, value in os.environ.items() if key != "SECRET_KEY"}
+    env["PYTHONPATH"] = REPO_DIR
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHECK],
+        cwd=workdir, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"import app.main failed:\n{proc.stderr[-2000:]}")
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return modules, json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, help="app.main 누적 import 시간(중앙값) 상한")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--out", help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    totals = []
+    runs = []
+    failures = []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as workdir:
+            modules, check = measure(workdir)
+        totals.append(modules["app.main"][1] / 1000)
+        runs.append(modules)
+        if check["imported"]:
+            failures.append(f"deferred modules imported at import time: {check['imported']}")
+        if check["created"]:
+            failures.append(f"files created at import time: {check['created']}")
+
+    median = statistics.median(totals)
+    modules = runs[totals.index(sorted(totals)[len(totals) // 2])]
+    app_modules = {
+        name: round(cumulative / 1000, 2)
+        for name, (_, cumulative) in modules.items() if name == "app" or name.startswith("app.")
+    }
+    slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+
+    print(f"app.main import: median {median:.1f} ms (runs: {', '.join(f'{t:.1f}' for t in totals)})")
+    print("slowest modules (self ms):")
+    for name, (self_us, _) in slowest:
+        print(f"  {self_us / 1000:>8.2f}  {name}")
+
+    if args.max_ms is not None and median > args.max_ms:
+        failures.append(f"app.main import {median:.1f} ms > {args.max_ms} ms")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump({
+                "python": sys.version.split()[0],
+                "median_ms": round(median, 2),
+                "runs_ms": [round(t, 2) for t in totals],
+                "app_modules_ms": app_modules,
+                "slowest_self_ms": {name: round(self_us / 1000, 2) for name, (self_us, _) in slowest},
+                "failures": sorted(set(failures)),
+            }, f, indent=2)
+
+    if failures:
+        for failure in sorted(set(failures)):
+            print("[FAIL]", failure)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
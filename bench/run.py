@@ -0,0 +1,465 @@
+'''
+부하 테스트 실행 및 결과(JSON) 저장
+
+python -m bench.run --scenario mixed --duration 30 --concurrency 32
+python -m bench.run --transport uvicorn --workers 2 --scenario posts
+python -m bench.scale --scenario mixed --workers 1,2,4,8            # 워커 수별 처리량 비교
+python -m bench.run --scenario auth --env METRICS_ENABLED=false     # 환경 변수 변경 후 비교
+
+python -m bench.run --transport uvicorn --scenario upload --file-size 16M --concurrency 10   # 큰 파일 동시 업로드 RSS
+python -m bench.run --transport uvicorn --scenario login_reads --background-concurrency 4   # 로그인 4개가 계속 실행되는 동안 게시글 조회 p99
+python -m bench.run --transport uvicorn --scenario serialize --concurrency 8   # 목록 응답 행당 CPU 시간
+python -m bench.run --transport uvicorn --scenario zip --files 50 --zip-files 50 --file-size 16M --concurrency 1   # zip TTFB / 최대 메모리
+
+시나리오: users, posts, auth, files, upload, zip, dedupe, pagination, bulk, search, serialize, login_reads, mixed
+'''
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+import httpx
+from .stubs import REPO_DIR, DummySMTP, SharedFakeRedis, bench_env, configure_env, install_fake_redis, prepare_workdir
+
+RESULTS_DIR = os.path.join(REPO_DIR, "bench", "results")
+RSS_INTERVAL = 0.1
+
+
+class Recorder:
+    '''
+    요청 이름별 응답 시간 / 상태 코드 / 연결 오류 기록
+    '''
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+        self.errors: Counter = Counter()
+
+    def record(self, name: str, elapsed: float, status: int | None):
+        self.latencies[name].append(elapsed)
+        if status is None:
+            self.errors[name] += 1
+        else:
+            self.statuses[name][status] += 1
+
+
+def percentile(values: list[float], p: float) -> float:
+    '''
+    nearest-rank 백분위수 (values는 정렬된 상태)
+    '''
+    if not values:
+        return 0.0
+    rank = max(int(round(p / 100 * len(values) + 0.5)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
+
+def ttfb_summary(values: list[float]) -> dict:
+    values = sorted(values)
+    return {
+        "ttfb_p50_ms": round(percentile(values, 50) * 1000, 3),
+        "ttfb_p99_ms": round(percentile(values, 99) * 1000, 3),
+        "ttfb_max_ms": round(values[-1] * 1000, 3),
+    }
+
+def summarize(latencies: list[float], statuses: Counter, errors: int, elapsed: float) -> dict:
+    values = sorted(latencies)
+    failed = errors + sum(n for status, n in statuses.items() if status >= 500)
+    return {
+        "requests": len(values),
+        "throughput_rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p95_ms": round(percentile(values, 95) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+        "error_rate": round(failed / len(values), 4) if values else 0.0,
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        "connection_errors": errors,
+    }
+
+
+# ---------------------------
+# RSS / CPU 시간 (Linux /proc 기준, 다른 OS는 0)
+# ---------------------------
+def process_tree(pid: int) -> list[int]:
+    pids = [pid]
+    try:
+        for task in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{task}/children") as f:
+                for child in f.read().split():
+                    pids.extend(process_tree(int(child)))
+    except OSError:
+        pass
+    return pids
+
+def rss_mb(pid: int) -> float:
+    total = 0
+    for p in process_tree(pid):
+        try:
+            with open(f"/proc/{p}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1])
+        except OSError:
+            pass
+    return total / 1024
+
+def cpu_seconds(pid: int) -> float:
+    '''
+    프로세스 트리의 사용자 + 시스템 CPU 시간(초)
+    '''
+    ticks = os.sysconf("SC_CLK_TCK")
+    total = 0
+    for p in process_tree(pid):
+        try:
+            with open(f"/proc/{p}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            total += int(fields[11]) + int(fields[12])     # utime, stime
+        except (OSError, IndexError):
+            pass
+    return total / ticks
+
+async def sample_rss(pid: int, samples: list[float], stop: asyncio.Event):
+    while not stop.is_set():
+        samples.append(rss_mb(pid))
+        try:
+            await asyncio.wait_for(stop.wait(), RSS_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+# ---------------------------
+# 부하 생성
+# ---------------------------
+async def drive(
+    client, ctx, scenario, duration: float, concurrency: int, recorder: Recorder | None,
+    background=None, background_concurrency: int = 0,
+):
+    '''
+    concurrency개의 가상 사용자가 duration초 동안 가중치에 따라 요청 반복 (closed loop)
+    background 요청이 있으면 background_concurrency개의 가상 사용자가 그 요청만 반복
+    '''
+    weights = [w for w, _ in scenario]
+    ops = [op for _, op in scenario]
+    deadline = time.perf_counter() + duration
+
+    async def user(seed: int, ops=ops, weights=weights):
+        rng = random.Random(seed)
+        while time.perf_counter() < deadline:
+            op = rng.choices(ops, weights)[0]
+            start = time.perf_counter()
+            try:
+                response = await op(client, ctx)
+                status = response.status_code
+            except httpx.HTTPError:
+                status = None
+            if recorder is not None:
+                recorder.record(op.__name__, time.perf_counter() - start, status)
+
+    users = [user(i) for i in range(concurrency)]
+    if background is not None:
+        users += [user(concurrency + i, [background], [1]) for i in range(background_concurrency)]
+    await asyncio.gather(*users)
+
+
+def parse_db_queries(text: str) -> dict[str, float]:
+    '''
+    /metrics의 http_request_db_queries에서 라우트별 요청당 평균 쿼리 수 계산
+    '''
+    sums, counts = {}, {}
+    for name, route, value in re.findall(r'^http_request_db_queries_(sum|count)\{route="([^"]*)"\} (\S+)$', text, re.M):
+        (sums if name == "sum" else counts)[route] = float(value)
+    return {route: round(sums[route] / n, 2) for route, n in counts.items() if n and route in sums}
+
+
+async def run_load(client, ctx, scenario, args, server_pid: int) -> dict:
+    from .scenarios import BACKGROUND, prepare
+
+    background = BACKGROUND.get(args.scenario)
+    await prepare(client, ctx, [op for _, op in scenario], args.files)
+    if args.warmup:
+        await drive(client, ctx, scenario, args.warmup, args.concurrency, None, background, args.background_concurrency)
+    ctx.ttfb.clear()
+    ctx.rows = 0
+
+    recorder = Recorder()
+    samples: list[float] = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(server_pid, samples, stop))
+    cpu_start = cpu_seconds(server_pid)
+    start = time.perf_counter()
+    await drive(client, ctx, scenario, args.duration, args.concurrency, recorder, background, args.background_concurrency)
+    elapsed = time.perf_counter() - start
+    cpu = cpu_seconds(server_pid) - cpu_start
+    stop.set()
+    await sampler
+
+    requests = sum(len(values) for values in recorder.latencies.values())
+    # summary는 가중치 요청만 집계 (background 요청은 operations에서 따로 확인)
+    names = [name for name in recorder.latencies if background is None or name != background.__name__]
+    all_latencies = [v for name in names for v in recorder.latencies[name]]
+    all_statuses = sum((recorder.statuses[name] for name in names), Counter())
+    response = await client.get("/metrics")
+    return {
+        "summary": summarize(all_latencies, all_statuses, sum(recorder.errors[name] for name in names), elapsed),
+        "background": background.__name__ if background is not None else None,
+        "operations": {
+            name: {
+                **summarize(values, recorder.statuses[name], recorder.errors[name], elapsed),
+                **(ttfb_summary(ctx.ttfb[name]) if ctx.ttfb.get(name) else {}),
+            }
+            for name, values in sorted(recorder.latencies.items())
+        },
+        "rss": {
+            "start_mb": round(samples[0], 1) if samples else 0.0,
+            "peak_mb": round(max(samples), 1) if samples else 0.0,
+            "end_mb": round(samples[-1], 1) if samples else 0.0,
+            "increase_mb": round(max(samples) - samples[0], 1) if samples else 0.0,
+        },
+        # asgi 방식은 부하 생성기(클라이언트)의 CPU 시간도 포함
+        "cpu": {
+            "seconds": round(cpu, 3),
+            "utilization": round(cpu / elapsed, 3) if elapsed else 0.0,
+            "per_request_ms": round(cpu / requests * 1000, 3) if requests else 0.0,
+            "rows": ctx.rows,
+            "per_row_us": round(cpu / ctx.rows * 1e6, 3) if ctx.rows else None,
+        },
+        "db_queries_per_request": parse_db_queries(response.text) if response.status_code == 200 else {},
+    }
+
+
+async def storage_stats(db_url: str) -> dict | None:
+    '''
+    업로드된 파일의 논리 크기(이름별 합계)와 실제 저장 크기(blob 합계, 디스크 사용량) 비교
+    '''
+    from sqlalchemy import func, select
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+    from app import models
+    from app.utils.files import BLOB_DIR
+
+    engine = create_async_engine(db_url, poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            files, logical = (await conn.execute(select(func.count(), func.coalesce(func.sum(models.File.size), 0)))).one()
+            blobs, stored = (await conn.execute(select(func.count(), func.coalesce(func.sum(models.Blob.size), 0)))).one()
+    finally:
+        await engine.dispose()
+    if not files:
+        return None
+
+    disk = 0
+    for root, _, names in os.walk(BLOB_DIR):
+        disk += sum(os.stat(os.path.join(root, name)).st_blocks * 512 for name in names)
+    return {
+        "files": files,
+        "blobs": blobs,
+        "logical_bytes": logical,
+        "stored_bytes": stored,
+        "disk_bytes": disk,
+        "saved_bytes": logical - stored,
+        "saved_ratio": round(1 - stored / logical, 4) if logical else 0.0,
+    }
+
+
+async def wait_ready(base_url: str, proc: subprocess.Popen, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {proc.returncode}")
+            try:
+                await client.get("/openapi.json")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError("uvicorn did not start in time")
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def run(args, env_overrides: dict[str, str], workdir: str) -> dict:
+    from .scenarios import SCENARIOS, Context
+
+    smtp = DummySMTP()
+    await smtp.start()
+    env = bench_env(workdir, smtp.port, env_overrides)
+    configure_env(workdir, env)
+
+    from .seed import seed
+    await seed(env["DB_URL"], args.users, args.posts_per_user, args.seed)
+
+    ctx = Context(args.users, args.posts_per_user, args.seed, file_size=args.file_size, zip_files=args.zip_files)
+    scenario = SCENARIOS[args.scenario]
+    try:
+        if args.transport == "asgi":
+            # 클라이언트와 앱이 같은 프로세스 (네트워크/서버 비용 제외)
+            install_fake_redis()
+            from app.main import app
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+                    result = await run_load(client, ctx, scenario, args, os.getpid())
+        else:
+            # 운영과 같은 진입점(app.server)으로 실행, 모든 워커가 하나의 fakeredis 서버 사용
+            redis_server = SharedFakeRedis()
+            await redis_server.start()
+            port = free_port()
+            proc = subprocess.Popen(
+                [sys.executable, "-m", "app.server"],
+                cwd=workdir,
+                env={
+                    **os.environ,
+                    **redis_server.env,
+                    "PYTHONPATH": REPO_DIR,
+                    "WEB_APP": "bench.serve:app",
+                    "WEB_HOST": "127.0.0.1",
+                    "WEB_PORT": str(port),
+                    "WEB_WORKERS": str(args.workers),
+                    "WEB_ACCESS_LOG": "false",
+                    "PROMETHEUS_MULTIPROC_DIR": os.path.join(workdir, "prometheus"),
+                },
+            )
+            try:
+                base_url = f"http://127.0.0.1:{port}"
+                await wait_ready(base_url, proc)
+                limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+                async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+                    result = await run_load(client, ctx, scenario, args, proc.pid)
+            finally:
+                # 종료 중인 워커의 메일 발송이 더미 SMTP 서버(이 이벤트 루프)를 기다리므로 루프를 막지 않고 대기
+                proc.terminate()
+                await asyncio.to_thread(proc.wait, 30)
+                redis_server.stop()
+    finally:
+        await smtp.stop()
+
+    result["smtp_messages"] = smtp.messages
+    storage = await storage_stats(env["DB_URL"])
+    if storage is not None:
+        result["storage"] = storage
+    return result
+
+
+def git_commit() -> tuple[str, bool]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_DIR, capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_DIR, capture_output=True, text=True).stdout.strip()
+        return commit, bool(dirty)
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+def parse_size(value: str) -> int:
+    '''
+    바이트 수 (K/M 단위 허용, 예: 64K, 16M)
+    '''
+    units = {"K": 1024, "M": 1024 * 1024}
+    value = value.strip().upper()
+    try:
+        if value[-1:] in units:
+            return int(value[:-1]) * units[value[-1]]
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"크기 형식 오류: {value} (예: 65536, 64K, 16M)")
+
+def parse_env(items: list[str]) -> dict[str, str]:
+    env = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise SystemExit(f"--env 형식 오류: {item} (KEY=VALUE)")
+        env[key] = value
+    return env
+
+
+def main():
+    from .scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="mixed")
+    parser.add_argument("--transport", choices=["asgi", "uvicorn"], default="asgi")
+    parser.add_argument("--workers", type=int, default=1, help="app.server 워커 수 (모든 워커가 하나의 fakeredis 서버 사용)")
+    parser.add_argument("--duration", type=float, default=20, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, default=3, help="측정 전 예열 시간(초)")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--background-concurrency", type=int, default=4, help="login_reads 시나리오에서 로그인만 반복하는 가상 사용자 수")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts-per-user", type=int, default=10)
+    parser.add_argument("--files", type=int, default=20, help="다운로드 시나리오용 사전 업로드 파일 수")
+    parser.add_argument("--file-size", type=parse_size, default=64 * 1024, help="업로드 파일 크기 (예: 64K, 16M)")
+    parser.add_argument("--zip-files", type=int, default=5, help="zip 다운로드 한 번에 묶는 파일 수 (--files 이하)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE", help="앱 환경 변수 변경")
+    parser.add_argument("--workdir", help="DB/업로드 파일 위치 (지정하지 않으면 임시 디렉토리 후 삭제)")
+    parser.add_argument("--out", help="결과 파일 (기본: bench/results/<시나리오>-<커밋>-<시각>.json)")
+    args = parser.parse_args()
+
+    env_overrides = parse_env(args.env)
+    out = os.path.abspath(args.out) if args.out else None
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix="bench-")
+    prepare_workdir(workdir)
+
+    commit, dirty = git_commit()
+    started_at = datetime.now(timezone.utc)
+    try:
+        result = asyncio.run(run(args, env_overrides, workdir))
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    params = {k: v for k, v in vars(args).items() if k not in ("env", "workdir", "out")}
+    report = {
+        "meta": {
+            "commit": commit,
+            "dirty": dirty,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "params": params,
+            "env": env_overrides,
+        },
+        **result,
+    }
+
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, f"{args.scenario}-{commit[:8]}-{started_at:%Y%m%d%H%M%S}.json")
+    with open(out, "w") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    summary = report["summary"]
+    print(
+        f"{args.scenario} ({args.transport}): {summary['requests']} requests, {summary['throughput_rps']} rps, "
+        f"p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms, p99 {summary['p99_ms']} ms, "
+        f"errors {summary['error_rate']:.2%}, peak RSS {report['rss']['peak_mb']} MB (+{report['rss']['increase_mb']} MB)"
+    )
+    cpu = report["cpu"]
+    per_row = f", {cpu['per_row_us']} us/row ({cpu['rows']} rows)" if cpu["rows"] else ""
+    print(f"  cpu: {cpu['seconds']} s ({cpu['utilization']:.0%}), {cpu['per_request_ms']} ms/request{per_row}")
+    for name, stats in report["operations"].items():
+        ttfb = f"  ttfb p50 {stats['ttfb_p50_ms']} ms" if "ttfb_p50_ms" in stats else ""
+        if name == report["background"]:
+            name += " (background)"
+        print(f"  {name:<26} {stats['requests']:>7} req  p50 {stats['p50_ms']:>8} ms  p99 {stats['p99_ms']:>8} ms  {stats['statuses']}{ttfb}")
+    if "storage" in report:
+        storage = report["storage"]
+        print(
+            f"  storage: {storage['files']} files -> {storage['blobs']} blobs, "
+            f"{storage['logical_bytes']} -> {storage['stored_bytes']} bytes (saved {storage['saved_ratio']:.1%})"
+        )
+    print(f"saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
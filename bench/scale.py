@@ -0,0 +1,91 @@
+'''
+워커 수별 처리량 비교 (app.server를 워커 수만 바꿔 실행)
+
+python -m bench.scale --scenario mixed --workers 1,2,4,8 --duration 20
+python -m bench.scale --scenario auth --workers 1,4 -- --env HASH_POOL_SIZE=1   # -- 뒤는 bench.run에 그대로 전달
+
+각 실행 결과는 bench.run 형식으로 저장하고, 워커 수별 요약을 하나의 JSON으로 저장
+'''
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from .run import RESULTS_DIR
+from .stubs import REPO_DIR
+
+
+def run_workers(workers: int, args, extra: list[str], out_dir: str) -> dict:
+    out = os.path.join(out_dir, f"{args.scenario}-w{workers}.json")
+    subprocess.run(
+        [sys.executable, "-m", "bench.run", "--transport", "uvicorn", "--workers", str(workers),
+         "--scenario", args.scenario, "--duration", str(args.duration), "--concurrency", str(args.concurrency),
+         "--out", out, *extra],
+        cwd=REPO_DIR,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    with open(out) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", default="mixed")
+    parser.add_argument("--workers", default="1,2,4,8", help="쉼표로 구분한 워커 수 목록")
+    parser.add_argument("--duration", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, default=64, help="워커가 많을 때도 포화되도록 충분히 크게")
+    parser.add_argument("--out", help="요약 파일 (기본: bench/results/scale-<시나리오>-<시각>.json)")
+    parser.add_argument("extra", nargs="*", help="bench.run에 전달할 추가 인자 (-- 뒤에 지정)")
+    args = parser.parse_args()
+
+    counts = [int(n) for n in args.workers.split(",")]
+    started_at = datetime.now(timezone.utc)
+    out_dir = tempfile.mkdtemp(prefix="bench-scale-")
+
+    rows = []
+    for workers in counts:
+        report = run_workers(workers, args, args.extra, out_dir)
+        summary = report["summary"]
+        rows.append({
+            "workers": workers,
+            "throughput_rps": summary["throughput_rps"],
+            "p50_ms": summary["p50_ms"],
+            "p99_ms": summary["p99_ms"],
+            "error_rate": summary["error_rate"],
+            "peak_rss_mb": report["rss"]["peak_mb"],
+            "report": report,
+        })
+        print(f"workers={workers}: {summary['throughput_rps']} rps, p99 {summary['p99_ms']} ms", file=sys.stderr)
+
+    # 1 워커 (또는 가장 적은 워커 수) 대비 처리량 배율
+    base = rows[0]["throughput_rps"] or 1
+    for row in rows:
+        row["speedup"] = round(row["throughput_rps"] / base, 2)
+
+    print(f"\n{args.scenario} (cpu_count={os.cpu_count()})")
+    print(f"{'workers':>7}  {'rps':>9}  {'speedup':>7}  {'p50 ms':>8}  {'p99 ms':>8}  {'errors':>7}  {'RSS MB':>8}")
+    for row in rows:
+        print(
+            f"{row['workers']:>7}  {row['throughput_rps']:>9}  {row['speedup']:>6}x  {row['p50_ms']:>8}  "
+            f"{row['p99_ms']:>8}  {row['error_rate']:>7.2%}  {row['peak_rss_mb']:>8}"
+        )
+
+    out = args.out
+    if out is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        out = os.path.join(RESULTS_DIR, f"scale-{args.scenario}-{started_at:%Y%m%d%H%M%S}.json")
+    with open(out, "w") as f:
+        json.dump({
+            "scenario": args.scenario,
+            "started_at": started_at.isoformat(timespec="seconds"),
+            "cpu_count": os.cpu_count(),
+            "runs": rows,
+        }, f, indent=2, ensure_ascii=False)
+    print(f"saved: {out}")
+
+
+if __name__ == "__main__":
+    main()
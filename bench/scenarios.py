@@ -0,0 +1,265 @@
+'''
+요청 시나리오 (라우터별 요청 구성과 가중치)
+'''
+import itertools
+import random
+import time
+from collections import defaultdict
+from typing import Awaitable, Callable
+import httpx
+from app.utils.pagination import encode_cursor, PAGE_MAX_LIMIT
+from .seed import PASSWORD, WORDS, sentence, user_email
+
+PAGE = 50
+CORPUS_SIZE = 20        # dedupe 시나리오의 서로 다른 파일 내용 수
+
+
+class Context:
+    '''
+    시나리오 실행 중 공유하는 상태 (시드 데이터 규모, 로그인 토큰, 업로드한 파일 이름)
+    '''
+    def __init__(self, users: int, posts_per_user: int, seed: int = 0, file_size: int = 64 * 1024, zip_files: int = 5):
+        self.users = users
+        self.posts = users * posts_per_user
+        self.file_size = file_size
+        self.zip_files = zip_files
+        self.ttfb: dict[str, list[float]] = defaultdict(list)     # 요청 이름별 첫 바이트까지의 시간(초)
+        self.rows = 0       # 목록 응답으로 받은 행 수 (행당 CPU 시간 계산용)
+        self.rng = random.Random(seed)
+        self.token: str | None = None
+        self.files: list[str] = []
+        self._serial = itertools.count()
+        self._corpus: list[bytes] = []
+
+    def serial(self) -> int:
+        return next(self._serial)
+
+    def user_id(self) -> int:
+        return self.rng.randint(1, self.users)
+
+    def post_id(self) -> int:
+        return self.rng.randint(1, max(self.posts, 1))
+
+    def deep_offset(self, total: int) -> int:
+        return self.rng.randint(0, max(total - PAGE, 0))
+
+    def corpus_file(self) -> bytes:
+        '''
+        중복이 많은 합성 파일 모음에서 하나 선택 (앞쪽 내용일수록 자주 선택, 1/(k+1) 가중치)
+        '''
+        if not self._corpus:
+            rng = random.Random(0)
+            self._corpus = [rng.randbytes(rng.randint(16, 256) * 1024) for _ in range(CORPUS_SIZE)]
+        weights = [1 / (k + 1) for k in range(len(self._corpus))]
+        return self.rng.choices(self._corpus, weights)[0]
+
+    @property
+    def auth(self) -> dict:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+Op = Callable[[httpx.AsyncClient, Context], Awaitable[httpx.Response]]
+
+
+def count_rows(ctx: Context, response: httpx.Response) -> httpx.Response:
+    '''
+    목록 응답(배열 또는 {'items': [...]})의 행 수 누적 (include=posts의 게시글 포함)
+    '''
+    if response.status_code == 200:
+        body = response.json()
+        items = body["items"] if isinstance(body, dict) else body
+        ctx.rows += len(items) + sum(len(item.get("posts", ())) for item in items)
+    return response
+
+
+# ---------------------------
+# 사용자
+# ---------------------------
+async def list_users(c, ctx):
+    return count_rows(ctx, await c.get("/users", params={"skip": ctx.deep_offset(min(ctx.users, 1000)), "limit": PAGE}))
+
+async def list_users_offset_deep(c, ctx):
+    return count_rows(ctx, await c.get("/users", params={"skip": ctx.deep_offset(ctx.users), "limit": PAGE}))
+
+async def list_users_cursor_deep(c, ctx):
+    cursor = encode_cursor(id=ctx.deep_offset(ctx.users))
+    return count_rows(ctx, await c.get("/users", params={"cursor": cursor, "limit": PAGE}))
+
+async def list_users_with_posts(c, ctx):
+    return count_rows(ctx, await c.get("/users", params={"cursor": "", "limit": 20, "include": "posts"}))
+
+async def get_user(c, ctx):
+    return await c.get(f"/users/{ctx.user_id()}")
+
+async def user_posts(c, ctx):
+    return count_rows(ctx, await c.get(f"/users/{ctx.user_id()}/posts", params={"limit": PAGE}))
+
+async def create_user(c, ctx):
+    n = ctx.serial()
+    return await c.post("/users", json={"name": f"new{n}", "email": f"new{n}-{ctx.rng.random()}@example.com", "password": PASSWORD})
+
+# ---------------------------
+# 게시글
+# ---------------------------
+async def list_posts(c, ctx):
+    return count_rows(ctx, await c.get("/post", params={"skip": ctx.deep_offset(min(ctx.posts, 1000)), "limit": PAGE}))
+
+async def list_posts_offset_deep(c, ctx):
+    return count_rows(ctx, await c.get("/post", params={"skip": ctx.deep_offset(ctx.posts), "limit": PAGE}))
+
+async def list_posts_cursor_deep(c, ctx):
+    cursor = encode_cursor(id=ctx.deep_offset(ctx.posts))
+    return count_rows(ctx, await c.get("/post", params={"cursor": cursor, "limit": PAGE}))
+
+async def list_posts_max_page(c, ctx):
+    # 직렬화 비용 측정용 (매번 다른 구간이라 응답 캐시를 거의 사용하지 않음)
+    cursor = encode_cursor(id=ctx.deep_offset(ctx.posts))
+    return count_rows(ctx, await c.get("/post", params={"cursor": cursor, "limit": PAGE_MAX_LIMIT}))
+
+async def list_users_max_page(c, ctx):
+    cursor = encode_cursor(id=ctx.deep_offset(ctx.users))
+    return count_rows(ctx, await c.get("/users", params={"cursor": cursor, "limit": PAGE_MAX_LIMIT}))
+
+async def get_post(c, ctx):
+    return await c.get(f"/post/{ctx.post_id()}")
+
+async def create_post(c, ctx):
+    return await c.post(f"/post/{ctx.user_id()}", json={"title": sentence(ctx.rng, 3), "description": sentence(ctx.rng, 12)})
+
+async def update_post(c, ctx):
+    return await c.put(f"/post/{ctx.post_id()}", json={"title": sentence(ctx.rng, 3), "description": sentence(ctx.rng, 12)})
+
+async def search_posts(c, ctx):
+    return await c.get("/post/search", params={"q": " ".join(ctx.rng.sample(WORDS, 2)), "limit": 20})
+
+async def bulk_create_posts(c, ctx):
+    # 100건을 한 번에 생성 (create_post 100회와 비교)
+    owner_id = ctx.user_id()
+    items = [{"title": sentence(ctx.rng, 3), "description": sentence(ctx.rng, 12), "owner_id": owner_id} for _ in range(100)]
+    return await c.post("/post/bulk", json=items)
+
+# ---------------------------
+# 인증
+# ---------------------------
+async def login(c, ctx):
+    return await c.post("/auth/login", json={"email": user_email(ctx.rng.randrange(ctx.users)), "password": PASSWORD})
+
+async def me(c, ctx):
+    return await c.get("/auth/me", headers=ctx.auth)
+
+async def reset_code(c, ctx):
+    return await c.post("/auth/passowrd/reset-code", json={"email": user_email(ctx.rng.randrange(ctx.users))})
+
+# ---------------------------
+# 파일
+# ---------------------------
+def file_body(ctx: Context, size: int) -> bytes:
+    # 같은 내용이 반복되도록 일부 파일은 고정 내용 (내용 해시 중복 제거 확인)
+    if ctx.rng.random() < 0.5:
+        return b"x" * size
+    return ctx.rng.randbytes(size)
+
+async def upload_file(c, ctx):
+    name = f"bench-{ctx.serial()}-{ctx.rng.randrange(1 << 30)}.txt"
+    response = await c.post("/api/files/upload", files={"file": (name, file_body(ctx, ctx.file_size), "text/plain")})
+    if response.status_code == 200:
+        ctx.files.append(name)
+    return response
+
+async def upload_duplicate(c, ctx):
+    # 이름은 매번 다르고 내용은 CORPUS_SIZE개 중 하나 (저장 용량 절감 측정)
+    name = f"dup-{ctx.serial()}-{ctx.rng.randrange(1 << 30)}.txt"
+    return await c.post("/api/files/upload", files={"file": (name, ctx.corpus_file(), "text/plain")})
+
+async def fetch_streaming(c, ctx, name: str, url: str, params: dict) -> httpx.Response:
+    '''
+    본문은 받는 대로 버리고(큰 zip을 클라이언트 메모리에 올리지 않음) 첫 바이트까지의 시간 기록
+    asgi 방식은 httpx가 응답 전체를 모은 뒤 반환하므로 uvicorn 방식에서만 의미 있음
+    '''
+    start = time.perf_counter()
+    async with c.stream("GET", url, params=params) as response:
+        first = None
+        async for _ in response.aiter_raw():
+            if first is None:
+                first = time.perf_counter() - start
+    ctx.ttfb[name].append(first if first is not None else time.perf_counter() - start)
+    return response
+
+async def download_file(c, ctx):
+    return await fetch_streaming(c, ctx, "download_file", "/api/files/download", {"filenames": ctx.rng.choice(ctx.files)})
+
+async def download_zip(c, ctx):
+    names = ctx.rng.sample(ctx.files, min(ctx.zip_files, len(ctx.files)))
+    return await fetch_streaming(c, ctx, "download_zip", "/api/files/download", {"filenames": ",".join(names)})
+
+async def list_files(c, ctx):
+    return await c.get("/api/files/list", params={"limit": PAGE})
+
+
+# 시나리오 이름 → (가중치, 요청) 목록
+SCENARIOS: dict[str, list[tuple[int, Op]]] = {
+    "users": [
+        (30, get_user), (25, list_users), (15, user_posts), (10, list_users_with_posts), (5, create_user),
+    ],
+    "posts": [
+        (35, get_post), (25, list_posts), (15, search_posts), (15, create_post), (10, update_post),
+    ],
+    "auth": [
+        (60, me), (30, login), (10, reset_code),
+    ],
+    "files": [
+        (40, download_file), (20, download_zip), (20, list_files), (20, upload_file),
+    ],
+    "upload": [
+        (1, upload_file),
+    ],
+    "zip": [
+        (1, download_zip),
+    ],
+    "dedupe": [
+        (1, upload_duplicate),
+    ],
+    "pagination": [
+        (1, list_users_offset_deep), (1, list_users_cursor_deep), (1, list_posts_offset_deep), (1, list_posts_cursor_deep),
+    ],
+    "bulk": [
+        (100, create_post), (1, bulk_create_posts),
+    ],
+    "search": [
+        (1, search_posts),
+    ],
+    "serialize": [
+        (1, list_posts_max_page), (1, list_users_max_page),
+    ],
+    "login_reads": [
+        (1, get_post), (1, list_posts),
+    ],
+    "mixed": [
+        (25, get_post), (10, get_user), (12, list_posts), (8, list_users), (5, user_posts), (3, list_users_with_posts),
+        (10, search_posts), (8, me), (5, create_post), (3, update_post), (3, login), (1, reset_code),
+        (4, download_file), (1, download_zip), (1, list_files), (1, upload_file),
+    ],
+}
+
+# 시나리오 이름 → 가중치 요청과 별도로 --background-concurrency개의 가상 사용자가 계속 반복하는 요청
+# 느린 요청(bcrypt 로그인)이 가중치에 따라 가상 사용자를 차지하지 않고 일정한 동시 부하로 유지됨
+BACKGROUND: dict[str, Op] = {
+    "login_reads": login,
+}
+
+# 시나리오 실행 전 준비가 필요한 요청
+NEEDS_TOKEN = {me}
+NEEDS_FILES = {download_file, download_zip}
+
+
+async def prepare(client: httpx.AsyncClient, ctx: Context, ops: list[Op], files: int):
+    '''
+    로그인 토큰 발급, 다운로드 대상 파일 업로드
+    '''
+    if NEEDS_TOKEN & set(ops):
+        response = await client.post("/auth/login", json={"email": user_email(0), "password": PASSWORD})
+        response.raise_for_status()
+        ctx.token = response.json()["access_token"]
+    if NEEDS_FILES & set(ops):
+        for _ in range(files):
+            (await upload_file(client, ctx)).raise_for_status()
@@ -0,0 +1,58 @@
+'''
+벤치마크 데이터 생성 (사용자 / 게시글)
+'''
+import random
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+PASSWORD = "bench-password"
+WORDS = [
+    "fastapi", "redis", "mysql", "async", "cache", "index", "query", "python", "bench", "latency",
+    "서버", "검색", "게시글", "사용자", "성능", "캐시", "페이지", "데이터", "요청", "응답",
+]
+CHUNK = 1000
+
+
+def user_email(i: int) -> str:
+    return f"user{i}@example.com"
+
+def sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choices(WORDS, k=n))
+
+
+async def seed(db_url: str, users: int, posts_per_user: int, seed: int = 0):
+    from app import models
+    from app.database import enable_sqlite_foreign_keys
+    from app.utils.security import hash_password
+
+    rng = random.Random(seed)
+    hashed = hash_password(PASSWORD)    # bcrypt는 한 번만 계산해서 모든 사용자에 사용
+    engine = enable_sqlite_foreign_keys(create_async_engine(db_url, poolclass=NullPool))
+    async with engine.begin() as conn:
+        # 동시 쓰기 중 읽기가 막히지 않도록 WAL 사용 (DB 파일에 유지됨)
+        if conn.dialect.name == "sqlite":
+            await conn.execute(text("PRAGMA journal_mode=WAL"))
+        await conn.run_sync(models.Base.metadata.drop_all)
+        await conn.run_sync(models.Base.metadata.create_all)
+
+        for start in range(0, users, CHUNK):
+            await conn.execute(insert(models.User), [
+                {"name": f"user{i}", "email": user_email(i), "hashed_pw": hashed, "is_active": True}
+                for i in range(start, min(start + CHUNK, users))
+            ])
+
+        rows = []
+        for owner_id in range(1, users + 1):
+            for _ in range(posts_per_user):
+                rows.append({
+                    "title": sentence(rng, 3),
+                    "description": sentence(rng, 12),
+                    "owner_id": owner_id,
+                })
+                if len(rows) >= CHUNK:
+                    await conn.execute(insert(models.Post), rows)
+                    rows = []
+        if rows:
+            await conn.execute(insert(models.Post), rows)
+    await engine.dispose()
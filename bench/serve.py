@@ -0,0 +1,14 @@
+'''
+uvicorn 실행용 앱
+환경 변수는 bench.run이 설정해서 실행함 (공유 fakeredis 서버를 띄운 경우 BENCH_SHARED_REDIS, REDIS_HOST/REDIS_PORT)
+공유 서버가 없으면 워커 프로세스마다 fakeredis 주입
+
+uvicorn bench.serve:app --port 8001
+'''
+import os
+from .stubs import install_fake_redis
+
+if not os.getenv("BENCH_SHARED_REDIS"):
+    install_fake_redis()
+
+from app.main import app  # noqa: E402
@@ -0,0 +1,165 @@
+'''
+MySQL / Redis / SMTP 대체 구성
+app 모듈은 환경 변수를 import 시점에 읽으므로 configure_env를 먼저 호출해야 함
+'''
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RATE_LIMITS = ("LOGIN_IP", "LOGIN_EMAIL", "RESET_CODE_IP", "RESET_CODE_EMAIL", "VERIFY_CODE_IP")
+
+
+def prepare_workdir(workdir: str):
+    '''
+    업로드 파일이 저장소를 더럽히지 않도록 작업 디렉토리에서 실행
+    (UPLOAD_DIR, 템플릿 경로가 app/ 기준 상대 경로이므로 템플릿만 연결)
+    '''
+    os.makedirs(os.path.join(workdir, "app"), exist_ok=True)
+    templates = os.path.join(workdir, "app", "templates")
+    if not os.path.exists(templates):
+        os.symlink(os.path.join(REPO_DIR, "app", "templates"), templates)
+
+
+def bench_env(workdir: str, smtp_port: int, overrides: dict[str, str]) -> dict[str, str]:
+    '''
+    벤치마크용 환경 변수 (overrides가 우선)
+    '''
+    env = {
+        "DB_URL": f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}",
+        "SECRET_KEY": "bench-secret",
+        "SEARCH_BACKEND": "memory",     # sqlite에는 FULLTEXT가 없음
+        "EMAIL_HOST": "127.0.0.1",
+        "EMAIL_PORT": str(smtp_port),
+        "EMAIL_USE_TLS": "false",
+        "EMAIL_USER": "bench@example.com",
+    }
+    # 요청 제한은 기본적으로 해제 (제한 비용은 --env RATE_LIMIT_...=N/S 로 측정)
+    env.update({f"RATE_LIMIT_{name}": "0/60" for name in RATE_LIMITS})
+    env.update(overrides)
+    return env
+
+
+def configure_env(workdir: str, env: dict[str, str]):
+    os.environ.update(env)
+    os.chdir(workdir)
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+
+
+def install_fake_redis():
+    '''
+    프로세스 내 fakeredis 주입 (지표 수집이 켜져 있으면 명령 시간도 기록)
+    '''
+    import fakeredis
+    from app.utils import redis_client
+    from app.utils.instrumentation import METRICS_ENABLED
+
+    base = redis_client._TimedRedis if METRICS_ENABLED else fakeredis.FakeAsyncRedis
+    client_class = type("BenchRedis", (base, fakeredis.FakeAsyncRedis), {})
+    redis_client.set_redis(client_class(decode_responses=True))
+
+
+class SharedFakeRedis:
+    '''
+    여러 워커 프로세스가 함께 사용하는 fakeredis TCP 서버 (별도 프로세스에서 실행)
+    워커마다 fakeredis를 주입하면 캐시 / 요청 제한 / 메일 큐가 워커별로 나뉘므로 uvicorn 방식에서 사용
+    '''
+    SERVER = "import sys; from fakeredis import TcpFakeServer; TcpFakeServer(('127.0.0.1', int(sys.argv[1]))).serve_forever()"
+
+    def __init__(self):
+        self.port = 0
+        self._proc: subprocess.Popen | None = None
+
+    @property
+    def env(self) -> dict[str, str]:
+        # bench.serve는 BENCH_SHARED_REDIS가 있으면 fakeredis를 주입하지 않고 REDIS_HOST/REDIS_PORT로 접속
+        return {"BENCH_SHARED_REDIS": "1", "REDIS_HOST": "127.0.0.1", "REDIS_PORT": str(self.port)}
+
+    async def start(self, timeout: float = 10):
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        self._proc = subprocess.Popen([sys.executable, "-c", self.SERVER, str(self.port)])
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", self.port)
+                writer.close()
+                await writer.wait_closed()
+                return
+            except OSError:
+                if self._proc.poll() is not None or asyncio.get_running_loop().time() > deadline:
+                    raise RuntimeError("fakeredis server did not start")
+                await asyncio.sleep(0.05)
+
+    def stop(self):
+        if self._proc is not None:
+            self._proc.terminate()
+            self._proc.wait(timeout=10)
+
+
+class DummySMTP:
+    '''
+    모든 명령에 성공으로 응답하고 받은 메일 수만 세는 SMTP 서버
+    refuse에 지정한 수신자는 RCPT TO에 지정한 응답 코드로 거부 (테스트용, 예: {"a@example.com": 451})
+    '''
+    def __init__(self, refuse: dict[str, int] | None = None):
+        self.messages = 0
+        self.connections = 0
+        self.delivered: list[str] = []                  # 받은 메일의 수신자
+        self.rejected: list[tuple[str, float]] = []     # 거부한 수신자, 시각(time.monotonic)
+        self.refuse = refuse or {}
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def port(self) -> int:
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, port: int = 0):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", port)
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        recipient = None
+        writer.write(b"220 bench ESMTP\r\n")
+        try:
+            while line := await reader.readline():
+                command = line[:4].upper()
+                if command in (b"EHLO", b"HELO"):
+                    writer.write(b"250-bench\r\n250 OK\r\n")
+                elif command == b"RCPT":
+                    recipient = line.decode().partition("<")[2].partition(">")[0]
+                    code = self.refuse.get(recipient)
+                    if code is None:
+                        writer.write(b"250 OK\r\n")
+                    else:
+                        self.rejected.append((recipient, time.monotonic()))
+                        writer.write(f"{code} Recipient refused\r\n".encode())
+                elif command == b"DATA":
+                    writer.write(b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                    await writer.drain()
+                    while (data := await reader.readline()) not in (b".\r\n", b""):
+                        pass
+                    self.messages += 1
+                    self.delivered.append(recipient)
+                    writer.write(b"250 OK\r\n")
+                elif command == b"QUIT":
+                    writer.write(b"221 Bye\r\n")
+                    await writer.drain()
+                    break
+                else:
+                    writer.write(b"250 OK\r\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,124 @@
+'''
+테스트 공통 구성
+벤치마크와 같은 대체 구성(aiosqlite, fakeredis)으로 앱을 실행하므로 MySQL / Redis / SMTP 없이 실행 가능
+app 모듈은 환경 변수를 import 시점에 읽으므로 app을 import하기 전에 환경 변수 설정
+'''
+import os
+import tempfile
+
+import httpx
+import pytest
+from sqlalchemy import event, insert
+from sqlalchemy.engine import Engine
+
+from bench.stubs import bench_env, install_fake_redis, prepare_workdir
+
+TEST_MYSQL_URL = os.getenv("TEST_MYSQL_URL")   # mysql 표시 테스트용 빈 DB (mysql+asyncmy://...), 없으면 건너뜀
+
+WORKDIR = tempfile.mkdtemp(prefix="app-tests-")
+prepare_workdir(WORKDIR)
+# 메일은 outbox 큐에만 쌓고 발송하지 않음, 검색 색인은 요청으로 반영되는 증분 갱신만 사용
+os.environ.update(bench_env(WORKDIR, smtp_port=0, overrides={"MAIL_WORKER_ENABLED": "false"}))
+
+
+def pytest_collection_modifyitems(config, items):
+    if TEST_MYSQL_URL:
+        return
+    skip = pytest.mark.skip(reason="TEST_MYSQL_URL이 설정되지 않음")
+    for item in items:
+        if "mysql" in item.keywords:
+            item.add_marker(skip)
+
+
+class QueryCounter:
+    '''
+    실행된 SQL 문 기록 (before_cursor_execute, primary/복제본 모든 엔진)
+    '''
+    def __init__(self):
+        self.statements: list[str] = []
+        self.parameters: list = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.parameters.append(parameters)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def reset(self):
+        self.statements.clear()
+        self.parameters.clear()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def app(anyio_backend, monkeypatch):
+    '''
+    테스트마다 빈 DB / Redis로 시작
+    (lifespan의 메일 워커 / 검색 색인 재구성 작업은 실행하지 않음)
+    업로드 / 템플릿 경로가 app/ 기준 상대 경로이므로 작업 디렉토리에서 실행
+    '''
+    monkeypatch.chdir(WORKDIR)
+    from app import config, models
+    from app.database import close_engine, init_engine
+    from app.main import app
+    from app.utils.redis_client import close_redis, get_redis
+
+    install_fake_redis()
+    await get_redis().flushall()
+    async with init_engine().begin() as conn:
+        await conn.run_sync(models.Base.metadata.drop_all)
+        await conn.run_sync(models.Base.metadata.create_all)
+    await config.startup()
+    try:
+        yield app
+    finally:
+        # aiosqlite 연결 / fakeredis는 테스트마다 다른 이벤트 루프에서 실행되므로 정리
+        await close_redis()
+        await close_engine()
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def seed(app):
+    '''
+    사용자 / 게시글 직접 생성 (API를 거치지 않으므로 bcrypt 비용 없음)
+    seed(users=3, posts_per_user=2) → 사용자 id 1..3, 게시글은 사용자 순서대로 id 1..6
+    '''
+    from app import models
+    from app.database import init_engine
+
+    async def create(users: int, posts_per_user: int = 0):
+        async with init_engine().begin() as conn:
+            await conn.execute(insert(models.User), [
+                {"name": f"user{i}", "email": f"user{i}@example.com", "hashed_pw": "x", "is_active": True}
+                for i in range(1, users + 1)
+            ])
+            if posts_per_user:
+                await conn.execute(insert(models.Post), [
+                    {"title": f"title {owner_id}-{n}", "description": "description", "owner_id": owner_id}
+                    for owner_id in range(1, users + 1)
+                    for n in range(posts_per_user)
+                ])
+
+    return create
+
+
+@pytest.fixture
+def queries():
+    counter = QueryCounter()
+    event.listen(Engine, "before_cursor_execute", counter)
+    try:
+        yield counter
+    finally:
+        event.remove(Engine, "before_cursor_execute", counter)
@@ -0,0 +1,77 @@
+'''
+read_through / invalidate 순서 (DB 조회 도중에 무효화되면 이전 값을 캐시에 남기지 않음)
+'''
+import asyncio
+
+import pytest
+
+from app import schema
+from app.utils import cache
+from app.utils.redis_client import get_redis
+
+pytestmark = pytest.mark.anyio
+
+KEY = cache.user_key(1)
+
+
+def user(name: str) -> schema.User:
+    return schema.User(id=1, name=name, email="user1@example.com", is_active=True)
+
+
+class Loader:
+    '''
+    release()까지 멈춰 있다가 그 시점의 DB 값을 반환하는 loader
+    '''
+    def __init__(self, value: str):
+        self.value = value
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.released = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        value = self.value      # 무효화 전에 읽은 값
+        self.started.set()
+        await self.released.wait()
+        return user(value)
+
+
+async def test_invalidate_during_load_is_not_overwritten(app):
+    db = Loader("old")
+    reader = asyncio.create_task(cache.read_through(KEY, schema.User, db))
+    await db.started.wait()
+
+    # 읽는 도중에 수정 commit + 무효화
+    db.value = "new"
+    await cache.invalidate(KEY)
+    db.released.set()
+
+    assert (await reader).name == "old"
+    assert await get_redis().get(KEY) is None
+
+    assert (await cache.read_through(KEY, schema.User, db)).name == "new"
+    assert db.calls == 2
+    assert (await cache.read_through(KEY, schema.User, db)).name == "new"
+    assert db.calls == 2
+
+
+async def test_reader_after_invalidate_does_not_join_stale_load(app):
+    db = Loader("old")
+    first = asyncio.create_task(cache.read_through(KEY, schema.User, db))
+    await db.started.wait()
+    # 무효화 전에 도착한 요청은 진행 중인 조회 결과를 기다림
+    coalesced = cache.stats["coalesced"]
+    waiter = asyncio.create_task(cache.read_through(KEY, schema.User, db))
+    while cache.stats["coalesced"] == coalesced:
+        await asyncio.sleep(0)
+
+    db.value = "new"
+    await cache.invalidate(KEY)
+    db.started.clear()
+    second = asyncio.create_task(cache.read_through(KEY, schema.User, db))
+    await asyncio.wait_for(db.started.wait(), 5)    # 진행 중인 조회를 기다리지 않고 새로 조회
+    db.released.set()
+
+    assert [(await task).name for task in (first, waiter, second)] == ["old", "old", "new"]
+    assert db.calls == 2
+    assert schema.User.model_validate_json(await get_redis().get(KEY)).name == "new"
@@ -0,0 +1,82 @@
+'''
+파일 삭제시 blob 파일은 commit이 성공한 뒤에만 삭제
+'''
+import hashlib
+import os
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import OperationalError
+
+from app import crud, models
+from app.database import SessionLocal
+from app.utils import files
+
+pytestmark = pytest.mark.anyio
+
+CONTENT = b"hello"
+SHA256 = hashlib.sha256(CONTENT).hexdigest()
+
+
+@pytest.fixture
+async def uploaded(client):
+    response = await client.post("/api/files/upload", files={"file": ("a.txt", CONTENT, "text/plain")})
+    assert response.status_code == 200, response.text
+    assert os.path.exists(files.blob_path(SHA256))
+
+
+@pytest.fixture
+def removed():
+    '''
+    remove_blob 호출 기록 (실제 삭제도 수행)
+    '''
+    calls = []
+
+    async def remove_blob(sha256: str):
+        calls.append(sha256)
+        files.remove_blob(sha256)
+
+    return calls, remove_blob
+
+
+async def test_blob_is_removed_after_commit(uploaded, removed):
+    calls, remove_blob = removed
+    async with SessionLocal() as db:
+        assert await crud.delete_file(db, "a.txt", remove_blob)
+
+    assert calls == [SHA256]
+    assert not os.path.exists(files.blob_path(SHA256))
+
+
+async def test_failed_commit_keeps_blob(uploaded, removed, monkeypatch):
+    calls, remove_blob = removed
+    async with SessionLocal() as db:
+        async def commit():
+            raise OperationalError("COMMIT", {}, Exception("disk I/O error"))
+        monkeypatch.setattr(db, "commit", commit)
+
+        with pytest.raises(OperationalError):
+            await crud.delete_file(db, "a.txt", remove_blob)
+
+    assert calls == []
+    assert os.path.exists(files.blob_path(SHA256))
+
+
+async def test_reuploaded_blob_is_kept(uploaded, removed, monkeypatch):
+    # 삭제 commit 직후 같은 내용이 다시 업로드되어 blob 행이 생긴 경우
+    calls, remove_blob = removed
+    async with SessionLocal() as db:
+        commit = db.commit
+
+        async def commit_then_reupload():
+            await commit()
+            monkeypatch.setattr(db, "commit", commit)
+            async with SessionLocal() as other:
+                await other.execute(insert(models.Blob).values(sha256=SHA256, size=len(CONTENT), ref_count=1))
+                await other.commit()
+
+        monkeypatch.setattr(db, "commit", commit_then_reupload)
+        assert await crud.delete_file(db, "a.txt", remove_blob)
+
+    assert calls == []
+    assert os.path.exists(files.blob_path(SHA256))
@@ -0,0 +1,125 @@
+'''
+MailWorker를 로컬 SMTP 서버(bench.stubs.DummySMTP)에 연결해서 발송
+- 큐에 쌓인 메일을 한 배치 / 하나의 SMTP 연결로 발송
+- 일시적으로 거부된 수신자는 backoff 후 재시도, 재시도 횟수를 넘으면 mail:dead로 이동
+- 영구 거부는 재시도 없이 mail:dead로 이동
+'''
+import asyncio
+import inspect
+import json
+import time
+
+import pytest
+
+from app.utils import email
+from app.utils.redis_client import get_redis
+from bench.stubs import DummySMTP
+
+pytestmark = pytest.mark.anyio
+
+BAD = "bad@example.com"
+
+
+@pytest.fixture
+async def smtp(app, monkeypatch):
+    server = DummySMTP()
+    await server.start()
+    monkeypatch.setattr(email, "EMAIL_PORT", server.port)
+    try:
+        yield server
+    finally:
+        await server.stop()
+
+
+@pytest.fixture
+async def worker(smtp):
+    worker = email.MailWorker()
+    try:
+        yield worker
+    finally:
+        await worker.stop(timeout=5)
+
+
+async def wait_until(condition, timeout: float = 10):
+    '''
+    condition()이 참이 될 때까지 대기 (redis 조회처럼 awaitable을 반환해도 됨)
+    '''
+    deadline = time.monotonic() + timeout
+    while True:
+        result = condition()
+        if inspect.isawaitable(result):
+            result = await result
+        if result:
+            return
+        assert time.monotonic() < deadline, "timeout"
+        await asyncio.sleep(0.02)
+
+
+async def queues_empty() -> bool:
+    r = get_redis()
+    return not await r.llen(email.MAIL_QUEUE_KEY) and not await r.zcard(email.MAIL_RETRY_KEY)
+
+
+async def test_batch_is_sent_over_one_connection(smtp, worker, monkeypatch):
+    batches = []
+    deliver = email.MailWorker._deliver
+
+    def spy(self, jobs):
+        batches.append(len(jobs))
+        return deliver(self, jobs)
+
+    monkeypatch.setattr(email.MailWorker, "_deliver", spy)
+    recipients = [f"user{i}@example.com" for i in range(5)]
+    for to in recipients:
+        await email.enqueue_email_code(to, "123456")
+
+    worker.start()
+    await wait_until(lambda: len(smtp.delivered) == 5)
+    assert batches == [5]
+    assert sorted(smtp.delivered) == recipients
+
+    # 다음 배치도 같은 SMTP 연결 재사용
+    await email.enqueue_email_code("late@example.com", "123456")
+    await wait_until(lambda: len(smtp.delivered) == 6)
+    assert smtp.connections == 1
+    # 발송한 작업은 처리 중 목록에서 제거
+    async def processing_empty():
+        return not await get_redis().llen(worker._processing_key)
+    await wait_until(processing_empty)
+
+
+async def test_transient_refusal_is_retried_then_dead_lettered(smtp, worker, monkeypatch):
+    monkeypatch.setattr(email, "MAIL_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(email, "MAIL_RETRY_BACKOFF", 0.1)
+    smtp.refuse[BAD] = 451
+    await email.enqueue_email_code(BAD, "123456")
+    await email.enqueue_email_code("good@example.com", "123456")
+
+    worker.start()
+    await wait_until(lambda: get_redis().llen(email.MAIL_DEAD_KEY))
+
+    times = [at for to, at in smtp.rejected]
+    assert len(times) == 3
+    # 재시도 간격은 MAIL_RETRY_BACKOFF부터 시도마다 2배
+    for attempt, (before, after) in enumerate(zip(times, times[1:])):
+        assert after - before >= 0.1 * 2 ** attempt
+    assert smtp.delivered == ["good@example.com"]
+    assert smtp.connections == 1
+
+    dead = json.loads(await get_redis().lindex(email.MAIL_DEAD_KEY, 0))
+    assert json.loads(dead["job"])["to"] == BAD
+    assert "451" in dead["error"]
+    assert await queues_empty()
+
+
+async def test_permanent_refusal_is_dead_lettered_without_retry(smtp, worker):
+    smtp.refuse[BAD] = 550
+    await email.enqueue_email_code(BAD, "123456")
+
+    worker.start()
+    await wait_until(lambda: get_redis().llen(email.MAIL_DEAD_KEY))
+
+    assert len(smtp.rejected) == 1
+    dead = json.loads(await get_redis().lindex(email.MAIL_DEAD_KEY, 0))
+    assert "550" in dead["error"]
+    assert await queues_empty()
@@ -0,0 +1,125 @@
+'''
+마이그레이션으로 만든 스키마 확인
+- 사용자별 게시글 조회가 ix_posts_owner_id를 사용하는지 (SQLite: EXPLAIN QUERY PLAN, MySQL: EXPLAIN)
+- 0002의 ON DELETE CASCADE (사용자 삭제시 게시글도 삭제, 0001로 되돌리면 삭제 거부)
+'''
+import os
+import re
+import sqlite3
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app import crud, database, models
+from bench.stubs import REPO_DIR
+
+from .conftest import TEST_MYSQL_URL
+
+OWNER_INDEX = "ix_posts_owner_id"
+
+
+def alembic_config() -> Config:
+    config = Config(os.path.join(REPO_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(REPO_DIR, "app", "migrations"))
+    return config
+
+
+def migrate(monkeypatch, db_url: str, revision: str = "head"):
+    # migrations/env.py는 app.database.DB_URL로 접속
+    monkeypatch.setattr(database, "DB_URL", db_url)
+    command.upgrade(alembic_config(), revision)
+
+
+@pytest.fixture
+def sqlite_path(tmp_path, monkeypatch) -> str:
+    path = str(tmp_path / "migrated.db")
+    migrate(monkeypatch, f"sqlite+aiosqlite:///{path}")
+    return path
+
+
+@pytest.fixture
+def mysql_url(monkeypatch):
+    migrate(monkeypatch, TEST_MYSQL_URL)
+    try:
+        yield TEST_MYSQL_URL
+    finally:
+        command.downgrade(alembic_config(), "base")
+
+
+async def owner_lookups(db_url: str, queries) -> list[tuple[str, object]]:
+    '''
+    crud의 사용자별 게시글 조회를 실행하고 실제 실행된 (SQL, 파라미터) 반환
+    '''
+    engine = database.enable_sqlite_foreign_keys(create_async_engine(db_url, poolclass=NullPool))
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(insert(models.User), [
+                {"name": f"user{i}", "email": f"user{i}@example.com", "hashed_pw": "x", "is_active": True}
+                for i in range(1, 21)
+            ])
+            await conn.execute(insert(models.Post), [
+                {"title": "title", "description": "description", "owner_id": owner_id}
+                for owner_id in range(1, 21)
+                for _ in range(10)
+            ])
+        async with AsyncSession(engine) as db:
+            queries.reset()
+            await crud.get_user_posts_after(db, 3, after_id=0, limit=5)
+            await crud.get_posts_by_owners(db, [1, 2, 3], per_owner=5)
+        return list(zip(queries.statements, queries.parameters))
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_owner_lookup_uses_index_sqlite(sqlite_path, queries):
+    for statement, parameters in await owner_lookups(f"sqlite+aiosqlite:///{sqlite_path}", queries):
+        with sqlite3.connect(sqlite_path) as conn:
+            plan = " / ".join(row[-1] for row in conn.execute("EXPLAIN QUERY PLAN " + statement, parameters))
+        assert re.search(rf"SEARCH posts USING (COVERING )?INDEX {OWNER_INDEX}", plan), (statement, plan)
+        assert "SCAN posts" not in plan, (statement, plan)
+
+
+@pytest.mark.mysql
+@pytest.mark.anyio
+async def test_owner_lookup_uses_index_mysql(mysql_url, queries):
+    engine = create_async_engine(mysql_url, poolclass=NullPool)
+    try:
+        for statement, parameters in await owner_lookups(mysql_url, queries):
+            async with engine.connect() as conn:
+                plan = (await conn.exec_driver_sql("EXPLAIN " + statement, parameters)).mappings().all()
+            posts = [row for row in plan if row["table"] == "posts"]
+            assert posts and all(row["key"] == OWNER_INDEX for row in posts), (statement, plan)
+    finally:
+        await engine.dispose()
+
+
+def test_delete_user_cascades_to_posts(sqlite_path, monkeypatch):
+    def create_user_with_posts(conn: sqlite3.Connection) -> int:
+        user_id = conn.execute(
+            "INSERT INTO users (name, email, hashed_pw, is_active) VALUES ('a', ?, 'x', 1)",
+            (f"user{conn.total_changes}@example.com",),
+        ).lastrowid
+        conn.executemany(
+            "INSERT INTO posts (title, description, owner_id) VALUES ('t', 'd', ?)", [(user_id,)] * 3
+        )
+        return user_id
+
+    with sqlite3.connect(sqlite_path) as conn:
+        conn.execute("PRAGMA foreign_keys=ON")
+        kept = create_user_with_posts(conn)
+        deleted = create_user_with_posts(conn)
+        conn.execute("DELETE FROM users WHERE id = ?", (deleted,))
+        owners = [row[0] for row in conn.execute("SELECT owner_id FROM posts")]
+    assert owners == [kept] * 3
+
+    # 0001로 되돌리면 게시글이 있는 사용자는 삭제할 수 없음
+    command.downgrade(alembic_config(), "0001")
+    with sqlite3.connect(sqlite_path) as conn:
+        conn.execute("PRAGMA foreign_keys=ON")
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("DELETE FROM users WHERE id = ?", (kept,))
@@ -0,0 +1,78 @@
+'''
+목록 조회 API의 쿼리 수 회귀 테스트 (사용자마다 게시글을 따로 조회하는 N+1이 생기지 않도록)
+'''
+import pytest
+
+from app.utils.pagination import INCLUDE_POSTS_LIMIT, PAGE_MAX_LIMIT
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.mark.parametrize("limit", [1, 5, 20])
+@pytest.mark.parametrize("cursor", [None, ""])
+async def test_include_posts_query_count_is_constant(client, seed, queries, limit, cursor):
+    # 사용자 수(limit)와 관계없이 사용자 조회 1회 + 게시글 IN 조회 1회
+    await seed(users=20, posts_per_user=3)
+    params = {"limit": limit, "include": "posts"}
+    if cursor is not None:
+        params["cursor"] = cursor
+    queries.reset()
+
+    response = await client.get("/users", params=params)
+
+    assert response.status_code == 200, response.text
+    users = response.json() if cursor is None else response.json()["items"]
+    assert len(users) == limit
+    assert all(len(user["posts"]) == 3 for user in users)
+    assert queries.count == 2, queries.statements
+
+
+async def test_include_posts_is_capped_per_user(client, seed):
+    await seed(users=2, posts_per_user=INCLUDE_POSTS_LIMIT + 5)
+
+    response = await client.get("/users", params={"cursor": "", "include": "posts"})
+
+    assert response.status_code == 200, response.text
+    for user in response.json()["items"]:
+        posts = user["posts"]
+        assert len(posts) == INCLUDE_POSTS_LIMIT
+        assert {post["owner_id"] for post in posts} == {user["id"]}
+        # id 순 첫 페이지 (GET /users/{id}/posts의 첫 페이지와 같음)
+        assert [post["id"] for post in posts] == sorted(post["id"] for post in posts)
+        first_page = await client.get(f"/users/{user['id']}/posts", params={"limit": INCLUDE_POSTS_LIMIT})
+        assert [post["id"] for post in first_page.json()["items"]] == [post["id"] for post in posts]
+
+
+async def test_user_posts_query_count(client, seed, queries):
+    await seed(users=2, posts_per_user=5)
+
+    queries.reset()
+    first = await client.get("/users/1/posts", params={"limit": 3})
+    assert first.status_code == 200, first.text
+    assert queries.count == 1, queries.statements
+
+    queries.reset()
+    second = await client.get("/users/1/posts", params={"limit": 3, "cursor": first.json()["next_cursor"]})
+    assert second.status_code == 200, second.text
+    assert [post["id"] for post in second.json()["items"]] == [4, 5]
+    assert second.json()["next_cursor"] is None
+    assert queries.count == 1, queries.statements
+
+
+async def test_user_posts_missing_user(client, seed, queries):
+    # 게시글이 없는 첫 페이지만 사용자 존재 여부 확인
+    await seed(users=1)
+    queries.reset()
+
+    assert (await client.get("/users/1/posts")).status_code == 200
+    assert queries.count == 2, queries.statements
+    assert (await client.get("/users/99/posts")).status_code == 404
+
+
+@pytest.mark.parametrize("url", ["/users", "/post", "/users/1/posts"])
+async def test_limit_is_bounded(client, seed, url):
+    await seed(users=1)
+
+    assert (await client.get(url, params={"limit": PAGE_MAX_LIMIT})).status_code == 200
+    assert (await client.get(url, params={"limit": PAGE_MAX_LIMIT + 1})).status_code == 422
+    assert (await client.get(url, params={"limit": 0})).status_code == 422
@@ -0,0 +1,113 @@
+'''
+읽기 복제본 라우팅 (primary / 복제본 모두 로컬 SQLite로 대체)
+복제본에는 primary와 다른 데이터를 넣어 어느 쪽에서 조회했는지 구분
+'''
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import database, models
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def replica(app, seed, tmp_path, monkeypatch):
+    await seed(users=1, posts_per_user=1)    # primary: user1, "title 1-0"
+
+    engine = database.enable_sqlite_foreign_keys(create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}"))
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        await conn.execute(insert(models.User), [
+            {"name": "replica", "email": "replica@example.com", "hashed_pw": "x", "is_active": True},
+        ])
+        await conn.execute(insert(models.Post), [{"title": "replica post", "description": "d", "owner_id": 1}])
+
+    replica = database.Replica("replica", engine)
+    monkeypatch.setattr(database.replicas, "replicas", [replica])
+    monkeypatch.setattr(database, "DB_REPLICA_STANDIN", True)
+    await database.replicas.check_all()
+    try:
+        yield replica
+    finally:
+        await engine.dispose()
+
+
+def set_lag(monkeypatch, lag):
+    async def fake_lag(self, conn):
+        return lag
+    monkeypatch.setattr(database.ReplicaSet, "_lag", fake_lag)
+
+
+async def post_titles(client) -> list[str]:
+    response = await client.get("/post")
+    assert response.status_code == 200, response.text
+    return [post["title"] for post in response.json()]
+
+
+async def test_list_reads_use_replica(client, replica):
+    assert replica.healthy and replica.lag == 0
+
+    assert await post_titles(client) == ["replica post"]
+    response = await client.get("/users")
+    assert [user["name"] for user in response.json()] == ["replica"]
+    # 캐시를 채우는 단건 조회는 primary
+    assert (await client.get("/users/1")).json()["name"] == "user1"
+
+
+async def test_write_makes_client_read_primary(client, replica):
+    assert await post_titles(client) == ["replica post"]
+
+    # 실패한 쓰기는 쿠키 없음
+    response = await client.post("/post/99", json={"title": "new", "description": "d"})
+    assert response.status_code == 404
+    assert database.DB_STICKY_COOKIE not in response.cookies
+
+    response = await client.post("/post/1", json={"title": "new", "description": "d"})
+    assert response.status_code == 200, response.text
+    assert database.DB_STICKY_COOKIE in response.cookies
+
+    assert await post_titles(client) == ["title 1-0", "new"]
+
+    # 쿠키가 없는 클라이언트도 primary에서 만든 최신 버전의 응답 캐시를 받음 (이전 버전의 복제본 결과로 돌아가지 않음)
+    client.cookies.clear()
+    assert await post_titles(client) == ["title 1-0", "new"]
+
+
+async def test_lagging_replica_falls_back_to_primary(client, replica, monkeypatch):
+    set_lag(monkeypatch, database.DB_REPLICA_MAX_LAG + 1)
+    await database.replicas.check_all()
+
+    assert not replica.healthy
+    assert replica.lag == database.DB_REPLICA_MAX_LAG + 1
+    assert await post_titles(client) == ["title 1-0"]
+
+
+async def test_lagging_replica_response_is_not_cached(client, replica, monkeypatch):
+    # 허용 범위 안의 지연은 복제본에서 조회하지만 응답 캐시 / ETag로 사용하지 않음
+    set_lag(monkeypatch, database.DB_REPLICA_MAX_LAG / 2)
+    await database.replicas.check_all()
+    assert replica.healthy
+
+    response = await client.get("/post")
+    assert [post["title"] for post in response.json()] == ["replica post"]
+    assert "etag" not in response.headers
+
+    set_lag(monkeypatch, 0)
+    await database.replicas.check_all()
+    assert "etag" in (await client.get("/post")).headers
+
+
+@pytest.mark.parametrize("state", ["no_status", "stopped"])
+async def test_replica_without_known_lag_is_not_used(client, replica, monkeypatch, state):
+    if state == "no_status":
+        # 복제 상태가 없는 DB를 대체 DB로 지정하지 않은 경우
+        monkeypatch.setattr(database, "DB_REPLICA_STANDIN", False)
+    else:
+        # 복제가 멈추면 Seconds_Behind_Source가 NULL
+        set_lag(monkeypatch, None)
+    await database.replicas.check_all()
+
+    assert not replica.healthy
+    assert replica.lag is None
+    assert await post_titles(client) == ["title 1-0"]
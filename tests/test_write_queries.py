@@ -0,0 +1,170 @@
+'''
+쓰기 API별 실행되는 SQL 문 수 고정 (refresh / 사전 조회 같은 추가 왕복이 다시 생기지 않도록)
+BEGIN / COMMIT은 커서로 실행되지 않으므로 세지 않음
+'''
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+PASSWORD = "password123"
+
+
+def verbs(statements: list[str]) -> list[str]:
+    return [statement.split(None, 1)[0].upper() for statement in statements]
+
+
+# (method, url, 요청 인자, status, 실행되는 SQL 문)
+# 데이터: 사용자 1..3, 게시글 1..6 (사용자마다 2개)
+CASES = {
+    "create_user": (
+        # 이메일 중복 확인(캐시 미스) + INSERT ... RETURNING
+        "POST", "/users", {"json": {"name": "new", "email": "new@example.com", "password": PASSWORD}},
+        200, ["SELECT", "INSERT"],
+    ),
+    "update_user": (
+        # 이전 이메일 조회(캐시 무효화용) + UPDATE ... RETURNING
+        "PUT", "/users/1", {"json": {"name": "renamed", "email": "renamed@example.com", "password": PASSWORD}},
+        200, ["SELECT", "UPDATE"],
+    ),
+    "update_user_missing": (
+        # 사용자가 없으면 UPDATE 없이 404
+        "PUT", "/users/99", {"json": {"name": "renamed", "email": "renamed@example.com", "password": PASSWORD}},
+        404, ["SELECT"],
+    ),
+    "delete_user": (
+        # 함께 삭제되는 게시글 id 조회(캐시 무효화용) + DELETE (게시글은 ON DELETE CASCADE)
+        "DELETE", "/users/1", {},
+        200, ["SELECT", "DELETE"],
+    ),
+    "delete_user_missing": (
+        "DELETE", "/users/99", {},
+        404, ["SELECT", "DELETE"],
+    ),
+    "create_post": (
+        # 작성자 확인 없이 INSERT (없는 사용자는 외래키 위반으로 404)
+        "POST", "/post/1", {"json": {"title": "title", "description": "description"}},
+        200, ["INSERT"],
+    ),
+    "create_post_missing_user": (
+        "POST", "/post/99", {"json": {"title": "title", "description": "description"}},
+        404, ["INSERT"],
+    ),
+    "update_post": (
+        "PUT", "/post/1", {"json": {"title": "title", "description": "description"}},
+        200, ["UPDATE"],
+    ),
+    "update_post_missing": (
+        "PUT", "/post/99", {"json": {"title": "title", "description": "description"}},
+        404, ["UPDATE"],
+    ),
+    "delete_post": (
+        "DELETE", "/post/1", {},
+        200, ["DELETE"],
+    ),
+    "delete_post_missing": (
+        "DELETE", "/post/99", {},
+        404, ["DELETE"],
+    ),
+    "bulk_create_users": (
+        # 이미 가입된 이메일 조회 + INSERT ... RETURNING (email로 id 대응)
+        "POST", "/users/bulk",
+        {"json": [{"name": f"bulk{i}", "email": f"bulk{i}@example.com", "password": PASSWORD} for i in range(5)]},
+        200, ["SELECT", "INSERT"],
+    ),
+    "bulk_update_users": (
+        # 대상 사용자 조회 + 이메일 중복 조회 + CASE UPDATE
+        "PATCH", "/users/bulk", {"json": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 99, "name": "c"}]},
+        200, ["SELECT", "SELECT", "UPDATE"],
+    ),
+    "bulk_delete_users": (
+        # 게시글 id 조회 + 사용자 조회 + DELETE
+        "DELETE", "/users/bulk", {"json": {"ids": [1, 2, 99]}},
+        200, ["SELECT", "SELECT", "DELETE"],
+    ),
+    "bulk_create_posts": (
+        # 작성자 확인 + INSERT ... RETURNING
+        # SQLite에서는 입력 순서대로 id를 받기 위해 SQLAlchemy가 한 행씩 INSERT (MySQL은 INSERT 1회)
+        "POST", "/post/bulk",
+        {"json": [{"title": "t", "description": "d", "owner_id": owner_id} for owner_id in (1, 2, 3)]},
+        200, ["SELECT", "INSERT", "INSERT", "INSERT"],
+    ),
+    "bulk_update_posts": (
+        # 대상 게시글 조회 + CASE UPDATE + 검색 색인 갱신용 조회
+        "PATCH", "/post/bulk", {"json": [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]},
+        200, ["SELECT", "UPDATE", "SELECT"],
+    ),
+    "bulk_delete_posts": (
+        "DELETE", "/post/bulk", {"json": {"ids": [1, 2, 99]}},
+        200, ["SELECT", "DELETE"],
+    ),
+    "upload_file": (
+        # 이름 중복 확인 + blob 참조 upsert + 파일 INSERT
+        "POST", "/api/files/upload", {"files": {"file": ("a.txt", b"hello", "text/plain")}},
+        200, ["SELECT", "INSERT", "INSERT"],
+    ),
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+async def test_write_statement_count(client, seed, queries, name):
+    method, url, kwargs, status, expected = CASES[name]
+    await seed(users=3, posts_per_user=2)
+    queries.reset()
+
+    response = await client.request(method, url, **kwargs)
+
+    assert response.status_code == status, response.text
+    assert verbs(queries.statements) == expected, queries.statements
+
+
+async def test_delete_file_statement_count(client, seed, queries):
+    # 파일 조회(FOR UPDATE) + 메타데이터 DELETE + 참조 수 감소 + 참조 없는 blob DELETE
+    # commit 후: blob 잠금(DELETE) + 다시 업로드되지 않았는지 확인한 뒤 파일 삭제
+    response = await client.post("/api/files/upload", files={"file": ("a.txt", b"hello", "text/plain")})
+    assert response.status_code == 200, response.text
+    queries.reset()
+
+    response = await client.delete("/api/files/a.txt")
+
+    assert response.status_code == 200, response.text
+    assert verbs(queries.statements) == ["SELECT", "DELETE", "UPDATE", "DELETE", "DELETE", "SELECT"], queries.statements
+
+
+async def test_bulk_statement_count_is_per_chunk(client, seed, queries):
+    # 항목 수가 늘어도 청크 수만큼만 증가
+    await seed(users=1)
+    users = [{"name": f"bulk{i}", "email": f"bulk{i}@example.com", "password": PASSWORD} for i in range(50)]
+    queries.reset()
+
+    response = await client.post("/users/bulk", params={"chunk_size": 20}, json=users)
+
+    assert response.status_code == 200, response.text
+    assert response.json()["succeeded"] == 50
+    assert verbs(queries.statements) == ["SELECT", "INSERT"] * 3, queries.statements
+
+
+@pytest.mark.parametrize("url, item", [
+    ("/post/bulk", {"id": 1, "title": None}),
+    ("/users/bulk", {"id": 1, "name": None}),
+    ("/users/bulk", {"id": 1, "email": None}),
+])
+async def test_bulk_update_rejects_null_for_required_columns(client, seed, queries, url, item):
+    # NOT NULL 컬럼에 null을 넣는 UPDATE를 실행하지 않고 422
+    await seed(users=1, posts_per_user=1)
+    queries.reset()
+
+    response = await client.patch(url, json=[item])
+
+    assert response.status_code == 422, response.text
+    assert queries.count == 0, queries.statements
+
+
+async def test_bulk_update_post_description_can_be_cleared(client, seed):
+    await seed(users=1, posts_per_user=1)
+
+    response = await client.patch("/post/bulk", json=[{"id": 1, "description": None}])
+
+    assert response.status_code == 200, response.text
+    assert response.json()["results"][0]["status"] == 200
+    post = (await client.get("/post/1")).json()
+    assert post["title"] == "title 1-0" and post["description"] is None